@@ -14,77 +14,32 @@ The script generates 4 individual plots and 1 combined plot for comprehensive an
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 import re
-from collections import defaultdict
+
+from sca_aggregate import block_delay_aggregate, pooled_delay
+from sca_parser import header_duration, parse_sca_file, read_sca_header
+from sca_render import annotate_points, figure_job, render_figures
 
 # Configuration
 filename = "QuestionA/DataOfUser1-1759407075-default-.sca"
+SIMULATION_TIME_SEC = 20.0  # Used when the run does not record its own duration
 
-def parse_sca_file(filename):
-    """
-    Parse OMNeT++ scalar results file (.sca) and extract network performance data.
+# Figure rendering - headless by default, in RENDER_WORKERS parallel processes.
+# Set INTERACTIVE = True to show each figure in a window instead
+INTERACTIVE = False
+RENDER_WORKERS = 4
 
-    Returns:
-        dict: Dictionary containing parsed network metrics
-    """
-    data = defaultdict(dict)
-    
-    print(f"Parsing trace file: {filename}")
-    
-    try:
-        with open(filename, 'r') as file:
-            for line in file:
-                line = line.strip()
-                
-                # Parse scalar values
-                if line.startswith('scalar'):
-                    parts = line.split()
-                    if len(parts) >= 4:
-                        node = parts[1]
-                        metric = parts[2]
-                        value = parts[3]
-                        
-                        try:
-                            # Convert to appropriate numeric type
-                            if '.' in value or 'e' in value.lower():
-                                data[node][metric] = float(value)
-                            else:
-                                data[node][metric] = int(value)
-                        except ValueError:
-                            data[node][metric] = value
-                
-                # Parse statistic fields (for packet size statistics)
-                elif line.startswith('field'):
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        field_name = parts[1]
-                        field_value = parts[2]
-                        
-                        try:
-                            if '.' in field_value or 'e' in field_value.lower():
-                                data['statistics'][field_name] = float(field_value)
-                            else:
-                                data['statistics'][field_name] = int(field_value)
-                        except ValueError:
-                            data['statistics'][field_name] = field_value
-                            
-    except FileNotFoundError:
-        print(f"Error: File '{filename}' not found!")
-        return None
-    except Exception as e:
-        print(f"Error parsing file: {e}")
-        return None
-    
-    print("File parsed successfully!")
-    return dict(data)
+# Figure cache - figures whose plotted data and style are unchanged are copied from
+# here instead of being redrawn (None to always redraw)
+FIGURE_CACHE = ".figure-cache"
 
-def calculate_network_metrics(data):
+def calculate_network_metrics(data, simulation_time_sec=SIMULATION_TIME_SEC):
     """
     Calculate key network performance metrics from parsed data.
     
     Args:
         data (dict): Parsed network data from .sca file
+        simulation_time_sec (float): Simulated duration of the run
         
     Returns:
         dict: Dictionary containing calculated metrics
@@ -102,18 +57,18 @@ def calculate_network_metrics(data):
         # Packet size statistics
         avg_packet_size = data.get('statistics', {}).get('mean', 1000)  # bytes
         
-        # Delay statistics (in nanoseconds)
-        delay_average = data.get('.', {}).get('delay-average', 0)  # in nanoseconds
-        delay_max = data.get('.', {}).get('delay-max', 0)
-        delay_min = data.get('.', {}).get('delay-min', 0)
+        # Delay statistics (in nanoseconds) - mean pooled from delay-total / delay-count
+        delay_scalars = {name[len('delay-'):]: value for name, value in data.get('.', {}).items()
+                         if name.startswith('delay-')}
+        delay = pooled_delay(block_delay_aggregate(delay_scalars))
+        delay_average = delay['mean']  # in nanoseconds
+        delay_max = delay['max']
+        delay_min = delay['min']
         
         print(f"   Transmitted packets: {tx_packets}")
         print(f"   Received packets: {rx_packets}")
         print(f"   Average packet size: {avg_packet_size} bytes")
         
-        # Simulation parameters
-        simulation_time_sec = 20.0
-        
         # 1. Calculate Bit Rate (Kbps)
         # Bit rate = (Total bits transmitted) / (Total transmission time)
         total_bits_transmitted = tx_packets * avg_packet_size * 8  # Convert bytes to bits
@@ -166,94 +121,110 @@ def calculate_network_metrics(data):
         print(f"Error calculating metrics: {e}")
         return None
 
-def create_individual_plots(metrics):
+def plot_bit_rate_throughput(fig, metrics):
     """
-    Create 3 individual plots for the metrics.
+    Bit rate and average throughput on the same graph.
     
     Args:
+        fig (matplotlib.figure.Figure): Figure to draw on
         metrics (dict): Dictionary containing calculated network metrics
     """
-    print("\nCreating individual plots...")
-    
-    # Set plotting style
-    plt.rcParams['figure.figsize'] = (10, 6)
-    plt.rcParams['font.size'] = 12
-    
-    # 1. Bit Rate and Throughput on Same Graph
-    plt.figure(figsize=(10, 6))
+    ax = fig.add_subplot()
     categories = ['Bit Rate', 'Throughput']
     values = [metrics['bit_rate_kbps'], metrics['avg_throughput_kbps']]
     colors = ['#FF6B6B', '#4ECDC4']
     
-    bars = plt.bar(categories, values, color=colors, alpha=0.8, edgecolor='black', linewidth=2)
-    plt.title('Bit Rate vs Average Throughput', fontsize=16, fontweight='bold', pad=20)
-    plt.ylabel('Rate (Kbps)', fontsize=14, fontweight='bold')
-    plt.grid(True, alpha=0.3, linestyle='--')
+    ax.bar(categories, values, color=colors, alpha=0.8, edgecolor='black', linewidth=2)
+    ax.set_title('Bit Rate vs Average Throughput', fontsize=16, fontweight='bold', pad=20)
+    ax.set_ylabel('Rate (Kbps)', fontsize=14, fontweight='bold')
+    ax.grid(True, alpha=0.3, linestyle='--')
     
     # Add value labels on bars
-    for bar, value in zip(bars, values):
-        height = bar.get_height()
-        plt.text(bar.get_x() + bar.get_width()/2., height + max(values)*0.01,
-                f'{value:.2f} Kbps', ha='center', va='bottom', fontsize=14, fontweight='bold')
+    annotate_points(ax, np.arange(len(values)), np.add(values, max(values)*0.01), '{:.2f} Kbps',
+                    values=values, offset=(0, 0), va='bottom', fontsize=14, fontweight='bold')
     
     # Add efficiency indicator
     efficiency = (metrics['avg_throughput_kbps'] / metrics['bit_rate_kbps']) * 100 if metrics['bit_rate_kbps'] > 0 else 0
-    plt.text(0.5, max(values) * 0.8, f'Efficiency: {efficiency:.1f}%', 
-             ha='center', va='center', fontsize=12, 
-             bbox=dict(boxstyle="round,pad=0.3", facecolor="yellow", alpha=0.7))
+    ax.text(0.5, max(values) * 0.8, f'Efficiency: {efficiency:.1f}%', 
+            ha='center', va='center', fontsize=12, 
+            bbox=dict(boxstyle="round,pad=0.3", facecolor="yellow", alpha=0.7))
     
-    plt.tight_layout()
-    plt.savefig('QuestionA-Part1-BitRate-Throughput.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    fig.tight_layout()
+
+def plot_delay(fig, metrics):
+    """
+    Delay analysis (min, average, max).
     
-    # 2. Delay Analysis (Min, Average, Max)
-    plt.figure(figsize=(10, 6))
+    Args:
+        fig (matplotlib.figure.Figure): Figure to draw on
+        metrics (dict): Dictionary containing calculated network metrics
+    """
+    ax = fig.add_subplot()
     delay_categories = ['Min Delay', 'Average Delay', 'Max Delay']
     delay_values = [metrics['min_delay_seconds'], metrics['avg_delay_seconds'], metrics['max_delay_seconds']]
     delay_colors = ['#95E1A3', '#FFC107', '#FF5722']
     
-    bars = plt.bar(delay_categories, delay_values, color=delay_colors, alpha=0.8, edgecolor='black', linewidth=2)
-    plt.title('Network Delay Analysis (Min, Average, Max)', fontsize=16, fontweight='bold', pad=20)
-    plt.ylabel('Delay (seconds)', fontsize=14, fontweight='bold')
-    plt.grid(True, alpha=0.3, linestyle='--')
+    ax.bar(delay_categories, delay_values, color=delay_colors, alpha=0.8, edgecolor='black', linewidth=2)
+    ax.set_title('Network Delay Analysis (Min, Average, Max)', fontsize=16, fontweight='bold', pad=20)
+    ax.set_ylabel('Delay (seconds)', fontsize=14, fontweight='bold')
+    ax.grid(True, alpha=0.3, linestyle='--')
     
     # Add value labels on bars
-    for bar, value in zip(bars, delay_values):
-        height = bar.get_height()
-        plt.text(bar.get_x() + bar.get_width()/2., height + max(delay_values)*0.01,
-                f'{value:.6f} s', ha='center', va='bottom', fontsize=12, fontweight='bold')
-    
-    plt.tight_layout()
-    plt.savefig('QuestionA-Part1-Delay.png', dpi=300, bbox_inches='tight')
-    plt.show()
-    
-    # 3. Packet Loss Ratio Plot
-    plt.figure(figsize=(8, 6))
-    plt.bar(['Packet Loss Ratio'], [metrics['packet_loss_ratio']], color='#E74C3C', alpha=0.8, edgecolor='black', linewidth=2)
-    plt.title('Packet Loss Ratio (PLR)', fontsize=16, fontweight='bold', pad=20)
-    plt.ylabel('PLR (ratio)', fontsize=14, fontweight='bold')
-    plt.grid(True, alpha=0.3, linestyle='--')
+    annotate_points(ax, np.arange(len(delay_values)), np.add(delay_values, max(delay_values)*0.01), '{:.6f} s',
+                    values=delay_values, offset=(0, 0), va='bottom', fontsize=12, fontweight='bold')
+    
+    fig.tight_layout()
+
+def plot_plr(fig, metrics):
+    """
+    Packet loss ratio.
+    
+    Args:
+        fig (matplotlib.figure.Figure): Figure to draw on
+        metrics (dict): Dictionary containing calculated network metrics
+    """
+    ax = fig.add_subplot()
+    ax.bar(['Packet Loss Ratio'], [metrics['packet_loss_ratio']], color='#E74C3C', alpha=0.8, edgecolor='black', linewidth=2)
+    ax.set_title('Packet Loss Ratio (PLR)', fontsize=16, fontweight='bold', pad=20)
+    ax.set_ylabel('PLR (ratio)', fontsize=14, fontweight='bold')
+    ax.grid(True, alpha=0.3, linestyle='--')
     
     # Add value label
-    plt.text(0, metrics['packet_loss_ratio'] + max(metrics['packet_loss_ratio']*0.02, 0.001), 
-             f'{metrics["packet_loss_ratio"]:.6f}', 
-             ha='center', va='bottom', fontsize=14, fontweight='bold')
+    ax.text(0, metrics['packet_loss_ratio'] + max(metrics['packet_loss_ratio']*0.02, 0.001), 
+            f'{metrics["packet_loss_ratio"]:.6f}', 
+            ha='center', va='bottom', fontsize=14, fontweight='bold')
     
-    plt.tight_layout()
-    plt.savefig('QuestionA-Part1-PLR.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    fig.tight_layout()
 
-def create_combined_plot(metrics):
+def create_individual_plots(metrics):
     """
-    Create a combined plot showing all metrics together.
+    Describe 3 individual plots for the metrics.
     
     Args:
         metrics (dict): Dictionary containing calculated network metrics
+        
+    Returns:
+        list: Figure jobs for render_figures
     """
-    print("\nCreating combined plot...")
+    print("\nCreating individual plots...")
+    
+    style = {'font.size': 12}
+    return [
+        figure_job('QuestionA-Part1-BitRate-Throughput.png', plot_bit_rate_throughput, metrics, (10, 6), style),
+        figure_job('QuestionA-Part1-Delay.png', plot_delay, metrics, (10, 6), style),
+        figure_job('QuestionA-Part1-PLR.png', plot_plr, metrics, (8, 6), style),
+    ]
+
+def plot_combined(fig, metrics):
+    """
+    All metrics together in a 2x2 layout with a text summary.
     
-    # Create figure with 2x2 subplots
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+    Args:
+        fig (matplotlib.figure.Figure): Figure to draw on
+        metrics (dict): Dictionary containing calculated network metrics
+    """
+    # Create 2x2 subplots
+    ((ax1, ax2), (ax3, ax4)) = fig.subplots(2, 2)
     fig.suptitle('Network Performance Analysis - All Metrics', fontsize=18, fontweight='bold', y=0.95)
     
     # 1. Bit Rate vs Throughput (Top Left)
@@ -261,16 +232,14 @@ def create_combined_plot(metrics):
     values = [metrics['bit_rate_kbps'], metrics['avg_throughput_kbps']]
     colors = ['#FF6B6B', '#4ECDC4']
     
-    bars1 = ax1.bar(categories, values, color=colors, alpha=0.8, edgecolor='black', linewidth=2)
+    ax1.bar(categories, values, color=colors, alpha=0.8, edgecolor='black', linewidth=2)
     ax1.set_title('Bit Rate vs Throughput', fontsize=14, fontweight='bold', pad=15)
     ax1.set_ylabel('Rate (Kbps)', fontsize=12, fontweight='bold')
     ax1.grid(True, alpha=0.3, linestyle='--')
     
     # Add value labels
-    for bar, value in zip(bars1, values):
-        height = bar.get_height()
-        ax1.text(bar.get_x() + bar.get_width()/2., height + max(values)*0.01,
-                f'{value:.2f}', ha='center', va='bottom', fontsize=10, fontweight='bold')
+    annotate_points(ax1, np.arange(len(values)), np.add(values, max(values)*0.01), '{:.2f}',
+                    values=values, offset=(0, 0), va='bottom', fontsize=10, fontweight='bold')
     
     # Add efficiency indicator
     efficiency = (metrics['avg_throughput_kbps'] / metrics['bit_rate_kbps']) * 100 if metrics['bit_rate_kbps'] > 0 else 0
@@ -283,16 +252,14 @@ def create_combined_plot(metrics):
     delay_values = [metrics['min_delay_seconds'], metrics['avg_delay_seconds'], metrics['max_delay_seconds']]
     delay_colors = ['#95E1A3', '#FFC107', '#FF5722']
     
-    bars2 = ax2.bar(delay_categories, delay_values, color=delay_colors, alpha=0.8, edgecolor='black', linewidth=2)
+    ax2.bar(delay_categories, delay_values, color=delay_colors, alpha=0.8, edgecolor='black', linewidth=2)
     ax2.set_title('Network Delay Analysis', fontsize=14, fontweight='bold', pad=15)
     ax2.set_ylabel('Delay (seconds)', fontsize=12, fontweight='bold')
     ax2.grid(True, alpha=0.3, linestyle='--')
     
     # Add value labels
-    for bar, value in zip(bars2, delay_values):
-        height = bar.get_height()
-        ax2.text(bar.get_x() + bar.get_width()/2., height + max(delay_values)*0.01,
-                f'{value:.6f}', ha='center', va='bottom', fontsize=9, fontweight='bold')
+    annotate_points(ax2, np.arange(len(delay_values)), np.add(delay_values, max(delay_values)*0.01), '{:.6f}',
+                    values=delay_values, offset=(0, 0), va='bottom', fontsize=9, fontweight='bold')
     
     # 3. Packet Loss Ratio (Bottom Left)
     ax3.bar(['PLR'], [metrics['packet_loss_ratio']], color='#E74C3C', alpha=0.8, edgecolor='black', linewidth=2)
@@ -336,12 +303,22 @@ SIMULATION INFO:
              bbox=dict(boxstyle="round,pad=0.5", facecolor="lightblue", alpha=0.1))
     
     # Adjust layout
-    plt.tight_layout()
-    plt.subplots_adjust(top=0.92)
+    fig.tight_layout()
+    fig.subplots_adjust(top=0.92)
+
+def create_combined_plot(metrics):
+    """
+    Describe a combined plot showing all metrics together.
     
-    # Save and show the combined plot
-    plt.savefig('QuestionA-Part1-CombinedMetrics.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    Args:
+        metrics (dict): Dictionary containing calculated network metrics
+        
+    Returns:
+        list: Figure jobs for render_figures
+    """
+    print("\nCreating combined plot...")
+    
+    return [figure_job('QuestionA-Part1-CombinedMetrics.png', plot_combined, metrics, (16, 12), {'font.size': 12})]
 
 def main():
     """
@@ -356,17 +333,17 @@ def main():
         print("Failed to parse trace file. Exiting...")
         return
     
-    # Step 2: Calculate network metrics
-    metrics = calculate_network_metrics(parsed_data)
+    # Step 2: Calculate network metrics over the run's recorded duration (or the default)
+    simulation_time_sec = header_duration(read_sca_header(filename)) or SIMULATION_TIME_SEC
+    metrics = calculate_network_metrics(parsed_data, simulation_time_sec)
     if metrics is None:
         print("Failed to calculate metrics. Exiting...")
         return
     
-    # Step 3: Create individual plots for each metric group
-    create_individual_plots(metrics)
-    
-    # Step 4: Create combined plot with all metrics
-    create_combined_plot(metrics)
+    # Step 3: Render individual plots for each metric group and the combined plot with all metrics
+    render_figures(create_individual_plots(metrics) + create_combined_plot(metrics),
+                   workers=RENDER_WORKERS, interactive=INTERACTIVE,
+                   cache=FIGURE_CACHE)
     
     print("\nAnalysis completed! Generated files:")
     print("- QuestionA-Part1-BitRate-Throughput.png")
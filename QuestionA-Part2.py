@@ -14,167 +14,118 @@ Metrics calculated:
 The script also generates visualizations for better understanding of network performance.
 """
 
+import os
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 import re
-from collections import defaultdict
 
-# Configuration - Dictionary of files to process
-files_dictionary = {
-    "1Mbps": "QuestionA/DataOfUser1-1759410141-1000kbps-.sca",
-    "5Mbps": "QuestionA/DataOfUser1-1759410152-5000kbps-.sca",
-    "10Mbps": "QuestionA/DataOfUser1-1759410158-10000kbps-.sca",
-    "15Mbps": "QuestionA/DataOfUser1-1759410167-15000kbps-.sca",
-    "20Mbps": "QuestionA/DataOfUser1-1759410177-20000kbps-.sca"
-}
+from sca_discovery import discover_scenarios, scenario_durations
+from sca_output import read_results, stream_rows, write_results
+from sca_render import annotate_points, figure_job, render_figures
+from sca_store import iter_run_metrics
+
+# Configuration - Directory of files to process
+# Bit rates come from the file names (e.g. "DataOfUser1-*-1000kbps-.sca")
+ANALYSIS_DIRECTORY = "QuestionA"
 
 # Simulation parameters
-SIMULATION_TIME_SEC = 20.0  # Runtime is 20 seconds
+SIMULATION_TIME_SEC = 20.0  # Default runtime of 20 seconds
 
-def parse_sca_file(filename):
-    """
-    Parse OMNeT++ scalar results file (.sca) and extract network performance data.
-    
-    Args:
-        filename (str): Path to the .sca file
-        
-    Returns:
-        dict: Dictionary containing parsed network metrics
-    """
-    data = defaultdict(dict)
-    
-    print(f"Parsing trace file: {filename}")
-    
-    try:
-        with open(filename, 'r') as file:
-            for line in file:
-                line = line.strip()
-                
-                # Parse scalar values
-                if line.startswith('scalar'):
-                    parts = line.split()
-                    if len(parts) >= 4:
-                        node = parts[1]
-                        metric = parts[2]
-                        value = parts[3]
-                        
-                        try:
-                            # Convert to appropriate numeric type
-                            if '.' in value or 'e' in value.lower():
-                                data[node][metric] = float(value)
-                            else:
-                                data[node][metric] = int(value)
-                        except ValueError:
-                            data[node][metric] = value
-                
-                # Parse statistic fields (for packet size statistics)
-                elif line.startswith('field'):
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        field_name = parts[1]
-                        field_value = parts[2]
-                        
-                        try:
-                            if '.' in field_value or 'e' in field_value.lower():
-                                data['statistics'][field_name] = float(field_value)
-                            else:
-                                data['statistics'][field_name] = int(field_value)
-                        except ValueError:
-                            data['statistics'][field_name] = field_value
-                            
-    except FileNotFoundError:
-        print(f"Error: File '{filename}' not found!")
-        return None
-    except Exception as e:
-        print(f"Error parsing file: {e}")
-        return None
-    
-    print("File parsed successfully!")
-    return dict(data)
+# Per-scenario duration overrides, as (scenario filter, seconds) pairs - e.g.
+# [({'bitrate_kbps': 50000}, 60.0)]. Runs without an override use the duration recorded in the
+# .sca file, or the default above if the file records none
+DURATION_OVERRIDES = []
+
+# Number of parallel parse processes (1 = parse serially)
+PARSE_WORKERS = 1
+
+# Parse cache sidecar - unchanged .sca files are not re-parsed (None to disable)
+PARSE_CACHE = ".sca-parse-cache.sqlite"
 
-def calculate_metrics_for_file(data, bit_rate_label):
+# Per-run metrics are written here as soon as each run is processed (None to disable)
+RESULTS_STREAM = "QuestionA-Part2-runs.csv"
+
+# Summary table - a '.parquet' name writes Parquet instead of CSV (requires pyarrow),
+# keeping column types and storing the scenario labels dictionary-encoded
+RESULTS_FILE = "QuestionA-Part2.csv"
+
+# Plot straight from an existing RESULTS_FILE instead of re-processing the .sca files
+PLOT_FROM_RESULTS = False
+
+# Figure rendering - headless by default, in RENDER_WORKERS parallel processes.
+# Set INTERACTIVE = True to show each figure in a window instead
+INTERACTIVE = False
+RENDER_WORKERS = 4
+
+# Figure cache - figures whose plotted data and style are unchanged are copied from
+# here instead of being redrawn (None to always redraw)
+FIGURE_CACHE = ".figure-cache"
+
+# Color scheme
+COLORS = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd']
+
+def bit_rate_label(bitrate_kbps):
     """
-    Calculate network performance metrics for a single file.
+    Label of a configured bit rate in Mbps, e.g. "5Mbps" or "1.5Mbps".
     
     Args:
-        data (dict): Parsed network data from .sca file
-        bit_rate_label (str): Label for the bit rate (e.g., "1Mbps")
+        bitrate_kbps (int): Configured bit rate in Kbps
         
     Returns:
-        dict: Dictionary containing calculated metrics
+        str: Label that is unique for every bit rate
     """
-    if data is None:
-        return None
-        
-    try:
-        # Extract key values from the parsed data
-        tx_packets = data.get('node[0]', {}).get('sender-tx-packets', 0)
-        rx_packets = data.get('node[1]', {}).get('receiver-rx-packets', 0)
-        
-        # Packet size statistics
-        avg_packet_size = data.get('statistics', {}).get('mean', 1000)  # bytes
-        
-        # Delay statistics (in nanoseconds)
-        delay_average = data.get('.', {}).get('delay-average', 0)
-        
-        # Calculate Average Throughput (Kbps)
-        # Throughput = (Successfully received bits) / (Total time)
-        total_bits_received = rx_packets * avg_packet_size * 8  # Convert bytes to bits
-        avg_throughput_kbps = (total_bits_received / SIMULATION_TIME_SEC) / 1000
-        
-        # Calculate Average Delay (ms)
-        # Convert from nanoseconds to milliseconds
-        avg_delay_ms = delay_average / 1000000 if delay_average > 0 else 0
-        
-        # Calculate Packet Loss Ratio (PLR)
-        if tx_packets > 0:
-            packet_loss_ratio = (tx_packets - rx_packets) / tx_packets
-        else:
-            packet_loss_ratio = 0
-        
-        return {
-            'bit_rate_label': bit_rate_label,
-            'avg_throughput_kbps': avg_throughput_kbps,
-            'avg_delay_ms': avg_delay_ms,
-            'packet_loss_ratio': packet_loss_ratio,
-            'tx_packets': tx_packets,
-            'rx_packets': rx_packets,
-            'avg_packet_size_bytes': avg_packet_size
-        }
-        
-    except Exception as e:
-        print(f"Error calculating metrics for {bit_rate_label}: {e}")
-        return None
+    if bitrate_kbps % 1000 == 0:
+        return f"{bitrate_kbps // 1000}Mbps"
+    return f"{bitrate_kbps / 1000}Mbps"
 
 def process_all_files():
     """
-    Process all files in the dictionary and calculate metrics for each.
+    Stream the metrics of every file in the analysis directory, writing each run's row
+    to RESULTS_STREAM as soon as it is ready.
     
     Returns:
-        list: List of dictionaries containing metrics for each file
+        pandas.DataFrame: One row of metrics per successfully parsed file
     """
     print("Starting analysis")
     print("=" * 60)
     
-    results = []
+    # Discover the bit rate files (the default-parameter run has no bit rate)
+    table = discover_scenarios(ANALYSIS_DIRECTORY)
+    table = table[table['bitrate_kbps'].notna()]
+    files = {bit_rate_label(row.bitrate_kbps): row.path for row in table.itertuples()}
     
-    for bit_rate_label, filename in files_dictionary.items():
-        print(f"\nProcessing {bit_rate_label} scenario...")
-        
-        # Parse the file
-        parsed_data = parse_sca_file(filename)
-        
-        # Calculate metrics
-        metrics = calculate_metrics_for_file(parsed_data, bit_rate_label)
+    # Stream the metrics of every file as it is parsed
+    label_by_file = {filename: label for label, filename in files.items()}
+    metrics = stream_rows(iter_run_metrics(files.values(), SIMULATION_TIME_SEC, verbose=True,
+                                           workers=PARSE_WORKERS, cache=PARSE_CACHE,
+                                           durations=scenario_durations(table, DURATION_OVERRIDES)),
+                          RESULTS_STREAM)
+    
+    results = []
+    processed = set()
+    for row in metrics:
+        processed.add(row['file'])
+        results.append({
+            'bit_rate_label': label_by_file[row['file']],
+            'avg_throughput_kbps': row['avg_throughput_kbps'],
+            'avg_delay_ms': row['avg_delay_ms'],
+            'packet_loss_ratio': row['packet_loss_ratio'],
+            'tx_packets': row['tx_packets'],
+            'rx_packets': row['rx_packets'],
+            'avg_packet_size_bytes': row['avg_packet_size_bytes'],
+            'simulation_time_sec': row['simulation_time_sec']
+        })
         
-        if metrics:
-            results.append(metrics)
-            print(f"Throughput: {metrics['avg_throughput_kbps']:.2f} Kbps")
-            print(f"Delay: {metrics['avg_delay_ms']:.2f} ms")
-            print(f"PLR: {metrics['packet_loss_ratio']:.4f}")
-        else:
-            print(f"Failed to process {bit_rate_label}")
+        print(f"\n{results[-1]['bit_rate_label']} scenario:")
+        print(f"Throughput: {row['avg_throughput_kbps']:.2f} Kbps")
+        print(f"Delay: {row['avg_delay_ms']:.2f} ms")
+        print(f"PLR: {row['packet_loss_ratio']:.4f}")
+    
+    for label, filename in files.items():
+        if filename not in processed:
+            print(f"Failed to process {label}")
+    
+    results = pd.DataFrame(results)
     
     return results
 
@@ -183,7 +134,7 @@ def create_summary_dataframe(results):
     Create a pandas DataFrame with summary statistics.
     
     Args:
-        results (list): List of metric dictionaries
+        results (pandas.DataFrame): Metrics for each file
         
     Returns:
         pandas.DataFrame: DataFrame containing all metrics
@@ -193,8 +144,8 @@ def create_summary_dataframe(results):
     # Add percentage PLR column
     df['packet_loss_percentage'] = df['packet_loss_ratio'] * 100
     
-    # Extract numeric bit rate values for sorting
-    df['bit_rate_numeric'] = df['bit_rate_label'].str.extract(r'(\d+)').astype(int)
+    # Extract numeric bit rate values (Mbps) for sorting - whole numbers stay integers
+    df['bit_rate_numeric'] = pd.to_numeric(df['bit_rate_label'].str.extract(r'(\d+(?:\.\d+)?)')[0])
     df = df.sort_values('bit_rate_numeric')
     
     return df
@@ -209,7 +160,7 @@ def print_text_summary(df):
     print("\n" + "=" * 80)
     print("NETWORK PERFORMANCE ANALYSIS SUMMARY")
     print("=" * 80)
-    print(f"Simulation Duration: {SIMULATION_TIME_SEC} seconds")
+    print(f"Simulation Duration: {', '.join(f'{d:g}' for d in sorted(df['simulation_time_sec'].unique()))} seconds")
     print(f"Number of Scenarios Analyzed: {len(df)}")
     
     print("\nDETAILED RESULTS BY BIT RATE:")
@@ -238,90 +189,87 @@ def print_text_summary(df):
     print(f"Minimum PLR: {df['packet_loss_percentage'].min():.3f}%")
     print(f"PLR Std Dev: {df['packet_loss_percentage'].std():.3f}%")
 
-def create_individual_plots(df):
+def plot_throughput(fig, df):
     """
-    Create individual plots for each metric.
+    Actual vs ideal throughput against the configured bit rate.
     
     Args:
+        fig (matplotlib.figure.Figure): Figure to draw on
         df (pandas.DataFrame): DataFrame containing metrics
     """
-    print("\nCreating individual plots...")
-    
-    # Set up the plotting style
-    plt.rcParams['figure.figsize'] = (10, 6)
-    plt.rcParams['font.size'] = 12
-    
-    # Color scheme
-    colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd']
-    
-    # 1. Individual Throughput Plot
-    plt.figure(figsize=(10, 6))
-    plt.plot(df['bit_rate_numeric'], df['avg_throughput_kbps'], 'o-', 
-             color=colors[0], linewidth=3, markersize=10, label='Actual Throughput')
+    ax = fig.add_subplot()
+    ax.plot(df['bit_rate_numeric'], df['avg_throughput_kbps'], 'o-', 
+            color=COLORS[0], linewidth=3, markersize=10, label='Actual Throughput')
     
     # Add ideal throughput line (configured bit rate converted to Kbps)
     ideal_throughput_kbps = df['bit_rate_numeric'] * 1000  # Convert Mbps to Kbps
-    plt.plot(df['bit_rate_numeric'], ideal_throughput_kbps, '--', 
-             color='red', linewidth=3, label='Ideal Throughput', alpha=0.8)
+    ax.plot(df['bit_rate_numeric'], ideal_throughput_kbps, '--', 
+            color='red', linewidth=3, label='Ideal Throughput', alpha=0.8)
 
-    plt.xlabel('Configured Bit Rate (Mbps)', fontweight='bold', fontsize=14)
-    plt.ylabel('Throughput (Kbps)', fontweight='bold', fontsize=14)
-    plt.title('Actual vs Ideal Throughput vs Configured Bit Rate', fontweight='bold', fontsize=16, pad=20)
-    plt.grid(True, alpha=0.3)
-    plt.legend(fontsize=12)
+    ax.set_xlabel('Configured Bit Rate (Mbps)', fontweight='bold', fontsize=14)
+    ax.set_ylabel('Throughput (Kbps)', fontweight='bold', fontsize=14)
+    ax.set_title('Actual vs Ideal Throughput vs Configured Bit Rate', fontweight='bold', fontsize=16, pad=20)
+    ax.grid(True, alpha=0.3)
+    ax.legend(fontsize=12)
     
     # Add value labels for actual throughput
-    for i, row in df.iterrows():
-        plt.annotate(f'{row["avg_throughput_kbps"]:.1f}', 
-                    (row['bit_rate_numeric'], row['avg_throughput_kbps']),
-                    textcoords="offset points", xytext=(0,15), ha='center', fontsize=10)
-    
-    plt.tight_layout()
-    plt.savefig('QuestionA-Part2-Throughput.png', dpi=300, bbox_inches='tight')
-    plt.show()
-    
-    # 2. Individual Delay Plot
-    plt.figure(figsize=(10, 6))
-    plt.plot(df['bit_rate_numeric'], df['avg_delay_ms'], 's-', 
-             color=colors[1], linewidth=3, markersize=10, label='Average Delay')
-    plt.xlabel('Configured Bit Rate (Mbps)', fontweight='bold', fontsize=14)
-    plt.ylabel('Average Delay (ms)', fontweight='bold', fontsize=14)
-    plt.title('Average Delay vs Configured Bit Rate', fontweight='bold', fontsize=16, pad=20)
-    plt.grid(True, alpha=0.3)
-    plt.legend(fontsize=12)
+    annotate_points(ax, df['bit_rate_numeric'], df['avg_throughput_kbps'], '{:.1f}')
+    
+    fig.tight_layout()
+
+def plot_delay(fig, df):
+    """
+    Average delay against the configured bit rate.
+    
+    Args:
+        fig (matplotlib.figure.Figure): Figure to draw on
+        df (pandas.DataFrame): DataFrame containing metrics
+    """
+    ax = fig.add_subplot()
+    ax.plot(df['bit_rate_numeric'], df['avg_delay_ms'], 's-', 
+            color=COLORS[1], linewidth=3, markersize=10, label='Average Delay')
+    ax.set_xlabel('Configured Bit Rate (Mbps)', fontweight='bold', fontsize=14)
+    ax.set_ylabel('Average Delay (ms)', fontweight='bold', fontsize=14)
+    ax.set_title('Average Delay vs Configured Bit Rate', fontweight='bold', fontsize=16, pad=20)
+    ax.grid(True, alpha=0.3)
+    ax.legend(fontsize=12)
     
     # Add value labels
-    for i, row in df.iterrows():
-        plt.annotate(f'{row["avg_delay_ms"]:.2f}', 
-                    (row['bit_rate_numeric'], row['avg_delay_ms']),
-                    textcoords="offset points", xytext=(0,15), ha='center', fontsize=10)
-    
-    plt.tight_layout()
-    plt.savefig('QuestionA-Part2-Delay.png', dpi=300, bbox_inches='tight')
-    plt.show()
-    
-    # 3. Individual PLR Plot
-    plt.figure(figsize=(10, 6))
-    plt.plot(df['bit_rate_numeric'], df['packet_loss_percentage'], '^-', 
-             color=colors[2], linewidth=3, markersize=10, label='Packet Loss Ratio')
-    plt.xlabel('Configured Bit Rate (Mbps)', fontweight='bold', fontsize=14)
-    plt.ylabel('Packet Loss Ratio (%)', fontweight='bold', fontsize=14)
-    plt.title('Packet Loss Ratio vs Configured Bit Rate', fontweight='bold', fontsize=16, pad=20)
-    plt.grid(True, alpha=0.3)
-    plt.legend(fontsize=12)
+    annotate_points(ax, df['bit_rate_numeric'], df['avg_delay_ms'], '{:.2f}')
+    
+    fig.tight_layout()
+
+def plot_plr(fig, df):
+    """
+    Packet loss ratio against the configured bit rate.
+    
+    Args:
+        fig (matplotlib.figure.Figure): Figure to draw on
+        df (pandas.DataFrame): DataFrame containing metrics
+    """
+    ax = fig.add_subplot()
+    ax.plot(df['bit_rate_numeric'], df['packet_loss_percentage'], '^-', 
+            color=COLORS[2], linewidth=3, markersize=10, label='Packet Loss Ratio')
+    ax.set_xlabel('Configured Bit Rate (Mbps)', fontweight='bold', fontsize=14)
+    ax.set_ylabel('Packet Loss Ratio (%)', fontweight='bold', fontsize=14)
+    ax.set_title('Packet Loss Ratio vs Configured Bit Rate', fontweight='bold', fontsize=16, pad=20)
+    ax.grid(True, alpha=0.3)
+    ax.legend(fontsize=12)
     
     # Add value labels
-    for i, row in df.iterrows():
-        plt.annotate(f'{row["packet_loss_percentage"]:.3f}%', 
-                    (row['bit_rate_numeric'], row['packet_loss_percentage']),
-                    textcoords="offset points", xytext=(0,15), ha='center', fontsize=10)
+    annotate_points(ax, df['bit_rate_numeric'], df['packet_loss_percentage'], '{:.3f}%')
     
-    plt.tight_layout()
-    plt.savefig('QuestionA-Part2-PLR.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    fig.tight_layout()
+
+def plot_performance(fig, df):
+    """
+    Normalised throughput, delay and PLR scores for each bit rate.
     
-    # 4. Individual Performance Comparison Plot
-    plt.figure(figsize=(12, 6))
+    Args:
+        fig (matplotlib.figure.Figure): Figure to draw on
+        df (pandas.DataFrame): DataFrame containing metrics
+    """
+    ax = fig.add_subplot()
     
     # normalise metrics for comparison (0-100 scale)
     normalised_throughput = (df['avg_throughput_kbps'] / df['avg_throughput_kbps'].max()) * 100
@@ -331,53 +279,62 @@ def create_individual_plots(df):
     x_pos = np.arange(len(df))
     width = 0.25
     
-    bars1 = plt.bar(x_pos - width, normalised_throughput, width, label='Throughput Performance', 
-            color=colors[0], alpha=0.8)
-    bars2 = plt.bar(x_pos, normalised_delay_inv, width, label='Delay Performance (inverted)', 
-            color=colors[1], alpha=0.8)
-    bars3 = plt.bar(x_pos + width, normalised_plr_inv, width, label='PLR Performance (inverted)', 
-            color=colors[2], alpha=0.8)
-    
-    plt.xlabel('Bit Rate Configuration', fontweight='bold', fontsize=14)
-    plt.ylabel('Normalised Performance Score (0-100)', fontweight='bold', fontsize=14)
-    plt.title('Overall Performance Comparison Across Bit Rates', fontweight='bold', fontsize=16, pad=20)
-    plt.xticks(x_pos, df['bit_rate_label'])
-    plt.legend(fontsize=12)
-    plt.grid(True, alpha=0.3)
+    ax.bar(x_pos - width, normalised_throughput, width, label='Throughput Performance', 
+           color=COLORS[0], alpha=0.8)
+    ax.bar(x_pos, normalised_delay_inv, width, label='Delay Performance (inverted)', 
+           color=COLORS[1], alpha=0.8)
+    ax.bar(x_pos + width, normalised_plr_inv, width, label='PLR Performance (inverted)', 
+           color=COLORS[2], alpha=0.8)
+    
+    ax.set_xlabel('Bit Rate Configuration', fontweight='bold', fontsize=14)
+    ax.set_ylabel('Normalised Performance Score (0-100)', fontweight='bold', fontsize=14)
+    ax.set_title('Overall Performance Comparison Across Bit Rates', fontweight='bold', fontsize=16, pad=20)
+    ax.set_xticks(x_pos)
+    ax.set_xticklabels(df['bit_rate_label'])
+    ax.legend(fontsize=12)
+    ax.grid(True, alpha=0.3)
     
     # Add value labels on bars
-    for bars in [bars1, bars2, bars3]:
-        for bar in bars:
-            height = bar.get_height()
-            plt.annotate(f'{height:.1f}',
-                        xy=(bar.get_x() + bar.get_width() / 2, height),
-                        xytext=(0, 3), textcoords="offset points",
-                        ha='center', va='bottom', fontsize=9)
-    
-    plt.tight_layout()
-    plt.savefig('QuestionA-Part2-Performance.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    for x, heights in ((x_pos - width, normalised_throughput), (x_pos, normalised_delay_inv),
+                       (x_pos + width, normalised_plr_inv)):
+        annotate_points(ax, x, heights, '{:.1f}', offset=(0, 3), va='bottom', fontsize=9)
+    
+    fig.tight_layout()
 
-def create_combined_visualization(df):
+def create_individual_plots(df):
     """
-    Create the combined subplot visualization.
+    Describe the individual plots for each metric.
     
     Args:
         df (pandas.DataFrame): DataFrame containing metrics
+        
+    Returns:
+        list: Figure jobs for render_figures
     """
-    print("\nCreating combined visualization...")
+    print("\nCreating individual plots...")
     
-    # Set up the plotting style
-    plt.style.use('default')
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
-    fig.suptitle('Network Performance Analysis Across Multiple Bit Rates', fontsize=16, fontweight='bold')
+    style = {'font.size': 12}
+    return [
+        figure_job('QuestionA-Part2-Throughput.png', plot_throughput, df, (10, 6), style),
+        figure_job('QuestionA-Part2-Delay.png', plot_delay, df, (10, 6), style),
+        figure_job('QuestionA-Part2-PLR.png', plot_plr, df, (10, 6), style),
+        figure_job('QuestionA-Part2-Performance.png', plot_performance, df, (12, 6), style),
+    ]
+
+def plot_combined(fig, df):
+    """
+    Combined 2x2 overview of throughput, delay, PLR and overall performance.
     
-    # Color scheme
-    colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd']
+    Args:
+        fig (matplotlib.figure.Figure): Figure to draw on
+        df (pandas.DataFrame): DataFrame containing metrics
+    """
+    ((ax1, ax2), (ax3, ax4)) = fig.subplots(2, 2)
+    fig.suptitle('Network Performance Analysis Across Multiple Bit Rates', fontsize=16, fontweight='bold')
     
     # 1. Throughput vs Bit Rate (Top Left)
     ax1.plot(df['bit_rate_numeric'], df['avg_throughput_kbps'], 'o-', 
-             color=colors[0], linewidth=2, markersize=8, label='Actual Throughput')
+             color=COLORS[0], linewidth=2, markersize=8, label='Actual Throughput')
     
     # Add Ideal throughput line (configured bit rate converted to Kbps)
     Ideal_throughput_kbps = df['bit_rate_numeric'] * 1000  # Convert Mbps to Kbps
@@ -391,14 +348,11 @@ def create_combined_visualization(df):
     ax1.legend()
     
     # Add value labels for actual throughput
-    for i, row in df.iterrows():
-        ax1.annotate(f'{row["avg_throughput_kbps"]:.1f}', 
-                    (row['bit_rate_numeric'], row['avg_throughput_kbps']),
-                    textcoords="offset points", xytext=(0,10), ha='center', fontsize=9)
+    annotate_points(ax1, df['bit_rate_numeric'], df['avg_throughput_kbps'], '{:.1f}', offset=(0, 10), fontsize=9)
     
     # 2. Average Delay vs Bit Rate (Top Right)
     ax2.plot(df['bit_rate_numeric'], df['avg_delay_ms'], 's-', 
-             color=colors[1], linewidth=2, markersize=8, label='Average Delay')
+             color=COLORS[1], linewidth=2, markersize=8, label='Average Delay')
     ax2.set_xlabel('Configured Bit Rate (Mbps)', fontweight='bold')
     ax2.set_ylabel('Average Delay (ms)', fontweight='bold')
     ax2.set_title('Average Delay vs Bit Rate', fontweight='bold', pad=20)
@@ -406,14 +360,11 @@ def create_combined_visualization(df):
     ax2.legend()
     
     # Add value labels
-    for i, row in df.iterrows():
-        ax2.annotate(f'{row["avg_delay_ms"]:.2f}', 
-                    (row['bit_rate_numeric'], row['avg_delay_ms']),
-                    textcoords="offset points", xytext=(0,10), ha='center', fontsize=9)
+    annotate_points(ax2, df['bit_rate_numeric'], df['avg_delay_ms'], '{:.2f}', offset=(0, 10), fontsize=9)
     
     # 3. Packet Loss Ratio vs Bit Rate (Bottom Left)
     ax3.plot(df['bit_rate_numeric'], df['packet_loss_percentage'], '^-', 
-             color=colors[2], linewidth=2, markersize=8, label='Packet Loss Ratio')
+             color=COLORS[2], linewidth=2, markersize=8, label='Packet Loss Ratio')
     ax3.set_xlabel('Configured Bit Rate (Mbps)', fontweight='bold')
     ax3.set_ylabel('Packet Loss Ratio (%)', fontweight='bold')
     ax3.set_title('Packet Loss Ratio vs Bit Rate', fontweight='bold', pad=20)
@@ -421,10 +372,7 @@ def create_combined_visualization(df):
     ax3.legend()
     
     # Add value labels
-    for i, row in df.iterrows():
-        ax3.annotate(f'{row["packet_loss_percentage"]:.3f}%', 
-                    (row['bit_rate_numeric'], row['packet_loss_percentage']),
-                    textcoords="offset points", xytext=(0,10), ha='center', fontsize=9)
+    annotate_points(ax3, df['bit_rate_numeric'], df['packet_loss_percentage'], '{:.3f}%', offset=(0, 10), fontsize=9)
     
     # 4. Combined Performance Overview (Bottom Right)
     # normalise metrics for comparison (0-100 scale)
@@ -436,11 +384,11 @@ def create_combined_visualization(df):
     width = 0.25
     
     ax4.bar(x_pos - width, normalised_throughput, width, label='Throughput', 
-            color=colors[0], alpha=0.8)
+            color=COLORS[0], alpha=0.8)
     ax4.bar(x_pos, normalised_delay_inv, width, label='Delay Performance', 
-            color=colors[1], alpha=0.8)
+            color=COLORS[1], alpha=0.8)
     ax4.bar(x_pos + width, normalised_plr_inv, width, label='PLR Performance', 
-            color=colors[2], alpha=0.8)
+            color=COLORS[2], alpha=0.8)
     
     ax4.set_xlabel('Bit Rate Configuration', fontweight='bold')
     ax4.set_ylabel('Normalised Performance (0-100)', fontweight='bold')
@@ -451,39 +399,60 @@ def create_combined_visualization(df):
     ax4.grid(True, alpha=0.3)
     
     # Adjust layout
-    plt.tight_layout()
+    fig.tight_layout()
+
+def create_combined_visualization(df):
+    """
+    Describe the combined subplot visualization.
     
-    # Save the figure
-    plt.savefig('QuestionA-Part2-Combined.png', dpi=300, bbox_inches='tight')
+    Args:
+        df (pandas.DataFrame): DataFrame containing metrics
+        
+    Returns:
+        list: Figure jobs for render_figures
+    """
+    print("\nCreating combined visualization...")
     
-    # Show the plot
-    plt.show()
+    return [figure_job('QuestionA-Part2-Combined.png', plot_combined, df, (16, 12))]
+
+def load_saved_results():
+    """
+    Load the results table of a previous run when plotting from saved results.
+    
+    Returns:
+        pandas.DataFrame: Contents of RESULTS_FILE, or None if the .sca files are to be processed
+    """
+    if not PLOT_FROM_RESULTS or not os.path.exists(RESULTS_FILE):
+        return None
+    print(f"Plotting from saved results in {RESULTS_FILE}")
+    return read_results(RESULTS_FILE)
 
 def main():
     """
     Main function to orchestrate the multi-file network performance analysis.
     """
-    # Process all files
-    results = process_all_files()
-    
-    if not results:
-        print("No valid results obtained. Exiting...")
-        return
-    
-    # Create summary DataFrame
-    df = create_summary_dataframe(results)
+    df = load_saved_results()
+    if df is None:
+        # Process all files
+        results = process_all_files()
+        
+        if results.empty:
+            print("No valid results obtained. Exiting...")
+            return
+        
+        # Create summary DataFrame
+        df = create_summary_dataframe(results)
     
     # Print text summary
     print_text_summary(df)
     
-    # Create individual plots
-    create_individual_plots(df)
-    
-    # Create combined visualization
-    create_combined_visualization(df)
+    # Render the individual plots and the combined visualization
+    render_figures(create_individual_plots(df) + create_combined_visualization(df),
+                   workers=RENDER_WORKERS, interactive=INTERACTIVE,
+                   cache=FIGURE_CACHE)
     
-    # Save results to CSV
-    df.to_csv('QuestionA-Part2.csv', index=False)
+    # Save the results table
+    write_results(df, RESULTS_FILE)
     
     print("\nAnalysis complete!")
     print("\nGenerated files:")
@@ -492,7 +461,7 @@ def main():
     print("- QuestionA-Part2-PLR.png")
     print("- QuestionA-Part2-Performance.png")
     print("- QuestionA-Part2-Combined.png")
-    print("- QuestionA-Part2.csv")
+    print(f"- {RESULTS_FILE}")
 
 # Execute the analysis
 if __name__ == "__main__":
@@ -16,208 +16,148 @@ The script also generates individual plot visualisations for each metric vs dist
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 import re
-from collections import defaultdict
-
-# Configuration - Dictionary of files to process
-original_files_dictionary = { # original bit rate of 160kbps
-    "0m": "QuestionB-Original-Sim/DataOfUser1-1759412866-0m-.sca",
-    "10m": "QuestionB-Original-Sim/DataOfUser1-1759413106-10m-.sca",
-    "20m": "QuestionB-Original-Sim/DataOfUser1-1759413111-20m-.sca",
-    "30m": "QuestionB-Original-Sim/DataOfUser1-1759413115-30m-.sca",
-    "40m": "QuestionB-Original-Sim/DataOfUser1-1759413119-40m-.sca",
-    "50m": "QuestionB-Original-Sim/DataOfUser1-1759407075-default-.sca",
-    #"60m": "QuestionB-Original-Sim/DataOfUser1-1759414176-60m-.sca" # File before tx power change
-    "60m": "QuestionB-Original-Sim/DataOfUser1-1759415401-60m-.sca",
-    "70m": "QuestionB-Original-Sim/DataOfUser1-1759415506-70m-.sca",
-    "80m": "QuestionB-Original-Sim/DataOfUser1-1759415511-80m-.sca",
-    "90m": "QuestionB-Original-Sim/DataOfUser1-1759415513-90m-.sca",
-    "100m": "QuestionB-Original-Sim/DataOfUser1-1759415516-100m-.sca",
-    "110m": "QuestionB-Original-Sim/DataOfUser1-1759415689-110m-.sca",
-    "120m": "QuestionB-Original-Sim/DataOfUser1-1759415691-120m-.sca",
-    "130m": "QuestionB-Original-Sim/DataOfUser1-1759415693-130m-.sca",
-    "140m": "QuestionB-Original-Sim/DataOfUser1-1759415695-140m-.sca",
-    "150m": "QuestionB-Original-Sim/DataOfUser1-1759415697-150m-.sca",
-    # "160m": "QuestionB-Original-Sim/DataOfUser1-1759415701-160m-.sca" # File before second tx power change
-    "160m": "QuestionB-Original-Sim/DataOfUser1-1759416980-160m-.sca",
-    "170m": "QuestionB-Original-Sim/DataOfUser1-1759416985-170m-.sca",
-    "180m": "QuestionB-Original-Sim/DataOfUser1-1759416988-180m-.sca",
-    "190m": "QuestionB-Original-Sim/DataOfUser1-1759417049-190m-.sca",
-    "200m": "QuestionB-Original-Sim/DataOfUser1-1759417053-200m-.sca"
-}
-
-
-altered_files_dictionary = { # altered bit rate of 50Mbps, tx power 40.0
-    "0m": "QuestionB-Altered-Sim/DataOfUser1--50000kbps-0m-.sca",
-    "10m": "QuestionB-Altered-Sim/DataOfUser1--50000kbps-10m-.sca",
-    "20m": "QuestionB-Altered-Sim/DataOfUser1--50000kbps-20m-.sca",
-    "30m": "QuestionB-Altered-Sim/DataOfUser1--50000kbps-30m-.sca",
-    "40m": "QuestionB-Altered-Sim/DataOfUser1--50000kbps-40m-.sca",
-    "50m": "QuestionB-Altered-Sim/DataOfUser1--50000kbps-.sca",
-    "60m": "QuestionB-Altered-Sim/DataOfUser1--50000kbps-60m-.sca",
-    "70m": "QuestionB-Altered-Sim/DataOfUser1--50000kbps-70m-.sca",
-    "80m": "QuestionB-Altered-Sim/DataOfUser1--50000kbps-80m-.sca",
-    "90m": "QuestionB-Altered-Sim/DataOfUser1--50000kbps-90m-.sca",
-    "100m": "QuestionB-Altered-Sim/DataOfUser1--50000kbps-100m-.sca",
-    "110m": "QuestionB-Altered-Sim/DataOfUser1--50000kbps-110m-.sca",
-    "120m": "QuestionB-Altered-Sim/DataOfUser1--50000kbps-120m-.sca",
-    "130m": "QuestionB-Altered-Sim/DataOfUser1--50000kbps-130m-.sca",
-    "140m": "QuestionB-Altered-Sim/DataOfUser1--50000kbps-140m-.sca",
-    "150m": "QuestionB-Altered-Sim/DataOfUser1--50000kbps-150m-.sca",
-    "160m": "QuestionB-Altered-Sim/DataOfUser1--50000kbps-160m-.sca",
-    "170m": "QuestionB-Altered-Sim/DataOfUser1--50000kbps-170m-.sca",
-    "180m": "QuestionB-Altered-Sim/DataOfUser1--50000kbps-180m-.sca",
-    "190m": "QuestionB-Altered-Sim/DataOfUser1--50000kbps-190m-.sca",
-    "200m": "QuestionB-Altered-Sim/DataOfUser1--50000kbps-200m-.sca"
-}
+
+from sca_discovery import discover_scenarios, scenario_durations
+from sca_manifest import load_manifest, save_manifest, plan_update, merge_rows, stale_outputs, record_update
+from sca_output import read_results, stream_rows, write_results
+from sca_parser import header_duration, read_sca_header
+from sca_render import annotate_points, figure_job, render_figures
+from sca_store import iter_run_metrics
+
+# Configuration - Directory of files to process
+# "QuestionB-Original-Sim": original bit rate of 160kbps (connectivity issues after 50m)
+# "QuestionB-Altered-Sim": altered bit rate of 50Mbps, tx power 40.0
+ANALYSIS_DIRECTORY = "QuestionB-Altered-Sim"
+
+# Files without a distance in their name were run at the default distance
+DEFAULT_DISTANCE_M = 50
 
 # Simulation parameters
-SIMULATION_TIME_SEC = 20.0  # Runtime is 20 seconds
+SIMULATION_TIME_SEC = 20.0  # Default runtime of 20 seconds
+
+# Per-scenario duration overrides, as (scenario filter, seconds) pairs - e.g.
+# [({'distance_m': 200}, 60.0)]. Runs without an override use the duration recorded in the
+# .sca file, or the default above if the file records none
+DURATION_OVERRIDES = []
+
+# Number of parallel parse processes (1 = parse serially)
+PARSE_WORKERS = 1
+
+# Parse cache sidecar - unchanged .sca files are not re-parsed (None to disable)
+PARSE_CACHE = ".sca-parse-cache.sqlite"
+
+# Per-run metrics are written here as soon as each run is processed (None to disable)
+RESULTS_STREAM = "QuestionB-runs.csv"
+
+# Results table and the manifest of the .sca file behind each of its rows.
+# A '.parquet' results name writes Parquet instead of CSV (requires pyarrow), keeping
+# column types and storing the distance labels dictionary-encoded
+RESULTS_FILE = "QuestionB-DistanceAnalysis.csv"
+MANIFEST = "QuestionB-DistanceAnalysis.manifest.json"
+
+# Incremental mode - only rows whose .sca file is new or changed are recomputed and
+# merged into RESULTS_FILE, and only figures depending on those rows are redrawn
+# (False recomputes everything)
+INCREMENTAL = True
+
+# Figures saved by create_visualisations
+FIGURES = ['QuestionB-ThroughputVsDistance.png', 'QuestionB-DelayVsDistance.png', 'QuestionB-PLRVsDistance.png']
+
+# Figure rendering - headless by default, in RENDER_WORKERS parallel processes.
+# Set INTERACTIVE = True to show each figure in a window instead
+INTERACTIVE = False
+RENDER_WORKERS = 4
 
-def parse_sca_file(filename):
+# Figure cache - figures whose plotted data and style are unchanged are copied from
+# here instead of being redrawn (None to always redraw)
+FIGURE_CACHE = ".figure-cache"
+
+# Color scheme
+COLORS = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd']
+
+def discover_files():
     """
-    Parse OMNeT++ scalar results file (.sca) and extract network performance data.
+    Discover the distance files, keeping only the latest rerun of each distance.
     
-    Args:
-        filename (str): Path to the .sca file
-        
     Returns:
-        dict: Dictionary containing parsed network metrics
+        tuple: (distance label (e.g. "50m") -> path of its .sca file,
+                distance label -> duration override in seconds)
     """
-    data = defaultdict(dict)
-    
-    print(f"Parsing trace file: {filename}")
-    
-    try:
-        with open(filename, 'r') as file:
-            for line in file:
-                line = line.strip()
-                
-                # Parse scalar values
-                if line.startswith('scalar'):
-                    parts = line.split()
-                    if len(parts) >= 4:
-                        node = parts[1]
-                        metric = parts[2]
-                        value = parts[3]
-                        
-                        try:
-                            # Convert to appropriate numeric type
-                            if '.' in value or 'e' in value.lower():
-                                data[node][metric] = float(value)
-                            else:
-                                data[node][metric] = int(value)
-                        except ValueError:
-                            data[node][metric] = value
-                
-                # Parse statistic fields (for packet size statistics)
-                elif line.startswith('field'):
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        field_name = parts[1]
-                        field_value = parts[2]
-                        
-                        try:
-                            if '.' in field_value or 'e' in field_value.lower():
-                                data['statistics'][field_name] = float(field_value)
-                            else:
-                                data['statistics'][field_name] = int(field_value)
-                        except ValueError:
-                            data['statistics'][field_name] = field_value
-                            
-    except FileNotFoundError:
-        print(f"Error: File '{filename}' not found!")
-        return None
-    except Exception as e:
-        print(f"Error parsing file: {e}")
-        return None
-    
-    print("File parsed successfully!")
-    return dict(data)
+    table = discover_scenarios(ANALYSIS_DIRECTORY, defaults={'distance_m': DEFAULT_DISTANCE_M})
+    files = {f"{row.distance_m}m": row.path for row in table.itertuples()}
+    overrides = scenario_durations(table, DURATION_OVERRIDES)
+    durations = {label: overrides[path] for label, path in files.items() if path in overrides}
+    return files, durations
 
-def calculate_metrics_for_file(data, distance_label):
+def effective_durations(files, durations=None):
     """
-    Calculate network performance metrics for a single file.
+    Simulated duration every row is computed with, as recorded in the manifest so that
+    changing an override or the default recomputes the affected rows.
     
     Args:
-        data (dict): Parsed network data from .sca file
-        distance_label (str): Label for the distance (e.g., "10m")
-        
+        files (dict): Distance label -> path of the .sca file
+        durations (dict): Distance label -> duration override in seconds
+    
     Returns:
-        dict: Dictionary containing calculated metrics
+        dict: Distance label -> the override, else the duration recorded in the run
+              header, else SIMULATION_TIME_SEC
     """
-    if data is None:
-        return None
-        
-    try:
-        # Extract key values from the parsed data
-        tx_packets = data.get('node[0]', {}).get('sender-tx-packets', 0)
-        rx_packets = data.get('node[1]', {}).get('receiver-rx-packets', 0)
-        
-        # Packet size statistics
-        avg_packet_size = data.get('statistics', {}).get('mean', 1000)  # bytes
-        
-        # Delay statistics (in nanoseconds)
-        delay_average = data.get('.', {}).get('delay-average', 0)
-        
-        # Calculate Average Throughput (Kbps)
-        # Throughput = (Successfully received bits) / (Total time)
-        total_bits_received = rx_packets * avg_packet_size * 8  # Convert bytes to bits
-        avg_throughput_kbps = (total_bits_received / SIMULATION_TIME_SEC) / 1000
-        
-        # Calculate Average Delay (ms)
-        # Convert from nanoseconds to milliseconds
-        avg_delay_ms = delay_average / 1000000 if delay_average > 0 else 0
-        
-        # Calculate Packet Loss Ratio (PLR)
-        if tx_packets > 0:
-            packet_loss_ratio = (tx_packets - rx_packets) / tx_packets
-        else:
-            packet_loss_ratio = 0
-        
-        return {
-            'distance_label': distance_label,
-            'avg_throughput_kbps': avg_throughput_kbps,
-            'avg_delay_ms': avg_delay_ms,
-            'packet_loss_ratio': packet_loss_ratio,
-            'tx_packets': tx_packets,
-            'rx_packets': rx_packets,
-            'avg_packet_size_bytes': avg_packet_size
-        }
-        
-    except Exception as e:
-        print(f"Error calculating metrics for {distance_label}: {e}")
-        return None
+    effective = {}
+    for label, filename in files.items():
+        seconds = (durations or {}).get(label)
+        if seconds is None:
+            try:
+                seconds = header_duration(read_sca_header(filename))
+            except OSError:
+                seconds = None  # Missing or unreadable - reported by the parser
+        effective[label] = SIMULATION_TIME_SEC if seconds is None else seconds
+    return effective
 
-def process_all_files():
+def process_all_files(files, durations=None):
     """
-    Process all files in the dictionary and calculate metrics for each.
+    Stream the metrics of the given files, writing each run's row to RESULTS_STREAM
+    as soon as it is ready.
+    
+    Args:
+        files (dict): Distance label -> path of the .sca file to process
+        durations (dict): Distance label -> duration override in seconds
     
     Returns:
-        list: List of dictionaries containing metrics for each file
+        pandas.DataFrame: One row of metrics per successfully parsed file
     """
-    print("Starting analysis")
-    print("=" * 60)
+    # Stream the metrics of every file as it is parsed
+    label_by_file = {filename: label for label, filename in files.items()}
+    overrides = {files[label]: seconds for label, seconds in (durations or {}).items() if label in files}
+    metrics = stream_rows(iter_run_metrics(files.values(), SIMULATION_TIME_SEC, verbose=True,
+                                           workers=PARSE_WORKERS, cache=PARSE_CACHE, durations=overrides),
+                          RESULTS_STREAM)
     
     results = []
-    
-    for distance_label, filename in altered_files_dictionary.items(): # Change for altered / Original
-        print(f"\nProcessing {distance_label} scenario...")
-        
-        # Parse the file
-        parsed_data = parse_sca_file(filename)
-        
-        # Calculate metrics
-        metrics = calculate_metrics_for_file(parsed_data, distance_label)
+    processed = set()
+    for row in metrics:
+        processed.add(row['file'])
+        results.append({
+            'distance_label': label_by_file[row['file']],
+            'avg_throughput_kbps': row['avg_throughput_kbps'],
+            'avg_delay_ms': row['avg_delay_ms'],
+            'packet_loss_ratio': row['packet_loss_ratio'],
+            'tx_packets': row['tx_packets'],
+            'rx_packets': row['rx_packets'],
+            'avg_packet_size_bytes': row['avg_packet_size_bytes'],
+            'simulation_time_sec': row['simulation_time_sec']
+        })
         
-        if metrics:
-            results.append(metrics)
-            print(f"Throughput: {metrics['avg_throughput_kbps']:.2f} Kbps")
-            print(f"Delay: {metrics['avg_delay_ms']:.2f} ms")
-            print(f"PLR: {metrics['packet_loss_ratio']:.4f}")
-        else:
-            print(f"Failed to process {distance_label}")
+        print(f"\n{results[-1]['distance_label']} scenario:")
+        print(f"Throughput: {row['avg_throughput_kbps']:.2f} Kbps")
+        print(f"Delay: {row['avg_delay_ms']:.2f} ms")
+        print(f"PLR: {row['packet_loss_ratio']:.4f}")
+    
+    for label, filename in files.items():
+        if filename not in processed:
+            print(f"Failed to process {label}")
+    
+    results = pd.DataFrame(results)
     
     return results
 
@@ -226,7 +166,7 @@ def create_summary_dataframe(results):
     Create a pandas DataFrame with summary statistics.
     
     Args:
-        results (list): List of metric dictionaries
+        results (pandas.DataFrame): Metrics for each file
         
     Returns:
         pandas.DataFrame: DataFrame containing all metrics
@@ -252,7 +192,7 @@ def print_text_summary(df):
     print("\n" + "=" * 80)
     print("NETWORK PERFORMANCE ANALYSIS SUMMARY")
     print("=" * 80)
-    print(f"Simulation Duration: {SIMULATION_TIME_SEC} seconds")
+    print(f"Simulation Duration: {', '.join(f'{d:g}' for d in sorted(df['simulation_time_sec'].unique()))} seconds")
     print(f"Number of Scenarios Analyzed: {len(df)}")
     
     print("\nDETAILED RESULTS BY DISTANCE:")
@@ -281,109 +221,152 @@ def print_text_summary(df):
     print(f"Minimum PLR: {df['packet_loss_percentage'].min():.3f}%")
     print(f"PLR Std Dev: {df['packet_loss_percentage'].std():.3f}%")
 
-def create_visualisations(df):
+def plot_throughput(fig, df):
     """
-    Create individual visualisations for each network performance metric vs distance.
+    Network throughput against distance.
     
     Args:
+        fig (matplotlib.figure.Figure): Figure to draw on
         df (pandas.DataFrame): DataFrame containing metrics
     """
-    print("\nCreating visualisations...")
-    
-    # Set up the plotting style
-    plt.style.use('default')
-    plt.rcParams['figure.figsize'] = (10, 6)
-    plt.rcParams['font.size'] = 12
-    
-    # Color scheme
-    colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd']
-    
-    # 1. Throughput vs Distance
-    plt.figure(figsize=(10, 6))
-    plt.plot(df['distance_numeric'], df['avg_throughput_kbps'], 'o-', 
-             color=colors[0], linewidth=3, markersize=10, label='Throughput')
-    plt.xlabel('Distance (m)', fontweight='bold', fontsize=14)
-    plt.ylabel('Average Throughput (Kbps)', fontweight='bold', fontsize=14)
-    plt.title('Network Throughput vs Distance', fontweight='bold', fontsize=16, pad=20)
-    plt.grid(True, alpha=0.3)
-    plt.legend(fontsize=12)
-    
+    ax = fig.add_subplot()
+    ax.plot(df['distance_numeric'], df['avg_throughput_kbps'], 'o-', 
+            color=COLORS[0], linewidth=3, markersize=10, label='Throughput')
+    ax.set_xlabel('Distance (m)', fontweight='bold', fontsize=14)
+    ax.set_ylabel('Average Throughput (Kbps)', fontweight='bold', fontsize=14)
+    ax.set_title('Network Throughput vs Distance', fontweight='bold', fontsize=16, pad=20)
+    ax.grid(True, alpha=0.3)
+    ax.legend(fontsize=12)
+
     # Add value labels
-    for i, row in df.iterrows():
-        plt.annotate(f'{row["avg_throughput_kbps"]:.1f}', 
-                    (row['distance_numeric'], row['avg_throughput_kbps']),
-                    textcoords="offset points", xytext=(0,15), ha='center', fontsize=10)
-    
-    plt.tight_layout()
-    #plt.savefig('QuestionB-ThroughputVsDistance.png', dpi=300, bbox_inches='tight')
-    plt.show()
-    
-    # 2. Delay vs Distance  
-    plt.figure(figsize=(10, 6))
-    plt.plot(df['distance_numeric'], df['avg_delay_ms'], 's-', 
-             color=colors[1], linewidth=3, markersize=10, label='Average Delay')
-    plt.xlabel('Distance (m)', fontweight='bold', fontsize=14)
-    plt.ylabel('Average Delay (ms)', fontweight='bold', fontsize=14)
-    plt.title('Network Delay vs Distance', fontweight='bold', fontsize=16, pad=20)
-    plt.grid(True, alpha=0.3)
-    plt.legend(fontsize=12)
+    annotate_points(ax, df['distance_numeric'], df['avg_throughput_kbps'], '{:.1f}')
+
+    fig.tight_layout()
+
+def plot_delay(fig, df):
+    """
+    Average delay against distance.
     
+    Args:
+        fig (matplotlib.figure.Figure): Figure to draw on
+        df (pandas.DataFrame): DataFrame containing metrics
+    """
+    ax = fig.add_subplot()
+    ax.plot(df['distance_numeric'], df['avg_delay_ms'], 's-', 
+            color=COLORS[1], linewidth=3, markersize=10, label='Average Delay')
+    ax.set_xlabel('Distance (m)', fontweight='bold', fontsize=14)
+    ax.set_ylabel('Average Delay (ms)', fontweight='bold', fontsize=14)
+    ax.set_title('Network Delay vs Distance', fontweight='bold', fontsize=16, pad=20)
+    ax.grid(True, alpha=0.3)
+    ax.legend(fontsize=12)
+
     # Add value labels
-    for i, row in df.iterrows():
-        plt.annotate(f'{row["avg_delay_ms"]:.2f}', 
-                    (row['distance_numeric'], row['avg_delay_ms']),
-                    textcoords="offset points", xytext=(0,15), ha='center', fontsize=10)
-    
-    plt.tight_layout()
-    #plt.savefig('QuestionB-DelayVsDistance.png', dpi=300, bbox_inches='tight')
-    plt.show()
-    
-    # 3. Packet Loss Ratio vs Distance
-    plt.figure(figsize=(10, 6))
-    plt.plot(df['distance_numeric'], df['packet_loss_percentage'], '^-', 
-             color=colors[2], linewidth=3, markersize=10, label='Packet Loss Ratio')
-    plt.xlabel('Distance (m)', fontweight='bold', fontsize=14)
-    plt.ylabel('Packet Loss Ratio (%)', fontweight='bold', fontsize=14)
-    plt.title('Packet Loss Ratio vs Distance', fontweight='bold', fontsize=16, pad=20)
-    plt.grid(True, alpha=0.3)
-    plt.legend(fontsize=12)
+    annotate_points(ax, df['distance_numeric'], df['avg_delay_ms'], '{:.2f}')
+
+    fig.tight_layout()
+
+def plot_plr(fig, df):
+    """
+    Packet loss ratio against distance.
     
+    Args:
+        fig (matplotlib.figure.Figure): Figure to draw on
+        df (pandas.DataFrame): DataFrame containing metrics
+    """
+    ax = fig.add_subplot()
+    ax.plot(df['distance_numeric'], df['packet_loss_percentage'], '^-', 
+            color=COLORS[2], linewidth=3, markersize=10, label='Packet Loss Ratio')
+    ax.set_xlabel('Distance (m)', fontweight='bold', fontsize=14)
+    ax.set_ylabel('Packet Loss Ratio (%)', fontweight='bold', fontsize=14)
+    ax.set_title('Packet Loss Ratio vs Distance', fontweight='bold', fontsize=16, pad=20)
+    ax.grid(True, alpha=0.3)
+    ax.legend(fontsize=12)
+
     # Add value labels
-    for i, row in df.iterrows():
-        plt.annotate(f'{row["packet_loss_percentage"]:.3f}%', 
-                    (row['distance_numeric'], row['packet_loss_percentage']),
-                    textcoords="offset points", xytext=(0,15), ha='center', fontsize=10)
+    annotate_points(ax, df['distance_numeric'], df['packet_loss_percentage'], '{:.3f}%')
+
+    fig.tight_layout()
+
+def create_visualisations(df, figures=None):
+    """
+    Describe the individual visualisations for each network performance metric vs distance.
+    
+    Args:
+        df (pandas.DataFrame): DataFrame containing metrics
+        figures (set): Names from FIGURES to draw (None draws all of them)
+        
+    Returns:
+        list: Figure jobs for render_figures
+    """
+    print("\nCreating visualisations...")
+    
+    builders = [plot_throughput, plot_delay, plot_plr]
+    return [figure_job(name, builder, df, (10, 6), {'font.size': 12})
+            for name, builder in zip(FIGURES, builders) if figures is None or name in figures]
+
+def load_existing_results():
+    """
+    Load the results of the previous run for an incremental update.
     
-    plt.tight_layout()
-    #plt.savefig('QuestionB-PLRVsDistance.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    Returns:
+        pandas.DataFrame: Previous contents of RESULTS_FILE, or None if there are none
+    """
+    if not INCREMENTAL:
+        return None
+    try:
+        return read_results(RESULTS_FILE)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Warning: Recomputing all rows, could not read '{RESULTS_FILE}': {e}")
+        return None
 
 def main():
     """
     Main function to orchestrate the multi-file network performance analysis.
     """
-    # Process all files
-    results = process_all_files()
-    
-    if not results:
+    files, durations = discover_files()
+    
+    # Work out which rows need recomputing (all of them without a manifest)
+    manifest = load_manifest(MANIFEST)
+    existing = load_existing_results()
+    existing_labels = [] if existing is None else existing['distance_label']
+    parameters = effective_durations(files, durations)
+    changed, removed = plan_update(manifest, files, existing_labels, parameters)
+    if existing is not None:
+        print(f"Incremental update: {len(changed)} of {len(files)} files new or changed, "
+              f"{len(removed)} removed")
+    
+    # Process the new and changed files only
+    results = process_all_files({label: files[label] for label in files if label in changed}, durations)
+    updated = create_summary_dataframe(results) if not results.empty else results
+    df = merge_rows(existing, updated, 'distance_label', changed | removed)
+    
+    if df.empty:
         print("No valid results obtained. Exiting...")
         return
-    
-    # Create summary DataFrame
-    df = create_summary_dataframe(results)
+    df = df.sort_values('distance_numeric').reset_index(drop=True)
     
     # Print text summary
     print_text_summary(df)
     
-    # Create visualisations
-    create_visualisations(df)
-    
-    # Save results to CSV
-    df.to_csv('QuestionB-DistanceAnalysis.csv', index=False)
+    # Create the visualisations that depend on a changed row (every figure plots every distance)
+    figure_rows = {figure: list(df['distance_label']) for figure in FIGURES}
+    stale = stale_outputs(manifest, figure_rows, changed | removed)
+    if stale:
+        render_figures(create_visualisations(df, stale), workers=RENDER_WORKERS, interactive=INTERACTIVE,
+                       cache=FIGURE_CACHE)
+    else:
+        print("\nVisualisations are up to date")
+    
+    # Save the results table and record the sources behind them
+    write_results(df, RESULTS_FILE)
+    record_update(manifest, {label: files[label] for label in df['distance_label']},
+                  {figure: figure_rows[figure] for figure in stale}, changed, parameters)
+    save_manifest(MANIFEST, manifest)
     
     print("\nDistance-based analysis complete!")
 
 # Execute the analysis
 if __name__ == "__main__":
     main()
-    
\ No newline at end of file
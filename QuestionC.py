@@ -14,280 +14,197 @@ Metrics calculated:
 The script also generates individual plot visualisations for each metric.
 """
 
+import math
+import os
+import time
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 import re
-from collections import defaultdict
-
-# Configuration - Dictionary of files to process
-Wifi6_0m = { 
-    "users_1": "QuestionC/Wifi6/DataOfUser1-run-1763041112-0m-1users-WiFi6_80211ax-run-1763041112.sca",
-    "users_10": "QuestionC/Wifi6/DataOfUser1-run-1763041112-0m-10users-WiFi6_80211ax-run-1763041112.sca",
-    "users_20": "QuestionC/Wifi6/DataOfUser1-run-1763041112-0m-20users-WiFi6_80211ax-run-1763041112.sca",
-    "users_50": "QuestionC/Wifi6/DataOfUser1-run-1763041112-0m-50users-WiFi6_80211ax-run-1763041112.sca",
-}
-
-Wifi6_30m = { 
-    "users_1": "QuestionC/Wifi6/DataOfUser1-run-1763041112-30m-1users-WiFi6_80211ax-run-1763041112.sca",
-    "users_10": "QuestionC/Wifi6/DataOfUser1-run-1763041112-30m-10users-WiFi6_80211ax-run-1763041112.sca",
-    "users_20": "QuestionC/Wifi6/DataOfUser1-run-1763041112-30m-20users-WiFi6_80211ax-run-1763041112.sca",
-    "users_50": "QuestionC/Wifi6/DataOfUser1-run-1763041112-30m-50users-WiFi6_80211ax-run-1763041112.sca",
-}
-
-Wifi6_60m = { 
-    "users_1": "QuestionC/Wifi6/DataOfUser1-run-1763041112-60m-1users-WiFi6_80211ax-run-1763041112.sca",
-    "users_10": "QuestionC/Wifi6/DataOfUser1-run-1763041112-60m-10users-WiFi6_80211ax-run-1763041112.sca",
-    "users_20": "QuestionC/Wifi6/DataOfUser1-run-1763041112-60m-20users-WiFi6_80211ax-run-1763041112.sca",
-    "users_50": "QuestionC/Wifi6/DataOfUser1-run-1763041112-60m-50users-WiFi6_80211ax-run-1763041112.sca",
-}
-
-Wifi6_90m = { 
-    "users_1": "QuestionC/Wifi6/DataOfUser1-run-1763041112-90m-1users-WiFi6_80211ax-run-1763041112.sca",
-    "users_10": "QuestionC/Wifi6/DataOfUser1-run-1763041112-90m-10users-WiFi6_80211ax-run-1763041112.sca",
-    "users_20": "QuestionC/Wifi6/DataOfUser1-run-1763041112-90m-20users-WiFi6_80211ax-run-1763041112.sca",
-    "users_50": "QuestionC/Wifi6/DataOfUser1-run-1763041112-90m-50users-WiFi6_80211ax-run-1763041112.sca",
-}
-
-Wifi6_120m = { 
-    "users_1": "QuestionC/Wifi6/DataOfUser1-run-1763041112-120m-1users-WiFi6_80211ax-run-1763041112.sca",
-    "users_10": "QuestionC/Wifi6/DataOfUser1-run-1763041112-120m-10users-WiFi6_80211ax-run-1763041112.sca",
-    "users_20": "QuestionC/Wifi6/DataOfUser1-run-1763041112-120m-20users-WiFi6_80211ax-run-1763041112.sca",
-    "users_50": "QuestionC/Wifi6/DataOfUser1-run-1763041112-120m-50users-WiFi6_80211ax-run-1763041112.sca",
-}
-
-Wifi6_150m = { 
-    "users_1": "QuestionC/Wifi6/DataOfUser1-run-1763041112-150m-1users-WiFi6_80211ax-run-1763041112.sca",
-    "users_10": "QuestionC/Wifi6/DataOfUser1-run-1763041112-150m-10users-WiFi6_80211ax-run-1763041112.sca",
-    "users_20": "QuestionC/Wifi6/DataOfUser1-run-1763041112-150m-20users-WiFi6_80211ax-run-1763041112.sca",
-    "users_50": "QuestionC/Wifi6/DataOfUser1-run-1763041112-150m-50users-WiFi6_80211ax-run-1763041112.sca",
-}
-
-Wifi7_0m = { 
-    "users_1": "QuestionC/Wifi7/DataOfUser1-run-1763041112-0m-1users-WiFi7_80211be-run-1763041112.sca",
-    "users_10": "QuestionC/Wifi7/DataOfUser1-run-1763041112-0m-10users-WiFi7_80211be-run-1763041112.sca",
-    "users_20": "QuestionC/Wifi7/DataOfUser1-run-1763041112-0m-20users-WiFi7_80211be-run-1763041112.sca",
-    "users_50": "QuestionC/Wifi7/DataOfUser1-run-1763041112-0m-50users-WiFi7_80211be-run-1763041112.sca",
-}
-
-Wifi7_30m = { 
-    "users_1": "QuestionC/Wifi7/DataOfUser1-run-1763041112-30m-1users-WiFi7_80211be-run-1763041112.sca",
-    "users_10": "QuestionC/Wifi7/DataOfUser1-run-1763041112-30m-10users-WiFi7_80211be-run-1763041112.sca",
-    "users_20": "QuestionC/Wifi7/DataOfUser1-run-1763041112-30m-20users-WiFi7_80211be-run-1763041112.sca",
-    "users_50": "QuestionC/Wifi7/DataOfUser1-run-1763041112-30m-50users-WiFi7_80211be-run-1763041112.sca",
-}
-
-Wifi7_60m = { 
-    "users_1": "QuestionC/Wifi7/DataOfUser1-run-1763041112-60m-1users-WiFi7_80211be-run-1763041112.sca",
-    "users_10": "QuestionC/Wifi7/DataOfUser1-run-1763041112-60m-10users-WiFi7_80211be-run-1763041112.sca",
-    "users_20": "QuestionC/Wifi7/DataOfUser1-run-1763041112-60m-20users-WiFi7_80211be-run-1763041112.sca",
-    "users_50": "QuestionC/Wifi7/DataOfUser1-run-1763041112-60m-50users-WiFi7_80211be-run-1763041112.sca",
-}
-
-Wifi7_90m = { 
-    "users_1": "QuestionC/Wifi7/DataOfUser1-run-1763041112-90m-1users-WiFi7_80211be-run-1763041112.sca",
-    "users_10": "QuestionC/Wifi7/DataOfUser1-run-1763041112-90m-10users-WiFi7_80211be-run-1763041112.sca",
-    "users_20": "QuestionC/Wifi7/DataOfUser1-run-1763041112-90m-20users-WiFi7_80211be-run-1763041112.sca",
-    "users_50": "QuestionC/Wifi7/DataOfUser1-run-1763041112-90m-50users-WiFi7_80211be-run-1763041112.sca",
-}
-
-Wifi7_120m = { 
-    "users_1": "QuestionC/Wifi7/DataOfUser1-run-1763041112-120m-1users-WiFi7_80211be-run-1763041112.sca",
-    "users_10": "QuestionC/Wifi7/DataOfUser1-run-1763041112-120m-10users-WiFi7_80211be-run-1763041112.sca",
-    "users_20": "QuestionC/Wifi7/DataOfUser1-run-1763041112-120m-20users-WiFi7_80211be-run-1763041112.sca",
-    "users_50": "QuestionC/Wifi7/DataOfUser1-run-1763041112-120m-50users-WiFi7_80211be-run-1763041112.sca",
-}
-
-Wifi7_150m = { 
-    "users_1": "QuestionC/Wifi7/DataOfUser1-run-1763041112-150m-1users-WiFi7_80211be-run-1763041112.sca",
-    "users_10": "QuestionC/Wifi7/DataOfUser1-run-1763041112-150m-10users-WiFi7_80211be-run-1763041112.sca",
-    "users_20": "QuestionC/Wifi7/DataOfUser1-run-1763041112-150m-20users-WiFi7_80211be-run-1763041112.sca",
-    "users_50": "QuestionC/Wifi7/DataOfUser1-run-1763041112-150m-50users-WiFi7_80211be-run-1763041112.sca",
-}
-
-simTime = 20.0  # Simulation time in seconds
-
-# Organized data structures for systematic analysis
-WIFI_SCENARIOS = {
-    "WiFi6": {
-        "0m": Wifi6_0m,
-        "30m": Wifi6_30m,
-        "60m": Wifi6_60m,
-        "90m": Wifi6_90m,
-        "120m": Wifi6_120m,
-        "150m": Wifi6_150m,
-    }, 
-    "WiFi7": {
-        "0m": Wifi7_0m,
-        "30m": Wifi7_30m,
-        "60m": Wifi7_60m,
-        "90m": Wifi7_90m,
-        "120m": Wifi7_120m,
-        "150m": Wifi7_150m,
-    }
-}
 
-DISTANCES = ["0m", "30m", "60m", "90m", "120m", "150m"]
-USER_COUNTS = ["users_1", "users_10", "users_20", "users_50"]
+from sca_cube import build_cube, cube_labels, cube_present, cube_series, cube_slice, select_metrics
+from sca_discovery import SCENARIO_KEYS, discover_scenarios, missing_scenarios, scenario_durations
+from sca_output import read_results, stream_rows, write_results
+from sca_render import annotate_points, figure_job, render_figures
+from sca_replication import CI_HIGH_SUFFIX, CI_LOW_SUFFIX, summarise_replications
+from sca_store import iter_run_metrics
+from sca_watch import iter_completed_files
+
+# Configuration - Directories scanned for scenario files
+# Scenario parameters come from the file names (e.g. "...-0m-10users-WiFi6_80211ax-...")
+SCENARIO_DIRECTORIES = ["QuestionC/Wifi6", "QuestionC/Wifi7"]
+
+simTime = 20.0  # Default simulation time in seconds
+
+# Per-scenario duration overrides, as (scenario filter, seconds) pairs - e.g.
+# [({'wifi_type': 'WiFi7'}, 60.0)]. Runs without an override use the duration recorded in the
+# .sca file, or the default above if the file records none
+DURATION_OVERRIDES = []
+
+# Number of parallel parse processes (1 = parse serially)
+PARSE_WORKERS = 1
+
+# Parse cache sidecar - unchanged .sca files are not re-parsed (None to disable)
+PARSE_CACHE = ".sca-parse-cache.sqlite"
+
+# Replications - True treats every file of a scenario (e.g. one per seed) as a replication:
+# metrics are averaged over them, with standard errors and bootstrap confidence intervals
+# drawn as bands and error bars. False keeps only the newest file of each scenario
+REPLICATIONS = False
+BOOTSTRAP_RESAMPLES = 1000
+CONFIDENCE_LEVEL = 0.95
+
+# Columns identifying a scenario, and the metrics given confidence intervals across replications
+SCENARIO_LABELS = ['wifi_type', 'distance', 'distance_numeric', 'user_count', 'user_numeric']
+REPLICATED_METRICS = ['avg_throughput_kbps', 'avg_delay_ms', 'packet_loss_percentage']
+
+# Per-run metrics are written here as soon as each scenario is processed (None to disable)
+RESULTS_STREAM = "QuestionC-runs.csv"
+
+# Summary table - a '.parquet' name writes Parquet instead of CSV (requires pyarrow),
+# keeping column types and storing the scenario labels dictionary-encoded
+RESULTS_FILE = "QuestionC-WiFi6-vs-WiFi7-Analysis.csv"
+
+# Plot straight from an existing RESULTS_FILE instead of re-processing the .sca files
+PLOT_FROM_RESULTS = False
+
+# Watch mode - keep running, and update the results table and figures whenever simulations
+# finish new .sca files in SCENARIO_DIRECTORIES, instead of analysing them once. A file counts
+# as finished once it has not changed for WATCH_SETTLE_SEC
+WATCH = False
+WATCH_INTERVAL_SEC = 30.0
+WATCH_SETTLE_SEC = 10.0
 
-def parse_sca_file(filename):
+# Figure rendering - headless by default, in RENDER_WORKERS parallel processes.
+# Set INTERACTIVE = True to show each figure in a window instead
+INTERACTIVE = False
+RENDER_WORKERS = 4
+
+# Figure cache - figures whose plotted data and style are unchanged are copied from
+# here instead of being redrawn (None to always redraw)
+FIGURE_CACHE = ".figure-cache"
+
+# Scenario cube - results are materialised once along these axes, and the summary and
+# plots read their panels as slices of it
+SCENARIO_AXES = ['wifi_type', 'distance_numeric', 'user_numeric']
+CUBE_METRICS = ['avg_throughput_kbps', 'avg_delay_ms', 'packet_loss_percentage', 'jain_fairness_index',
+                'worst_station_delay_ms', 'simulation_time_sec']
+
+# User counts with a panel in the comparative visualizations
+PLOT_USER_COUNTS = [1, 10, 20, 50]
+
+# Side-by-side distance comparisons - one panel per distance, DISTANCE_PANEL_COLUMNS to a
+# row, each row DISTANCE_PANEL_ROW_HEIGHT inches tall
+DISTANCE_PANEL_COLUMNS = 3
+DISTANCE_PANEL_ROW_HEIGHT = 6
+
+# Color schemes
+WIFI6_COLOR = '#1f77b4'  # Blue
+WIFI7_COLOR = '#ff7f0e'  # Orange
+
+def scenario_result(wifi_type, distance, user_count, row):
     """
-    Parse OMNeT++ scalar results file (.sca) and extract network performance data.
+    Build the results row of one scenario from its run metrics.
     
     Args:
-        filename (str): Path to the .sca file
+        wifi_type (str): WiFi generation (e.g. 'WiFi6')
+        distance (str): Distance label (e.g. '30m')
+        user_count (str): User count label (e.g. 'users_10')
+        row (dict): Run metrics from iter_run_metrics (with station metrics)
         
     Returns:
-        dict: Dictionary containing parsed network metrics
+        dict: Results row
     """
-    data = defaultdict(dict)
-    
-    try:
-        with open(filename, 'r') as file:
-            for line in file:
-                line = line.strip()
-                
-                # Parse scalar values
-                if line.startswith('scalar'):
-                    parts = line.split()
-                    if len(parts) >= 4:
-                        node = parts[1]
-                        metric = parts[2]
-                        value = parts[3]
-                        
-                        try:
-                            # Convert to appropriate numeric type
-                            if '.' in value or 'e' in value.lower():
-                                data[node][metric] = float(value)
-                            else:
-                                data[node][metric] = int(value)
-                        except ValueError:
-                            data[node][metric] = value
-                
-                # Parse statistic fields (for packet size statistics)
-                elif line.startswith('field'):
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        field_name = parts[1]
-                        field_value = parts[2]
-                        
-                        try:
-                            if '.' in field_value or 'e' in field_value.lower():
-                                data['statistics'][field_name] = float(field_value)
-                            else:
-                                data['statistics'][field_name] = int(field_value)
-                        except ValueError:
-                            data['statistics'][field_name] = field_value
-                            
-    except FileNotFoundError:
-        print(f"Warning: File '{filename}' not found!")
-        return None
-    except Exception as e:
-        print(f"Error parsing file '{filename}': {e}")
-        return None
-    
-    return dict(data)
+    return {
+        'wifi_type': wifi_type,
+        'distance': distance,
+        'distance_numeric': int(distance.replace('m', '')),
+        'user_count': user_count,     # Keep string for plotting filters
+        'user_numeric': int(user_count.replace('users_', '')),
+        'avg_throughput_kbps': row['avg_throughput_kbps'],   # Per receiving station
+        'avg_delay_ms': row['avg_delay_ms'],
+        'packet_loss_ratio': row['packet_loss_ratio'],
+        'tx_packets': row['tx_packets'],
+        'rx_packets': row['rx_packets'],
+        'avg_packet_size_bytes': row['avg_packet_size_bytes'],
+        'receiver_count': row['receiver_count'],
+        'total_throughput_kbps': row['total_throughput_kbps'],
+        'max_delay_ms': row['max_delay_ms'],
+        'min_delay_ms': row['min_delay_ms'],
+        'simulation_time_sec': row['simulation_time_sec'],
+        # Per-station distribution - aggregate averages hide starved stations
+        'jain_fairness_index': row['jain_fairness_index'],
+        'station_throughput_p5_kbps': row['station_throughput_p5_kbps'],
+        'station_throughput_p50_kbps': row['station_throughput_p50_kbps'],
+        'station_throughput_p95_kbps': row['station_throughput_p95_kbps'],
+        'worst_station_delay_ms': row['worst_station_delay_ms'],
+        'station_plr_p5': row['station_plr_p5'],
+        'station_plr_p50': row['station_plr_p50'],
+        'station_plr_p95': row['station_plr_p95'],
+        'worst_station_plr': row['worst_station_plr']
+    }
 
-def calculate_metrics_for_scenario(data, wifi_type, distance, user_count):
+def scenario_labels(table):
     """
-    Calculate network performance metrics for a single scenario.
+    Labels of every scenario file, in the form the results rows use.
     
     Args:
-        data (dict): Parsed network data from .sca file
-        wifi_type (str): WiFi type ("WiFi6" or "WiFi7")
-        distance (str): Distance (e.g., "0m", "30m")
-        user_count (str): User count (e.g., "users_1", "users_10")
+        table (pandas.DataFrame): Scenario table from discover_scenarios
         
     Returns:
-        dict: Dictionary containing calculated metrics
+        list: (wifi_type, distance label, user count label, path) tuples
     """
-    if data is None:
-        return None
-        
-    try:
-        # Extract key values from the parsed data
-        # tx from node[0], rx from node[1] (correct node assignment)
-        tx_packets = data.get('node[0]', {}).get('sender-tx-packets', 0)
-        rx_packets = data.get('node[1]', {}).get('receiver-rx-packets', 0)
-        
-        # Packet size statistics
-        avg_packet_size = data.get('statistics', {}).get('mean', 1000)  # bytes
-        
-        # Delay statistics (in nanoseconds) - read from correct location
-        delay_average = data.get('.', {}).get('delay-average', 0)
-        
-        # Calculate Average Throughput (Kbps)
-        # Throughput = (Successfully received bits) / (Total time)
-        total_bits_received = rx_packets * avg_packet_size * 8  # Convert bytes to bits
-        avg_throughput_kbps = (total_bits_received / simTime) / 1000
-        
-        # Calculate Average Delay (ms)
-        # Convert from nanoseconds to milliseconds
-        avg_delay_ms = delay_average / 1000000 if delay_average > 0 else 0
-        
-        # Calculate Packet Loss Ratio (PLR)
-        if tx_packets > 0:
-            packet_loss_ratio = (tx_packets - rx_packets) / tx_packets
-        else:
-            packet_loss_ratio = 0
-        
-        # Extract numeric values for analysis
-        distance_numeric = int(distance.replace('m', ''))
-        user_numeric = int(user_count.replace('users_', ''))
-        
-        return {
-            'wifi_type': wifi_type,
-            'distance': distance,
-            'distance_numeric': distance_numeric,
-            'user_count': user_count,        # Keep string for plotting filters
-            'user_numeric': user_numeric,
-            'avg_throughput_kbps': avg_throughput_kbps,
-            'avg_delay_ms': avg_delay_ms,
-            'packet_loss_ratio': packet_loss_ratio,
-            'tx_packets': tx_packets,
-            'rx_packets': rx_packets,
-            'avg_packet_size_bytes': avg_packet_size
-        }
-        
-    except Exception as e:
-        print(f"Error calculating metrics for {wifi_type} {distance} {user_count}: {e}")
-        return None
+    return [(row.wifi_type, f"{row.distance_m}m", f"users_{row.users}", row.path)
+            for row in table.itertuples()]
 
 def process_all_scenarios():
     """
-    Process all WiFi scenarios and calculate metrics for each.
+    Stream the metrics of every WiFi scenario, writing each run's row to
+    RESULTS_STREAM as soon as it is ready.
+    
+    Multi-user runs repeat the sender/receiver/delay block once per receiver, so the
+    metrics are aggregated over every receiver block rather than read from node[1].
     
     Returns:
-        list: List of dictionaries containing metrics for each scenario
+        pandas.DataFrame: One row of metrics per successfully parsed scenario
     """
     print("Starting comprehensive WiFi 6 vs WiFi 7 analysis")
     print("=" * 70)
     
-    results = []
-    total_scenarios = len(WIFI_SCENARIOS) * len(DISTANCES) * len(USER_COUNTS)
-    current_scenario = 0
+    # Discover every scenario file from the directory listing
+    table = discover_scenarios(SCENARIO_DIRECTORIES, keep='all' if REPLICATIONS else 'latest')
+    for wifi_type, distance_m, users in missing_scenarios(table, ['wifi_type', 'distance_m', 'users']):
+        print(f"Warning: No file found for {wifi_type} - {distance_m}m - {users} users")
     
-    for wifi_type, distance_dict in WIFI_SCENARIOS.items():
-        print(f"\nProcessing {wifi_type} scenarios...")
-        
-        for distance, user_dict in distance_dict.items():
-            for user_count, filename in user_dict.items():
-                current_scenario += 1
-                print(f"  [{current_scenario}/{total_scenarios}] {wifi_type} - {distance} - {user_count}")
-                
-                # Parse the file
-                parsed_data = parse_sca_file(filename)
-                
-                # Calculate metrics
-                metrics = calculate_metrics_for_scenario(parsed_data, wifi_type, distance, user_count)
-                
-                if metrics:
-                    results.append(metrics)
-                    print(f"    Throughput: {metrics['avg_throughput_kbps']:.1f} Kbps, "
-                          f"Delay: {metrics['avg_delay_ms']:.2f} ms, "
-                          f"PLR: {metrics['packet_loss_ratio']:.4f}")
-                else:
-                    print(f"    Failed to process scenario")
+    scenarios = scenario_labels(table)
+    
+    # Stream the metrics of every scenario as its file is parsed
+    metrics = stream_rows(iter_run_metrics((scenario[3] for scenario in scenarios), simTime,
+                                           workers=PARSE_WORKERS, cache=PARSE_CACHE, stations=True,
+                                           durations=scenario_durations(table, DURATION_OVERRIDES)),
+                          RESULTS_STREAM)
+    position = {scenario[3]: i for i, scenario in enumerate(scenarios, start=1)}
+    
+    results = []
+    processed = set()
+    for row in metrics:
+        processed.add(row['file'])
+        i = position[row['file']]
+        wifi_type, distance, user_count, filename = scenarios[i - 1]
+        if not results or wifi_type != results[-1]['wifi_type']:
+            print(f"\nProcessing {wifi_type} scenarios...")
+        print(f"  [{i}/{len(scenarios)}] {wifi_type} - {distance} - {user_count}")
+        print(f"    Throughput: {row['avg_throughput_kbps']:.1f} Kbps, "
+              f"Delay: {row['avg_delay_ms']:.2f} ms, "
+              f"PLR: {row['packet_loss_ratio']:.4f}, "
+              f"Fairness: {row['jain_fairness_index']:.3f}")
+        
+        results.append(scenario_result(wifi_type, distance, user_count, row))
+    
+    for wifi_type, distance, user_count, filename in scenarios:
+        if filename not in processed:
+            print(f"  Failed to process {wifi_type} - {distance} - {user_count}")
+    
+    results = pd.DataFrame(results)
     
     return results
 
@@ -296,356 +213,458 @@ def create_summary_dataframe(results):
     Create a pandas DataFrame with comprehensive analysis.
     
     Args:
-        results (list): List of metric dictionaries
+        results (pandas.DataFrame): Metrics for each run
         
     Returns:
-        pandas.DataFrame: DataFrame containing all metrics
+        pandas.DataFrame: DataFrame containing all metrics, one row per scenario
     """
     df = pd.DataFrame(results)
     
     # Add percentage PLR column
     df['packet_loss_percentage'] = df['packet_loss_ratio'] * 100
     
+    # Average the replications of each scenario, with their confidence intervals
+    if REPLICATIONS:
+        df = summarise_replications(df, SCENARIO_LABELS, REPLICATED_METRICS,
+                                    BOOTSTRAP_RESAMPLES, CONFIDENCE_LEVEL)
+    
     # Sort by WiFi type, distance, and user count
     df = df.sort_values(['wifi_type', 'distance_numeric', 'user_numeric'])
     
     return df
 
-def print_comprehensive_summary(df):
+def cube_metrics(df):
+    """
+    Metrics to materialise in the scenario cube - CUBE_METRICS, plus the replication
+    count and confidence intervals when the results table has them.
+    
+    Args:
+        df (pandas.DataFrame): Results table
+        
+    Returns:
+        list: Metric columns
+    """
+    extra = ['replications'] + [metric + suffix for metric in REPLICATED_METRICS
+                                for suffix in (CI_LOW_SUFFIX, CI_HIGH_SUFFIX)]
+    return CUBE_METRICS + [column for column in extra if column in df.columns]
+
+def _plotted_metrics(cube, metric):
+    """
+    A plotted metric together with its confidence interval columns, if the cube has them.
+    """
+    return [column for column in (metric, metric + CI_LOW_SUFFIX, metric + CI_HIGH_SUFFIX)
+            if column in cube['metric_index']]
+
+def _interval_series(cube, column, axis, **selection):
+    """
+    Lower and upper confidence bounds of a series, or None if the cube has no intervals.
+    """
+    if column + CI_LOW_SUFFIX not in cube['metric_index']:
+        return None
+    return (cube_series(cube, column + CI_LOW_SUFFIX, axis, **selection)[1],
+            cube_series(cube, column + CI_HIGH_SUFFIX, axis, **selection)[1])
+
+def _scenario_values(cube, metric, wifi_type):
+    """
+    Values of one metric over every scenario of a WiFi type.
+    """
+    return cube_slice(cube, metric, wifi_type=wifi_type)[cube_present(cube, wifi_type=wifi_type)]
+
+def print_comprehensive_summary(cube):
     """
     Print a comprehensive text summary of the WiFi 6 vs WiFi 7 analysis.
     
     Args:
-        df (pandas.DataFrame): DataFrame containing metrics
+        cube (dict): Scenario cube of the results (see sca_cube.build_cube)
     """
+    durations = np.unique(cube_slice(cube, 'simulation_time_sec')[cube['present']])
     print("\n" + "=" * 100)
     print("COMPREHENSIVE WiFi 6 vs WiFi 7 PERFORMANCE ANALYSIS")
     print("=" * 100)
-    print(f"Simulation Duration: {simTime} seconds")
-    print(f"Total Scenarios Analyzed: {len(df)}")
+    print(f"Simulation Duration: {', '.join(f'{d:g}' for d in durations)} seconds")
+    print(f"Total Scenarios Analyzed: {cube['present'].sum()}")
     print(f"WiFi Technologies: WiFi 6, WiFi 7")
-    print(f"Distances Tested: {', '.join(DISTANCES)}")
+    print(f"Distances Tested: {', '.join(f'{d}m' for d in cube_labels(cube, 'distance_numeric'))}")
     print(f"User Counts: 1, 10, 20, 50 users")
+    if 'replications' in cube['metric_index']:
+        replications = cube_slice(cube, 'replications')[cube['present']]
+        print(f"Replications per Scenario: {replications.min():g}-{replications.max():g} "
+              f"({CONFIDENCE_LEVEL:.0%} bootstrap confidence intervals)")
     
     # Summary by WiFi type
     for wifi_type in ["WiFi6", "WiFi7"]:
-        wifi_data = df[df['wifi_type'] == wifi_type]
+        throughput = _scenario_values(cube, 'avg_throughput_kbps', wifi_type)
         print(f"\n{wifi_type} PERFORMANCE SUMMARY:")
         print("-" * 50)
-        print(f"Average Throughput: {wifi_data['avg_throughput_kbps'].mean():.2f} Kbps")
-        print(f"Average Delay: {wifi_data['avg_delay_ms'].mean():.2f} ms")
-        print(f"Average PLR: {wifi_data['packet_loss_percentage'].mean():.3f}%")
-        print(f"Max Throughput: {wifi_data['avg_throughput_kbps'].max():.2f} Kbps")
-        print(f"Min Throughput: {wifi_data['avg_throughput_kbps'].min():.2f} Kbps")
+        if len(throughput) == 0:
+            # Watch mode, before the first run of this WiFi type has finished
+            print("No results yet")
+            continue
+        print(f"Average Throughput: {np.nanmean(throughput):.2f} Kbps")
+        print(f"Average Delay: {np.nanmean(_scenario_values(cube, 'avg_delay_ms', wifi_type)):.2f} ms")
+        print(f"Average PLR: {np.nanmean(_scenario_values(cube, 'packet_loss_percentage', wifi_type)):.3f}%")
+        print(f"Max Throughput: {np.nanmax(throughput):.2f} Kbps")
+        print(f"Min Throughput: {np.nanmin(throughput):.2f} Kbps")
+        
+        # Distance x users panel of the fairness index (NaN where no scenario was run)
+        fairness = cube_slice(cube, 'jain_fairness_index', wifi_type=wifi_type)
+        distance, users = np.unravel_index(np.nanargmin(fairness), fairness.shape)
+        print(f"Lowest Fairness (Jain): {fairness[distance, users]:.3f} "
+              f"({cube_labels(cube, 'distance_numeric')[distance]}m, "
+              f"{cube_labels(cube, 'user_numeric')[users]} users)")
+        print(f"Worst Station Delay: {np.nanmax(_scenario_values(cube, 'worst_station_delay_ms', wifi_type)):.2f} ms")
     
     # Comparative analysis
-    wifi6_data = df[df['wifi_type'] == 'WiFi6']
-    wifi7_data = df[df['wifi_type'] == 'WiFi7']
+    def improvement(metric, higher_is_better):
+        wifi6_mean = np.nanmean(_scenario_values(cube, metric, 'WiFi6'))
+        wifi7_mean = np.nanmean(_scenario_values(cube, metric, 'WiFi7'))
+        change = wifi7_mean - wifi6_mean if higher_is_better else wifi6_mean - wifi7_mean
+        return change / wifi6_mean * 100
     
     print(f"\nCOMPARATIVE ANALYSIS:")
     print("-" * 40)
-    throughput_improvement = ((wifi7_data['avg_throughput_kbps'].mean() - 
-                              wifi6_data['avg_throughput_kbps'].mean()) / 
-                             wifi6_data['avg_throughput_kbps'].mean()) * 100
-    
-    delay_improvement = ((wifi6_data['avg_delay_ms'].mean() - 
-                         wifi7_data['avg_delay_ms'].mean()) / 
-                        wifi6_data['avg_delay_ms'].mean()) * 100
-    
-    plr_improvement = ((wifi6_data['packet_loss_percentage'].mean() - 
-                       wifi7_data['packet_loss_percentage'].mean()) / 
-                      wifi6_data['packet_loss_percentage'].mean()) * 100
+    if not all(cube_present(cube, wifi_type=wifi_type).any() for wifi_type in ["WiFi6", "WiFi7"]):
+        print("Needs results for both WiFi 6 and WiFi 7")
+        return
+    throughput_improvement = improvement('avg_throughput_kbps', True)
+    delay_improvement = improvement('avg_delay_ms', False)
+    plr_improvement = improvement('packet_loss_percentage', False)
     
     print(f"WiFi 7 Throughput Improvement: {throughput_improvement:+.1f}%")
     print(f"WiFi 7 Delay Improvement: {delay_improvement:+.1f}%")
     print(f"WiFi 7 PLR Improvement: {plr_improvement:+.1f}%")
 
-def create_comparative_visualizations(df):
+def _plot_metric_by_user_count(fig, cube, column, ylabel, title, suptitle):
     """
-    Create comprehensive comparative visualizations for WiFi 6 vs WiFi 7.
-    
-    Args:
-        df (pandas.DataFrame): DataFrame containing metrics
+    Draw one metric against distance for WiFi 6 and WiFi 7, one subplot per user count.
     """
-    print("\nCreating comparative visualizations...")
-    
-    # Set up plotting style
-    plt.style.use('default')
-    plt.rcParams['figure.figsize'] = (15, 12)
-    plt.rcParams['font.size'] = 11
-    
-    # Color schemes
-    wifi6_color = '#1f77b4'  # Blue
-    wifi7_color = '#ff7f0e'  # Orange
-    
-    # Create individual plots for each metric
-    
-    # 1. Throughput Analysis
-    plt.figure(figsize=(15, 10))
-    
-    # Plot by distance for each user count
-    for i, user_count in enumerate(['users_1', 'users_10', 'users_20', 'users_50']):
-        plt.subplot(2, 2, i+1)
+    for i, users in enumerate(PLOT_USER_COUNTS):
+        ax = fig.add_subplot(2, 2, i+1)
         
-        # Filter data for current user count
-        wifi6_subset = df[(df['wifi_type'] == 'WiFi6') & (df['user_count'] == user_count)]
-        wifi7_subset = df[(df['wifi_type'] == 'WiFi7') & (df['user_count'] == user_count)]
+        # Distance series of the current user count
+        wifi6_distances, wifi6_values = cube_series(cube, column, 'distance_numeric', wifi_type='WiFi6', user_numeric=users)
+        wifi7_distances, wifi7_values = cube_series(cube, column, 'distance_numeric', wifi_type='WiFi7', user_numeric=users)
         
         # Plot lines
-        plt.plot(wifi6_subset['distance_numeric'], wifi6_subset['avg_throughput_kbps'], 
-                'o-', color=wifi6_color, linewidth=2, markersize=6, label='WiFi 6')
-        plt.plot(wifi7_subset['distance_numeric'], wifi7_subset['avg_throughput_kbps'], 
-                's-', color=wifi7_color, linewidth=2, markersize=6, label='WiFi 7')
-        
-        plt.xlabel('Distance (m)')
-        plt.ylabel('Throughput (Kbps)')
-        plt.title(f'Throughput vs Distance - {user_count.replace("_", " ").title()}')
-        plt.grid(True, alpha=0.3)
-        plt.legend()
-    
-    plt.suptitle('WiFi 6 vs WiFi 7: Throughput Performance Analysis', fontsize=16, fontweight='bold')
-    plt.tight_layout()
-    plt.savefig('QuestionC-Throughput-Analysis-WiFi6-vs-WiFi7.png', dpi=300, bbox_inches='tight')
-    plt.show()
-    
-    # 2. Delay Analysis
-    plt.figure(figsize=(15, 10))
-    
-    for i, user_count in enumerate(['users_1', 'users_10', 'users_20', 'users_50']):
-        plt.subplot(2, 2, i+1)
-        
-        wifi6_subset = df[(df['wifi_type'] == 'WiFi6') & (df['user_count'] == user_count)]
-        wifi7_subset = df[(df['wifi_type'] == 'WiFi7') & (df['user_count'] == user_count)]
-        
-        plt.plot(wifi6_subset['distance_numeric'], wifi6_subset['avg_delay_ms'], 
-                'o-', color=wifi6_color, linewidth=2, markersize=6, label='WiFi 6')
-        plt.plot(wifi7_subset['distance_numeric'], wifi7_subset['avg_delay_ms'], 
-                's-', color=wifi7_color, linewidth=2, markersize=6, label='WiFi 7')
-        
-        plt.xlabel('Distance (m)')
-        plt.ylabel('Average Delay (ms)')
-        plt.title(f'Delay vs Distance - {user_count.replace("_", " ").title()}')
-        plt.grid(True, alpha=0.3)
-        plt.legend()
-    
-    plt.suptitle('WiFi 6 vs WiFi 7: Delay Performance Analysis', fontsize=16, fontweight='bold')
-    plt.tight_layout()
-    plt.savefig('QuestionC-Delay-Analysis-WiFi6-vs-WiFi7.png', dpi=300, bbox_inches='tight')
-    plt.show()
-    
-    # 3. PLR Analysis
-    plt.figure(figsize=(15, 10))
-    
-    for i, user_count in enumerate(['users_1', 'users_10', 'users_20', 'users_50']):
-        plt.subplot(2, 2, i+1)
-        
-        wifi6_subset = df[(df['wifi_type'] == 'WiFi6') & (df['user_count'] == user_count)]
-        wifi7_subset = df[(df['wifi_type'] == 'WiFi7') & (df['user_count'] == user_count)]
-        
-        plt.plot(wifi6_subset['distance_numeric'], wifi6_subset['packet_loss_percentage'], 
-                'o-', color=wifi6_color, linewidth=2, markersize=6, label='WiFi 6')
-        plt.plot(wifi7_subset['distance_numeric'], wifi7_subset['packet_loss_percentage'], 
-                's-', color=wifi7_color, linewidth=2, markersize=6, label='WiFi 7')
-        
-        plt.xlabel('Distance (m)')
-        plt.ylabel('Packet Loss Ratio (%)')
-        plt.title(f'PLR vs Distance - {user_count.replace("_", " ").title()}')
-        plt.grid(True, alpha=0.3)
-        plt.legend()
+        ax.plot(wifi6_distances, wifi6_values, 
+                'o-', color=WIFI6_COLOR, linewidth=2, markersize=6, label='WiFi 6')
+        ax.plot(wifi7_distances, wifi7_values, 
+                's-', color=WIFI7_COLOR, linewidth=2, markersize=6, label='WiFi 7')
+        
+        # Confidence bands across replications (scenarios with a single run have none)
+        for wifi_type, distances, color in (('WiFi6', wifi6_distances, WIFI6_COLOR),
+                                            ('WiFi7', wifi7_distances, WIFI7_COLOR)):
+            interval = _interval_series(cube, column, 'distance_numeric', wifi_type=wifi_type, user_numeric=users)
+            if interval is not None:
+                ax.fill_between(distances, interval[0], interval[1], color=color, alpha=0.2, linewidth=0)
+        
+        ax.set_xlabel('Distance (m)')
+        ax.set_ylabel(ylabel)
+        ax.set_title(f'{title} vs Distance - Users {users}')
+        ax.grid(True, alpha=0.3)
+        ax.legend()
     
-    plt.suptitle('WiFi 6 vs WiFi 7: Packet Loss Ratio Analysis', fontsize=16, fontweight='bold')
-    plt.tight_layout()
-    plt.savefig('QuestionC-PLR-Analysis-WiFi6-vs-WiFi7.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    fig.suptitle(suptitle, fontsize=16, fontweight='bold')
+    fig.tight_layout()
 
-def create_side_by_side_distance_comparisons(df):
+def plot_throughput_analysis(fig, cube):
     """
-    Create side-by-side comparisons for each distance, showing WiFi 6 vs WiFi 7
-    performance for all user counts at that specific distance.
+    Throughput vs distance for each user count.
     
     Args:
-        df (pandas.DataFrame): DataFrame containing metrics
+        fig (matplotlib.figure.Figure): Figure to draw on
+        cube (dict): Scenario cube of the results (see sca_cube.build_cube)
     """
-    print("\nCreating side-by-side distance comparison visualizations...")
+    _plot_metric_by_user_count(fig, cube, 'avg_throughput_kbps', 'Throughput (Kbps)', 'Throughput',
+                               'WiFi 6 vs WiFi 7: Throughput Performance Analysis')
+
+def plot_delay_analysis(fig, cube):
+    """
+    Delay vs distance for each user count.
     
-    # Set up plotting style
-    plt.style.use('default')
-    plt.rcParams['font.size'] = 10
+    Args:
+        fig (matplotlib.figure.Figure): Figure to draw on
+        cube (dict): Scenario cube of the results (see sca_cube.build_cube)
+    """
+    _plot_metric_by_user_count(fig, cube, 'avg_delay_ms', 'Average Delay (ms)', 'Delay',
+                               'WiFi 6 vs WiFi 7: Delay Performance Analysis')
+
+def plot_plr_analysis(fig, cube):
+    """
+    PLR vs distance for each user count.
+    
+    Args:
+        fig (matplotlib.figure.Figure): Figure to draw on
+        cube (dict): Scenario cube of the results (see sca_cube.build_cube)
+    """
+    _plot_metric_by_user_count(fig, cube, 'packet_loss_percentage', 'Packet Loss Ratio (%)', 'PLR',
+                               'WiFi 6 vs WiFi 7: Packet Loss Ratio Analysis')
+
+def create_comparative_visualizations(cube):
+    """
+    Describe the comparative visualizations for WiFi 6 vs WiFi 7.
     
-    # Color schemes
-    wifi6_color = '#1f77b4'  # Blue
-    wifi7_color = '#ff7f0e'  # Orange
+    Args:
+        cube (dict): Scenario cube of the results (see sca_cube.build_cube)
+        
+    Returns:
+        list: Figure jobs for render_figures
+    """
+    print("\nCreating comparative visualizations...")
     
-    distances = sorted(df['distance_numeric'].unique())
-    user_counts = sorted(df['user_numeric'].unique())
+    style = {'font.size': 11}
+    return [
+        figure_job('QuestionC-Throughput-Analysis-WiFi6-vs-WiFi7.png', plot_throughput_analysis,
+                   select_metrics(cube, _plotted_metrics(cube, 'avg_throughput_kbps')), (15, 10), style),
+        figure_job('QuestionC-Delay-Analysis-WiFi6-vs-WiFi7.png', plot_delay_analysis,
+                   select_metrics(cube, _plotted_metrics(cube, 'avg_delay_ms')), (15, 10), style),
+        figure_job('QuestionC-PLR-Analysis-WiFi6-vs-WiFi7.png', plot_plr_analysis,
+                   select_metrics(cube, _plotted_metrics(cube, 'packet_loss_percentage')), (15, 10), style),
+    ]
+
+def _error_bars(values, interval):
+    """
+    Error bar lengths below and above each value, or None without confidence intervals.
+    """
+    if interval is None:
+        return None
+    return np.vstack([values - interval[0], interval[1] - values])
+
+def _distance_panel_rows(cube):
+    """
+    Rows of panels needed for one panel per distance.
+    """
+    return max(1, math.ceil(len(cube_labels(cube, 'distance_numeric')) / DISTANCE_PANEL_COLUMNS))
+
+def _plot_distance_bars(fig, cube, column, ylabel, title, suptitle, value_format, label_offset):
+    """
+    Draw WiFi 6 vs WiFi 7 bars of one metric for every user count, one subplot per distance.
+    """
+    distances = cube_labels(cube, 'distance_numeric')
+    user_counts = cube_labels(cube, 'user_numeric')
     
-    # 1. Throughput Comparison for Each Distance
-    fig, axes = plt.subplots(2, 3, figsize=(18, 12))
-    fig.suptitle('WiFi 6 vs WiFi 7: Throughput Comparison at Each Distance', 
-                 fontsize=16, fontweight='bold')
+    # One panel per distance, as many rows as the distances need
+    rows = _distance_panel_rows(cube)
+    axes = fig.subplots(rows, DISTANCE_PANEL_COLUMNS, squeeze=False)
+    for ax in axes.flat[len(distances):]:
+        ax.set_visible(False)
+    fig.suptitle(suptitle, fontsize=16, fontweight='bold')
     
     for i, distance in enumerate(distances):
-        ax = axes[i//3, i%3]
+        ax = axes[i // DISTANCE_PANEL_COLUMNS, i % DISTANCE_PANEL_COLUMNS]
         
-        distance_data = df[df['distance_numeric'] == distance]
-        wifi6_data = distance_data[distance_data['wifi_type'] == 'WiFi6'].sort_values('user_numeric')
-        wifi7_data = distance_data[distance_data['wifi_type'] == 'WiFi7'].sort_values('user_numeric')
+        wifi6_users, wifi6_values = cube_series(cube, column, 'user_numeric', wifi_type='WiFi6', distance_numeric=distance)
+        wifi7_users, wifi7_values = cube_series(cube, column, 'user_numeric', wifi_type='WiFi7', distance_numeric=distance)
         
-        # Create bar positions
+        # Create bar positions (one group per user count)
         x = np.arange(len(user_counts))
         width = 0.35
+        wifi6_x = np.searchsorted(user_counts, wifi6_users) - width/2
+        wifi7_x = np.searchsorted(user_counts, wifi7_users) + width/2
         
-        # Create bars
-        bars1 = ax.bar(x - width/2, wifi6_data['avg_throughput_kbps'], width, 
-                      label='WiFi 6', color=wifi6_color, alpha=0.8, edgecolor='black')
-        bars2 = ax.bar(x + width/2, wifi7_data['avg_throughput_kbps'], width, 
-                      label='WiFi 7', color=wifi7_color, alpha=0.8, edgecolor='black')
-        
-        # Add value labels on bars
-        for bar, value in zip(bars1, wifi6_data['avg_throughput_kbps']):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + max(wifi6_data['avg_throughput_kbps'])*0.01,
-                   f'{value:.0f}', ha='center', va='bottom', fontsize=9, fontweight='bold')
+        # Confidence intervals across replications, drawn as error bars
+        wifi6_interval = _interval_series(cube, column, 'user_numeric', wifi_type='WiFi6', distance_numeric=distance)
+        wifi7_interval = _interval_series(cube, column, 'user_numeric', wifi_type='WiFi7', distance_numeric=distance)
         
-        for bar, value in zip(bars2, wifi7_data['avg_throughput_kbps']):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + max(wifi7_data['avg_throughput_kbps'])*0.01,
-                   f'{value:.0f}', ha='center', va='bottom', fontsize=9, fontweight='bold')
+        # Create bars
+        ax.bar(wifi6_x, wifi6_values, width, yerr=_error_bars(wifi6_values, wifi6_interval), capsize=4,
+               label='WiFi 6', color=WIFI6_COLOR, alpha=0.8, edgecolor='black')
+        ax.bar(wifi7_x, wifi7_values, width, yerr=_error_bars(wifi7_values, wifi7_interval), capsize=4,
+               label='WiFi 7', color=WIFI7_COLOR, alpha=0.8, edgecolor='black')
+        
+        # Add value labels on bars (above the error bar where there is one)
+        for centres, values, interval in ((wifi6_x, wifi6_values, wifi6_interval),
+                                          (wifi7_x, wifi7_values, wifi7_interval)):
+            if len(values):
+                tops = values if interval is None else np.fmax(values, interval[1])
+                annotate_points(ax, centres, tops + np.nanmax(tops)*label_offset, value_format,
+                                values=values, offset=(0, 0), va='bottom', fontsize=9, fontweight='bold')
         
         # Customize subplot
         ax.set_xlabel('Number of Users', fontweight='bold')
-        ax.set_ylabel('Throughput (Kbps)', fontweight='bold')
-        ax.set_title(f'Throughput at {distance}m Distance', fontweight='bold', pad=15)
+        ax.set_ylabel(ylabel, fontweight='bold')
+        ax.set_title(f'{title} at {distance}m Distance', fontweight='bold', pad=15)
         ax.set_xticks(x)
         ax.set_xticklabels([f'{u} users' for u in user_counts])
         ax.legend()
         ax.grid(True, alpha=0.3, axis='y')
     
-    plt.tight_layout()
-    plt.savefig('QuestionC-SideBySide-Throughput-Comparison.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    # Keep a fixed band at the top for the title, however tall the figure is
+    fig.tight_layout(rect=(0, 0, 1, 1 - 0.5 / fig.get_figheight()))
+
+def plot_side_by_side_throughput(fig, cube):
+    """
+    WiFi 6 vs WiFi 7 throughput at each distance.
+    
+    Args:
+        fig (matplotlib.figure.Figure): Figure to draw on
+        cube (dict): Scenario cube of the results (see sca_cube.build_cube)
+    """
+    _plot_distance_bars(fig, cube, 'avg_throughput_kbps', 'Throughput (Kbps)', 'Throughput',
+                        'WiFi 6 vs WiFi 7: Throughput Comparison at Each Distance', '{:.0f}', 0.01)
+
+def plot_side_by_side_delay(fig, cube):
+    """
+    WiFi 6 vs WiFi 7 delay at each distance.
+    
+    Args:
+        fig (matplotlib.figure.Figure): Figure to draw on
+        cube (dict): Scenario cube of the results (see sca_cube.build_cube)
+    """
+    _plot_distance_bars(fig, cube, 'avg_delay_ms', 'Average Delay (ms)', 'Delay',
+                        'WiFi 6 vs WiFi 7: Delay Comparison at Each Distance', '{:.1f}', 0.01)
+
+def plot_side_by_side_plr(fig, cube):
+    """
+    WiFi 6 vs WiFi 7 packet loss ratio at each distance.
     
-    # 2. Delay Comparison for Each Distance
-    fig, axes = plt.subplots(2, 3, figsize=(18, 12))
-    fig.suptitle('WiFi 6 vs WiFi 7: Delay Comparison at Each Distance', 
-                 fontsize=16, fontweight='bold')
+    Args:
+        fig (matplotlib.figure.Figure): Figure to draw on
+        cube (dict): Scenario cube of the results (see sca_cube.build_cube)
+    """
+    _plot_distance_bars(fig, cube, 'packet_loss_percentage', 'Packet Loss Ratio (%)', 'PLR',
+                        'WiFi 6 vs WiFi 7: Packet Loss Ratio Comparison at Each Distance', '{:.2f}%', 0.02)
+
+def create_side_by_side_distance_comparisons(cube):
+    """
+    Describe side-by-side comparisons for each distance, showing WiFi 6 vs WiFi 7
+    performance for all user counts at that specific distance.
     
-    for i, distance in enumerate(distances):
-        ax = axes[i//3, i%3]
-        
-        distance_data = df[df['distance_numeric'] == distance]
-        wifi6_data = distance_data[distance_data['wifi_type'] == 'WiFi6'].sort_values('user_numeric')
-        wifi7_data = distance_data[distance_data['wifi_type'] == 'WiFi7'].sort_values('user_numeric')
-        
-        x = np.arange(len(user_counts))
-        width = 0.35
-        
-        bars1 = ax.bar(x - width/2, wifi6_data['avg_delay_ms'], width, 
-                      label='WiFi 6', color=wifi6_color, alpha=0.8, edgecolor='black')
-        bars2 = ax.bar(x + width/2, wifi7_data['avg_delay_ms'], width, 
-                      label='WiFi 7', color=wifi7_color, alpha=0.8, edgecolor='black')
-        
-        # Add value labels
-        for bar, value in zip(bars1, wifi6_data['avg_delay_ms']):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + max(wifi6_data['avg_delay_ms'])*0.01,
-                   f'{value:.1f}', ha='center', va='bottom', fontsize=9, fontweight='bold')
-        
-        for bar, value in zip(bars2, wifi7_data['avg_delay_ms']):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + max(wifi7_data['avg_delay_ms'])*0.01,
-                   f'{value:.1f}', ha='center', va='bottom', fontsize=9, fontweight='bold')
+    Args:
+        cube (dict): Scenario cube of the results (see sca_cube.build_cube)
         
-        ax.set_xlabel('Number of Users', fontweight='bold')
-        ax.set_ylabel('Average Delay (ms)', fontweight='bold')
-        ax.set_title(f'Delay at {distance}m Distance', fontweight='bold', pad=15)
-        ax.set_xticks(x)
-        ax.set_xticklabels([f'{u} users' for u in user_counts])
-        ax.legend()
-        ax.grid(True, alpha=0.3, axis='y')
+    Returns:
+        list: Figure jobs for render_figures
+    """
+    print("\nCreating side-by-side distance comparison visualizations...")
     
-    plt.tight_layout()
-    plt.savefig('QuestionC-SideBySide-Delay-Comparison.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    style = {'font.size': 10}
+    size = (18, DISTANCE_PANEL_ROW_HEIGHT * _distance_panel_rows(cube))
+    return [
+        figure_job('QuestionC-SideBySide-Throughput-Comparison.png', plot_side_by_side_throughput,
+                   select_metrics(cube, _plotted_metrics(cube, 'avg_throughput_kbps')), size, style),
+        figure_job('QuestionC-SideBySide-Delay-Comparison.png', plot_side_by_side_delay,
+                   select_metrics(cube, _plotted_metrics(cube, 'avg_delay_ms')), size, style),
+        figure_job('QuestionC-SideBySide-PLR-Comparison.png', plot_side_by_side_plr,
+                   select_metrics(cube, _plotted_metrics(cube, 'packet_loss_percentage')), size, style),
+    ]
+
+def load_saved_results():
+    """
+    Load the results table of a previous run when plotting from saved results.
     
-    # 3. PLR Comparison for Each Distance
-    fig, axes = plt.subplots(2, 3, figsize=(18, 12))
-    fig.suptitle('WiFi 6 vs WiFi 7: Packet Loss Ratio Comparison at Each Distance', 
-                 fontsize=16, fontweight='bold')
+    Returns:
+        pandas.DataFrame: Contents of RESULTS_FILE, or None if the .sca files are to be processed
+    """
+    if not PLOT_FROM_RESULTS or not os.path.exists(RESULTS_FILE):
+        return None
+    print(f"Plotting from saved results in {RESULTS_FILE}")
+    return read_results(RESULTS_FILE)
+
+def report_results(df, interactive=False):
+    """
+    Print the summary, render the figures and save the results table.
     
-    for i, distance in enumerate(distances):
-        ax = axes[i//3, i%3]
-        
-        distance_data = df[df['distance_numeric'] == distance]
-        wifi6_data = distance_data[distance_data['wifi_type'] == 'WiFi6'].sort_values('user_numeric')
-        wifi7_data = distance_data[distance_data['wifi_type'] == 'WiFi7'].sort_values('user_numeric')
-        
-        x = np.arange(len(user_counts))
-        width = 0.35
-        
-        bars1 = ax.bar(x - width/2, wifi6_data['packet_loss_percentage'], width, 
-                      label='WiFi 6', color=wifi6_color, alpha=0.8, edgecolor='black')
-        bars2 = ax.bar(x + width/2, wifi7_data['packet_loss_percentage'], width, 
-                      label='WiFi 7', color=wifi7_color, alpha=0.8, edgecolor='black')
-        
-        # Add value labels
-        for bar, value in zip(bars1, wifi6_data['packet_loss_percentage']):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + max(wifi6_data['packet_loss_percentage'])*0.02,
-                   f'{value:.2f}%', ha='center', va='bottom', fontsize=9, fontweight='bold')
-        
-        for bar, value in zip(bars2, wifi7_data['packet_loss_percentage']):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + max(wifi7_data['packet_loss_percentage'])*0.02,
-                   f'{value:.2f}%', ha='center', va='bottom', fontsize=9, fontweight='bold')
+    Args:
+        df (pandas.DataFrame): Results table from create_summary_dataframe
+        interactive (bool): Also show each figure in a window
         
-        ax.set_xlabel('Number of Users', fontweight='bold')
-        ax.set_ylabel('Packet Loss Ratio (%)', fontweight='bold')
-        ax.set_title(f'PLR at {distance}m Distance', fontweight='bold', pad=15)
-        ax.set_xticks(x)
-        ax.set_xticklabels([f'{u} users' for u in user_counts])
-        ax.legend()
-        ax.grid(True, alpha=0.3, axis='y')
+    Returns:
+        list: Paths of the figures that were saved
+    """
+    # Materialise the scenario cube the summary and plots read their panels from
+    cube = build_cube(df, SCENARIO_AXES, cube_metrics(df))
     
-    plt.tight_layout()
-    plt.savefig('QuestionC-SideBySide-PLR-Comparison.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    # Print comprehensive summary
+    print_comprehensive_summary(cube)
+    
+    # Render the comparative visualizations (user-based) and side-by-side distance comparisons
+    figures = render_figures(create_comparative_visualizations(cube) + create_side_by_side_distance_comparisons(cube),
+                   workers=RENDER_WORKERS, interactive=interactive,
+                   cache=FIGURE_CACHE)
+    
+    # Save the results table
+    write_results(df, RESULTS_FILE)
+    
+    return figures
+
+def watch_scenarios():
+    """
+    Keep the results up to date while simulations are still writing their files.
+    
+    SCENARIO_DIRECTORIES are polled every WATCH_INTERVAL_SEC. Each newly finished .sca
+    file is parsed once, and its metrics are kept alongside those of the runs analysed
+    earlier. The results table, per-run table and figures are then updated. Figures whose
+    data has not changed are copied from FIGURE_CACHE rather than redrawn. Files still
+    being written are left alone until they have settled. A rewritten file is analysed
+    again, and a deleted one drops out of the results. Runs until interrupted (Ctrl+C).
+    """
+    print(f"Watching {', '.join(SCENARIO_DIRECTORIES)} for finished .sca files (Ctrl+C to stop)")
+    print("=" * 70)
+    
+    finished = set()
+    metrics = {}  # Path -> run metrics of every finished file analysed so far
+    try:
+        for completed, removed in iter_completed_files(SCENARIO_DIRECTORIES, WATCH_INTERVAL_SEC, WATCH_SETTLE_SEC):
+            finished.update(completed)
+            finished.difference_update(removed)
+            for path in completed + removed:
+                metrics.pop(path, None)
+            
+            # Scenario table of the finished files only - a newer rerun that is still being
+            # written does not supersede the last finished one yet
+            table = discover_scenarios(SCENARIO_DIRECTORIES, keep='all')
+            table = table[table['path'].isin(finished)]
+            if not REPLICATIONS:
+                table = table.drop_duplicates(SCENARIO_KEYS, keep='last')
+            
+            new = table[~table['path'].isin(metrics)]
+            if new.empty and not removed:
+                continue
+            print(f"\n{time.strftime('%H:%M:%S')} - {len(new)} new run(s), {len(removed)} removed")
+            for row in iter_run_metrics(list(new['path']), simTime, workers=PARSE_WORKERS, cache=PARSE_CACHE,
+                                        stations=True, durations=scenario_durations(new, DURATION_OVERRIDES)):
+                metrics[row['file']] = row
+            
+            runs = [(scenario, metrics[scenario[3]]) for scenario in scenario_labels(table) if scenario[3] in metrics]
+            if not runs:
+                continue
+            results = pd.DataFrame([scenario_result(wifi_type, distance, user_count, row)
+                                    for (wifi_type, distance, user_count, filename), row in runs])
+            report_results(create_summary_dataframe(results))
+            if RESULTS_STREAM is not None:
+                write_results(pd.DataFrame([row for scenario, row in runs]), RESULTS_STREAM)
+            print(f"Updated {RESULTS_FILE} and figures from {len(runs)} run(s)")
+    except KeyboardInterrupt:
+        print("\nStopped watching")
 
 def main():
     """
     Main function to orchestrate the comprehensive WiFi 6 vs WiFi 7 analysis.
     """
-    # Process all scenarios
-    results = process_all_scenarios()
-    
-    if not results:
-        print("No valid results obtained. Exiting...")
+    if WATCH:
+        watch_scenarios()
         return
     
-    # Create comprehensive DataFrame
-    df = create_summary_dataframe(results)
-    
-    # Print comprehensive summary
-    print_comprehensive_summary(df)
-    
-    # Create original comparative visualizations (user-based)
-    create_comparative_visualizations(df)
-    
-    # Create new side-by-side distance comparisons
-    create_side_by_side_distance_comparisons(df)
+    df = load_saved_results()
+    if df is None:
+        # Process all scenarios
+        results = process_all_scenarios()
+        
+        if results.empty:
+            print("No valid results obtained. Exiting...")
+            return
+        
+        # Create comprehensive DataFrame
+        df = create_summary_dataframe(results)
     
-    # Save results to CSV
-    df.to_csv('QuestionC-WiFi6-vs-WiFi7-Analysis.csv', index=False)
+    figures = report_results(df, INTERACTIVE)
     
     print("\nAnalysis complete!")
     print("\nGenerated files:")
-    print("- QuestionC-Throughput-Analysis-WiFi6-vs-WiFi7.png")
-    print("- QuestionC-Delay-Analysis-WiFi6-vs-WiFi7.png") 
-    print("- QuestionC-PLR-Analysis-WiFi6-vs-WiFi7.png")
-    print("- QuestionC-SideBySide-Throughput-Comparison.png")
-    print("- QuestionC-SideBySide-Delay-Comparison.png")
-    print("- QuestionC-SideBySide-PLR-Comparison.png")
-    print("- QuestionC-WiFi6-vs-WiFi7-Analysis.csv")
+    for path in figures:
+        print(f"- {path}")
+    print(f"- {RESULTS_FILE}")
 
     # Execute the analysis
 if __name__ == "__main__":
@@ -0,0 +1,314 @@
+"""
+Network Performance EEN1058
+Author: Kyle Sheehy
+Date: October 2025
+
+Benchmark of the QuestionC parse -> metrics -> plot pipeline on synthetic sweeps.
+
+A synthetic sweep is written in the QuestionC layout: WiFi 6 and WiFi 7 runs for every
+distance and user count, each repeated a number of times, with one sender/receiver/delay
+block per receiving station as in the real multi-user runs. Each pipeline stage is then
+timed separately:
+
+- discovery: scenario table from the directory listing
+- parse: ingesting every file into the columnar store (and a warm rerun through the
+  parse cache with --cache)
+- metrics: run and per-station metrics of every run
+- dataframe: QuestionC results rows and summary DataFrame
+- cube: scenario cube the QuestionC summary and plots read from
+- write: saving the results table
+- render: the six QuestionC figures (from the first run of each scenario)
+
+Every stage reports its time, files/s and scalars/s, and the peak RSS so far. The
+report is saved as JSON together with the commit it was measured on, so runs on
+different commits can be compared with --compare.
+
+Usage:
+    python benchmark.py --users 1 10 20 50 500 --reruns 4 --output before.json
+    python benchmark.py --users 1 10 20 50 500 --reruns 4 --output after.json --compare before.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+try:
+    import resource
+except ImportError:  # Not available on Windows - peak RSS is not reported
+    resource = None
+
+import QuestionC
+from sca_cube import build_cube
+from sca_discovery import discover_scenarios
+from sca_output import write_results
+from sca_render import render_figures
+from sca_store import compute_run_metrics, compute_station_metrics, load_scalar_store
+from sca_synthetic import BASE_TIMESTAMP, write_synthetic_sca
+
+# Default sweep - the QuestionC grid, one run per scenario
+WIFI_TYPES = ['WiFi6_80211ax', 'WiFi7_80211be']
+DISTANCES_M = [0, 30, 60, 90, 120, 150]
+USER_COUNTS = [1, 10, 20, 50]
+RERUNS = 1
+
+# Duration of the synthetic runs (see sca_synthetic for their traffic)
+SIMULATION_TIME_SEC = 20.0
+
+RENDER_WORKERS = 4
+REPEAT = 1
+OUTPUT = "benchmark.json"
+
+def generate_sweep(directory, wifi_types, distances, user_counts, reruns, seed=0):
+    """
+    Write a synthetic sweep in the QuestionC file layout.
+
+    Args:
+        directory (str): Output directory
+        wifi_types (list): WiFi types with their standard (e.g. 'WiFi6_80211ax')
+        distances (list): Distances in metres
+        user_counts (list): Receiving stations per run
+        reruns (int): Runs per scenario (each a separate file with its own timestamp)
+        seed (int): Random seed
+
+    Returns:
+        dict: 'files', 'scalars' and 'bytes' of the sweep
+    """
+    rng = np.random.default_rng(seed)
+    files = scalars = 0
+    for wifi in wifi_types:
+        for distance in distances:
+            for users in user_counts:
+                for rerun in range(reruns):
+                    timestamp = BASE_TIMESTAMP + rerun
+                    path = os.path.join(directory, f"DataOfUser1-run-{timestamp}-{distance}m-{users}users-"
+                                                   f"{wifi}-run-{timestamp}.sca")
+                    scalars += write_synthetic_sca(path, f"run-{timestamp}", f"dist{distance}_users{users}_{wifi}",
+                                                   users, rng)
+                    files += 1
+    size = sum(entry.stat().st_size for entry in os.scandir(directory))
+    return {'files': files, 'scalars': scalars, 'bytes': size}
+
+def peak_rss_mb():
+    """
+    Peak resident set size of this process and its finished worker processes.
+
+    Returns:
+        float: Peak RSS in MB, or None where the resource module is unavailable
+    """
+    if resource is None:
+        return None
+    scale = 1024 if platform.system() != 'Darwin' else 1  # ru_maxrss is in KB on Linux, bytes on macOS
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale
+    return round(max(own, children) / 1e6, 1)
+
+def _timed(stages, name, function, files, scalars):
+    """
+    Run one stage and record its time, throughput and the peak RSS so far.
+    """
+    start = time.perf_counter()
+    result = function()
+    seconds = time.perf_counter() - start
+    stages[name] = {
+        'seconds': seconds,
+        'files_per_sec': files / seconds if seconds > 0 else None,
+        'scalars_per_sec': scalars / seconds if seconds > 0 else None,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+    return result
+
+def _build_results(table, store, metrics):
+    """
+    QuestionC results rows of every run, as the script builds them.
+    """
+    labels = {row.path: (row.wifi_type, f"{row.distance_m}m", f"users_{row.users}") for row in table.itertuples()}
+    columns = [(name, values.tolist()) for name, values in metrics.items()]
+    results = []
+    for run, filename in enumerate(store['files']):
+        row = {name: values[run] for name, values in columns}
+        results.append(QuestionC.scenario_result(*labels[filename], row))
+    return QuestionC.create_summary_dataframe(pd.DataFrame(results))
+
+def _render(df, directory, workers):
+    """
+    Render the six QuestionC figures of the first run of each scenario in the sweep.
+    """
+    grid = df.drop_duplicates(['wifi_type', 'distance_numeric', 'user_numeric'])
+    cube = build_cube(grid, QuestionC.SCENARIO_AXES, QuestionC.cube_metrics(grid))
+    jobs = QuestionC.create_comparative_visualizations(cube) + QuestionC.create_side_by_side_distance_comparisons(cube)
+    for job in jobs:
+        job['path'] = os.path.join(directory, job['path'])
+    return render_figures(jobs, workers=workers)
+
+def run_pipeline(directory, sweep, workers=1, cache=None, render_workers=RENDER_WORKERS, results_format='csv'):
+    """
+    Time every stage of the pipeline once.
+
+    Args:
+        directory (str): Directory holding the synthetic sweep
+        sweep (dict): Sweep summary from generate_sweep
+        workers (int): Parse processes
+        cache (str): Parse cache path for a warm parse stage, or None
+        render_workers (int): Render processes (0 skips the render stage)
+        results_format (str): 'csv' or 'parquet'
+
+    Returns:
+        dict: Stage name -> 'seconds', 'files_per_sec', 'scalars_per_sec', 'peak_rss_mb'
+    """
+    files, scalars = sweep['files'], sweep['scalars']
+    stages = {}
+    output = tempfile.mkdtemp(prefix='sca-benchmark-out-')
+    try:
+        table = _timed(stages, 'discovery', lambda: discover_scenarios([directory], keep='all'), files, scalars)
+        paths = list(table['path'])
+        store = _timed(stages, 'parse', lambda: load_scalar_store(paths, workers=workers, cache=cache), files, scalars)
+        if cache is not None:
+            store = _timed(stages, 'parse_cached', lambda: load_scalar_store(paths, workers=workers, cache=cache),
+                           files, scalars)
+
+        def metrics():
+            values = compute_run_metrics(store, SIMULATION_TIME_SEC)
+            values.update(compute_station_metrics(store, SIMULATION_TIME_SEC))
+            return values
+
+        values = _timed(stages, 'metrics', metrics, files, scalars)
+        df = _timed(stages, 'dataframe', lambda: _build_results(table, store, values), files, scalars)
+        _timed(stages, 'cube', lambda: build_cube(df, QuestionC.SCENARIO_AXES, QuestionC.cube_metrics(df)), files, scalars)
+        results_path = os.path.join(output, f"results.{results_format}")
+        _timed(stages, 'write', lambda: write_results(df, results_path), files, scalars)
+        if render_workers > 0:
+            rendered = _timed(stages, 'render', lambda: _render(df, output, render_workers), files, scalars)
+            if len(rendered) < 6:
+                print(f"Warning: Only {len(rendered)} of the 6 figures rendered")
+    finally:
+        shutil.rmtree(output, ignore_errors=True)
+    return stages
+
+def _git_commit():
+    """
+    Commit the benchmark runs on (with a '-dirty' suffix for uncommitted changes).
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=here, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=here,
+                               capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return commit + ('-dirty' if dirty else '')
+
+def compare_reports(report, baseline):
+    """
+    Print the stage times of a report against a baseline report.
+
+    Args:
+        report (dict): Current benchmark report
+        baseline (dict): Earlier benchmark report
+    """
+    if baseline['sweep'] != report['sweep']:
+        print("Warning: The baseline was measured on a different sweep")
+    print(f"\nComparison with {baseline.get('commit') or 'baseline'}:")
+    for name, stage in report['stages'].items():
+        before = baseline['stages'].get(name)
+        if before is None:
+            print(f"  {name:<13} {stage['seconds']:8.3f} s  (not in baseline)")
+            continue
+        change = (stage['seconds'] - before['seconds']) / before['seconds'] * 100 if before['seconds'] else 0.0
+        print(f"  {name:<13} {stage['seconds']:8.3f} s  vs {before['seconds']:8.3f} s  ({change:+.1f}%)")
+
+def print_report(report):
+    """
+    Print the stage times and throughputs of a report.
+
+    Args:
+        report (dict): Benchmark report
+    """
+    sweep = report['sweep']
+    print(f"\nSweep: {sweep['files']} files, {sweep['scalars']} scalars, {sweep['bytes'] / 1e6:.1f} MB "
+          f"(users per run: {report['config']['user_counts']})")
+    print(f"{'stage':<13} {'seconds':>9} {'files/s':>10} {'scalars/s':>12} {'peak RSS':>10}")
+    for name, stage in report['stages'].items():
+        rss = '-' if stage['peak_rss_mb'] is None else f"{stage['peak_rss_mb']:.0f} MB"
+        print(f"{name:<13} {stage['seconds']:9.3f} {stage['files_per_sec']:10.1f} "
+              f"{stage['scalars_per_sec']:12.0f} {rss:>10}")
+
+def main():
+    """
+    Generate the synthetic sweep, time the pipeline and save the JSON report.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the QuestionC parse -> metrics -> plot pipeline")
+    parser.add_argument('--users', type=int, nargs='+', default=USER_COUNTS, help="receiving stations per run")
+    parser.add_argument('--distances', type=int, nargs='+', default=DISTANCES_M, help="distances in metres")
+    parser.add_argument('--reruns', type=int, default=RERUNS, help="runs (files) per scenario")
+    parser.add_argument('--workers', type=int, default=1, help="parse processes")
+    parser.add_argument('--render-workers', type=int, default=RENDER_WORKERS, help="render processes (0 skips rendering)")
+    parser.add_argument('--cache', action='store_true', help="also time a warm parse through the parse cache")
+    parser.add_argument('--format', choices=['csv', 'parquet'], default='csv', help="results table format")
+    parser.add_argument('--repeat', type=int, default=REPEAT, help="repetitions (the fastest time of each stage is kept)")
+    parser.add_argument('--directory', help="write the sweep here and keep it (default: a temporary directory)")
+    parser.add_argument('--output', default=OUTPUT, help="JSON report path")
+    parser.add_argument('--compare', help="earlier JSON report to compare against")
+    args = parser.parse_args()
+
+    directory = args.directory or tempfile.mkdtemp(prefix='sca-benchmark-')
+    os.makedirs(directory, exist_ok=True)
+    cache = os.path.join(directory, 'parse-cache.sqlite') if args.cache else None
+    try:
+        start = time.perf_counter()
+        sweep = generate_sweep(directory, WIFI_TYPES, args.distances, args.users, args.reruns)
+        print(f"Generated {sweep['files']} files in {time.perf_counter() - start:.1f} s")
+
+        stages = {}
+        for repetition in range(args.repeat):
+            if cache is not None and os.path.exists(cache):
+                os.remove(cache)
+            for name, stage in run_pipeline(directory, sweep, args.workers, cache, args.render_workers,
+                                            args.format).items():
+                if name not in stages or stage['seconds'] < stages[name]['seconds']:
+                    stages[name] = stage
+    finally:
+        if args.directory is None:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    report = {
+        'commit': _git_commit(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'platform': platform.platform(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'config': {
+            'user_counts': args.users,
+            'distances_m': args.distances,
+            'reruns': args.reruns,
+            'workers': args.workers,
+            'render_workers': args.render_workers,
+            'cache': args.cache,
+            'format': args.format,
+            'repeat': args.repeat,
+        },
+        'sweep': sweep,
+        'stages': stages,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+    print_report(report)
+
+    with open(args.output, 'w') as file:
+        json.dump(report, file, indent=1)
+    print(f"\nReport saved to {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r') as file:
+            compare_reports(report, json.load(file))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Network Performance EEN1058
+Author: Kyle Sheehy
+Date: October 2025
+
+Mergeable delay aggregates.
+
+A delay aggregate is the count, total, min and max of a set of packet delays (in
+nanoseconds), built from the delay-count/delay-total/delay-min/delay-max scalars of a
+receiver block. Unlike averages, aggregates of disjoint sets combine exactly: counts
+and totals add and the extremes take the min/max. Receiver blocks, runs or shards of
+a sweep processed by different workers can therefore be reduced in any order without
+re-reading the files, and the pooled mean is only formed at the end as total / count.
+
+An aggregate is a dict holding either plain numbers or NumPy arrays (one entry per
+block, run or group) - the functions work element-wise on both.
+"""
+
+import numpy as np
+
+DELAY_FIELDS = ('count', 'total', 'min', 'max')
+
+def empty_delay_aggregate(size=None):
+    """
+    Aggregate of no delays - the identity of merge_delay_aggregates.
+
+    Args:
+        size (int): Number of entries for an array aggregate, or None for a single one
+
+    Returns:
+        dict: 'count', 'total', 'min' (+inf) and 'max' (-inf)
+    """
+    if size is None:
+        return {'count': 0, 'total': 0.0, 'min': np.inf, 'max': -np.inf}
+    return {
+        'count': np.zeros(size),
+        'total': np.zeros(size),
+        'min': np.full(size, np.inf),
+        'max': np.full(size, -np.inf),
+    }
+
+def block_delay_aggregate(delay):
+    """
+    Aggregate of one receiver block.
+
+    The total is taken from delay-total; files without it fall back to
+    delay-average * delay-count.
+
+    Args:
+        delay (dict): The block's delay-* scalars without the prefix ('count', 'total', 'average', ...)
+
+    Returns:
+        dict: Delay aggregate (empty if the block received nothing)
+    """
+    count = delay.get('count', 0)
+    if count <= 0:
+        return empty_delay_aggregate()
+    total = delay['total'] if 'total' in delay else delay.get('average', 0) * count
+    return {
+        'count': count,
+        'total': total,
+        'min': delay.get('min', np.inf),
+        'max': delay.get('max', -np.inf),
+    }
+
+def merge_delay_aggregates(first, second):
+    """
+    Combine the aggregates of two disjoint sets of delays.
+
+    Args:
+        first (dict): Delay aggregate
+        second (dict): Delay aggregate of the same shape
+
+    Returns:
+        dict: Aggregate of both sets
+    """
+    return {
+        'count': first['count'] + second['count'],
+        'total': first['total'] + second['total'],
+        'min': np.minimum(first['min'], second['min']),
+        'max': np.maximum(first['max'], second['max']),
+    }
+
+def reduce_delay_aggregates(aggregate, groups, group_count):
+    """
+    Merge the entries of an array aggregate by group in one vectorized pass
+    (e.g. receiver blocks into runs, or runs into scenarios).
+
+    Args:
+        aggregate (dict): Array aggregate
+        groups (numpy.ndarray): Group index of every entry
+        group_count (int): Number of groups
+
+    Returns:
+        dict: Array aggregate with one entry per group
+    """
+    reduced = empty_delay_aggregate(group_count)
+    reduced['count'] = np.bincount(groups, weights=aggregate['count'], minlength=group_count)
+    reduced['total'] = np.bincount(groups, weights=aggregate['total'], minlength=group_count)
+    np.minimum.at(reduced['min'], groups, aggregate['min'])
+    np.maximum.at(reduced['max'], groups, aggregate['max'])
+    return reduced
+
+def pooled_delay(aggregate):
+    """
+    Pooled mean and extremes of an aggregate.
+
+    Args:
+        aggregate (dict): Delay aggregate
+
+    Returns:
+        dict: 'mean', 'min' and 'max' in nanoseconds (0 where no delay was recorded)
+    """
+    count = np.asarray(aggregate['count'], dtype=float)
+    total = np.asarray(aggregate['total'], dtype=float)
+    has_delays = count > 0
+    pooled = {
+        'mean': np.divide(total, count, out=np.zeros(count.shape), where=has_delays),
+        'min': np.where(has_delays, aggregate['min'], 0.0),
+        'max': np.where(has_delays, aggregate['max'], 0.0),
+    }
+    if count.ndim == 0:
+        return {name: float(value) for name, value in pooled.items()}
+    return pooled
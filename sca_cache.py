@@ -0,0 +1,192 @@
+"""
+Network Performance EEN1058
+Author: Kyle Sheehy
+Date: October 2025
+
+Persistent parse cache for OMNeT++ scalar results (.sca) files.
+
+Simulation outputs never change once written, so the columnar chunk produced by
+sca_store.parse_file_chunk is kept in an SQLite sidecar. Entries are keyed on the
+file path and validated against its size, mtime and a content hash, so a rerun over
+unchanged files does no parse work at all. The cache is bounded in size and evicts the
+least recently used entries first.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import struct
+import time
+
+import numpy as np
+
+DEFAULT_CACHE_BYTES = 256 * 1024 * 1024  # 256 MB of cached chunks
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS chunks (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    payload_size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS chunks_last_used ON chunks (last_used);
+"""
+
+# Payload format - bumped when parse_file_chunk starts producing different chunks,
+# so entries written by older versions are re-parsed
+CHUNK_FORMAT = 2
+
+# Column arrays of a chunk in payload order, with their dtypes
+_ARRAYS = (('module', np.int32), ('metric', np.int32), ('block', np.int32), ('value', np.float64))
+
+def open_parse_cache(cache_path):
+    """
+    Open (creating if needed) the parse cache database.
+
+    Args:
+        cache_path (str): Path of the SQLite sidecar file
+
+    Returns:
+        sqlite3.Connection: Open cache connection
+    """
+    connection = sqlite3.connect(cache_path)
+    connection.executescript(_SCHEMA)
+    return connection
+
+def file_content_hash(filename):
+    """
+    Hash the content of a file.
+
+    Args:
+        filename (str): Path to the file
+
+    Returns:
+        str: Hex digest of the file content
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(filename, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def encode_chunk(chunk):
+    """
+    Serialise a parsed chunk to a compact binary payload.
+
+    Layout: 4 byte header length, JSON header (format, run id, duration, string tables,
+    array lengths), then the raw bytes of the module, metric, block and value arrays.
+
+    Args:
+        chunk (dict): Chunk returned by sca_store.parse_file_chunk
+
+    Returns:
+        bytes: Binary payload
+    """
+    header = json.dumps({
+        'format': CHUNK_FORMAT,
+        'run_id': chunk['run_id'],
+        'duration': chunk['duration'],
+        'modules': chunk['modules'],
+        'metrics': chunk['metrics'],
+        'block_count': chunk['block_count'],
+        'rows': len(chunk['value']),
+    }).encode('utf-8')
+    body = b''.join(np.ascontiguousarray(chunk[name], dtype=dtype).tobytes() for name, dtype in _ARRAYS)
+    return struct.pack('<I', len(header)) + header + body
+
+def decode_chunk(payload):
+    """
+    Rebuild a parsed chunk from its binary payload.
+
+    Args:
+        payload (bytes): Payload produced by encode_chunk
+
+    Returns:
+        dict: Chunk in the sca_store.parse_file_chunk format, or None if the payload
+              was written in an older format
+    """
+    (header_size,) = struct.unpack_from('<I', payload)
+    header = json.loads(payload[4:4 + header_size].decode('utf-8'))
+    if header.pop('format', None) != CHUNK_FORMAT:
+        return None
+    rows = header.pop('rows')
+
+    chunk = header
+    offset = 4 + header_size
+    for name, dtype in _ARRAYS:
+        chunk[name] = np.frombuffer(payload, dtype=dtype, count=rows, offset=offset)
+        offset += rows * np.dtype(dtype).itemsize
+    return chunk
+
+def cache_lookup(connection, filename):
+    """
+    Look up the cached chunk of a file.
+
+    A matching size and mtime is a hit without reading the file. If only the mtime
+    changed the content hash is compared, so touched-but-identical files still hit.
+    Stale entries and entries in an older payload format are dropped.
+
+    Args:
+        connection (sqlite3.Connection): Open cache connection
+        filename (str): Path to the .sca file
+
+    Returns:
+        tuple: (chunk or None on a miss, os.stat_result taken before the lookup)
+    """
+    stat = os.stat(filename)
+    path = os.path.abspath(filename)
+    row = connection.execute(
+        "SELECT size, mtime_ns, content_hash, payload FROM chunks WHERE path = ?", (path,)).fetchone()
+    if row is None:
+        return None, stat
+
+    size, mtime_ns, content_hash, payload = row
+    if size == stat.st_size and mtime_ns != stat.st_mtime_ns:
+        if file_content_hash(filename) == content_hash:
+            connection.execute("UPDATE chunks SET mtime_ns = ? WHERE path = ?", (stat.st_mtime_ns, path))
+            mtime_ns = stat.st_mtime_ns
+
+    chunk = decode_chunk(payload)
+    if chunk is None or size != stat.st_size or mtime_ns != stat.st_mtime_ns:
+        connection.execute("DELETE FROM chunks WHERE path = ?", (path,))
+        return None, stat
+
+    connection.execute("UPDATE chunks SET last_used = ? WHERE path = ?", (time.time(), path))
+    return chunk, stat
+
+def cache_store(connection, filename, stat, chunk):
+    """
+    Store the parsed chunk of a file.
+
+    Args:
+        connection (sqlite3.Connection): Open cache connection
+        filename (str): Path to the .sca file
+        stat (os.stat_result): File stat taken before the file was parsed
+        chunk (dict): Chunk returned by sca_store.parse_file_chunk
+    """
+    payload = encode_chunk(chunk)
+    connection.execute(
+        "INSERT OR REPLACE INTO chunks (path, size, mtime_ns, content_hash, payload, payload_size, last_used) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (os.path.abspath(filename), stat.st_size, stat.st_mtime_ns, file_content_hash(filename),
+         payload, len(payload), time.time()))
+
+def evict_lru(connection, max_bytes=DEFAULT_CACHE_BYTES):
+    """
+    Evict least recently used entries until the cached payloads fit in max_bytes.
+
+    Args:
+        connection (sqlite3.Connection): Open cache connection
+        max_bytes (int): Size bound for the cached payloads
+    """
+    connection.execute(
+        "DELETE FROM chunks WHERE path IN ("
+        "  SELECT path FROM ("
+        "    SELECT path, SUM(payload_size) OVER (ORDER BY last_used DESC, path) AS running"
+        "    FROM chunks)"
+        "  WHERE running > ?)",
+        (max_bytes,))
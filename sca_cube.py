@@ -0,0 +1,148 @@
+"""
+Network Performance EEN1058
+Author: Kyle Sheehy
+Date: October 2025
+
+Pre-aggregated scenario cube.
+
+The results table is materialised once into a dense NumPy array with one axis per
+scenario parameter (e.g. wifi_type x distance x users) and a last axis for the metrics.
+Every axis has a sorted label array and a label -> position index, so the values of a
+panel (one metric for fixed values of some parameters) are read as a slice of the array
+after a dictionary lookup per parameter, instead of masking the whole table for every
+panel. A boolean 'present' array marks the cells that hold a scenario; the metric
+values of absent cells are NaN.
+
+A cube is a plain dict, so it pickles cheaply to render workers and hashes for the
+figure cache.
+"""
+
+import numpy as np
+
+def build_cube(df, axes, metrics):
+    """
+    Materialise a results table into a scenario cube.
+
+    Args:
+        df (pandas.DataFrame): Results table, at most one row per scenario
+        axes (list): Columns identifying a scenario, one cube axis each
+        metrics (list): Metric columns stored along the last axis
+
+    Returns:
+        dict: 'axes', 'labels' (axis -> sorted labels), 'index' (axis -> label ->
+              position), 'metrics', 'metric_index', 'values' (axes x metrics, NaN
+              where absent) and 'present' (axes, True where a scenario exists)
+    """
+    labels = {axis: np.unique(df[axis].to_numpy()) for axis in axes}
+    codes = tuple(np.searchsorted(labels[axis], df[axis].to_numpy()) for axis in axes)
+    shape = tuple(len(labels[axis]) for axis in axes)
+
+    values = np.full(shape + (len(metrics),), np.nan)
+    values[codes] = df[list(metrics)].to_numpy(dtype=float)
+    present = np.zeros(shape, dtype=bool)
+    present[codes] = True
+
+    return {
+        'axes': list(axes),
+        'labels': labels,
+        'index': {axis: {label: i for i, label in enumerate(labels[axis].tolist())} for axis in axes},
+        'metrics': list(metrics),
+        'metric_index': {metric: i for i, metric in enumerate(metrics)},
+        'values': values,
+        'present': present,
+    }
+
+def select_metrics(cube, metrics):
+    """
+    Cube holding only some of the metrics (e.g. the one a figure plots).
+
+    Args:
+        cube (dict): Scenario cube
+        metrics (list): Metrics to keep
+
+    Returns:
+        dict: Scenario cube with the same axes and only those metrics
+    """
+    positions = [cube['metric_index'][metric] for metric in metrics]
+    return dict(cube, metrics=list(metrics), metric_index={metric: i for i, metric in enumerate(metrics)},
+                values=cube['values'][..., positions])
+
+def cube_labels(cube, axis):
+    """
+    Labels of one axis, in axis order.
+
+    Args:
+        cube (dict): Scenario cube
+        axis (str): Axis name
+
+    Returns:
+        numpy.ndarray: Sorted labels
+    """
+    return cube['labels'][axis]
+
+def _selection_key(cube, selection):
+    """
+    Index tuple fixing the selected axes, or None if a selected label is not in the cube.
+    """
+    key = []
+    for axis in cube['axes']:
+        if axis in selection:
+            position = cube['index'][axis].get(selection[axis])
+            if position is None:
+                return None
+            key.append(position)
+        else:
+            key.append(slice(None))
+    return tuple(key)
+
+def cube_slice(cube, metric, **selection):
+    """
+    Values of one metric with some axes fixed.
+
+    Args:
+        cube (dict): Scenario cube
+        metric (str): Metric name
+        **selection: Axis name -> label to fix (e.g. wifi_type='WiFi6')
+
+    Returns:
+        numpy.ndarray: Values over the remaining axes, in cube axis order (NaN where
+                       no scenario exists or a selected label is unknown)
+    """
+    key = _selection_key(cube, selection)
+    if key is None:
+        shape = tuple(len(cube['labels'][axis]) for axis in cube['axes'] if axis not in selection)
+        return np.full(shape, np.nan)
+    return cube['values'][key + (cube['metric_index'][metric],)]
+
+def cube_present(cube, **selection):
+    """
+    Which scenarios exist with some axes fixed.
+
+    Args:
+        cube (dict): Scenario cube
+        **selection: Axis name -> label to fix
+
+    Returns:
+        numpy.ndarray: Boolean array over the remaining axes
+    """
+    key = _selection_key(cube, selection)
+    if key is None:
+        shape = tuple(len(cube['labels'][axis]) for axis in cube['axes'] if axis not in selection)
+        return np.zeros(shape, dtype=bool)
+    return cube['present'][key]
+
+def cube_series(cube, metric, axis, **selection):
+    """
+    One metric along one axis, with every other axis fixed, for the scenarios that exist.
+
+    Args:
+        cube (dict): Scenario cube
+        metric (str): Metric name
+        axis (str): Axis the series runs along
+        **selection: Label of every other axis
+
+    Returns:
+        tuple: (labels, values) arrays of the existing scenarios, in label order
+    """
+    present = cube_present(cube, **selection)
+    return cube_labels(cube, axis)[present], cube_slice(cube, metric, **selection)[present]
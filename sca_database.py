@@ -0,0 +1,367 @@
+"""
+Network Performance EEN1058
+Author: Kyle Sheehy
+Date: October 2025
+
+Embedded SQLite results database that accumulates runs across sweeps.
+
+Each imported .sca file becomes a row of the runs table. The row holds:
+- the run id, experiment and measurement;
+- the scenario parameters (WiFi type, distance, users, bit rate), taken from the file
+  name and measurement label as in sca_discovery;
+- the simulated duration;
+- the size, mtime and content hash of the file.
+
+The header attributes, itervars and config entries go into the attributes table. Every
+numeric scalar goes into the scalars table, with its receiver block number local to the
+run. Module and metric names are stored once in their own tables.
+
+Files are parsed with the columnar parser of sca_store and inserted one batch of runs
+per transaction. Files that are already in the database unchanged are skipped, so
+re-importing a results directory only adds what is new. Runs are looked up through
+indexes on (experiment, measurement) and the scenario parameters, and their scalars
+through an index on (run, metric). Queries then rebuild a columnar store straight from
+the database, so the usual run and station metrics are computed for any selection of
+runs without re-parsing files.
+"""
+
+import os
+import sqlite3
+import time
+
+import numpy as np
+import pandas as pd
+
+from sca_cache import DEFAULT_CACHE_BYTES, file_content_hash
+from sca_discovery import iter_sca_paths, parse_measurement, parse_scenario_name
+from sca_parser import read_sca_header
+from sca_store import DEFAULT_BATCH_RUNS, compute_run_metrics, compute_station_metrics, iter_scalar_stores
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    run_id TEXT,
+    experiment TEXT,
+    measurement TEXT,
+    wifi_type TEXT,
+    wifi_standard TEXT,
+    distance_m INTEGER,
+    users INTEGER,
+    bitrate_kbps INTEGER,
+    duration REAL,
+    block_count INTEGER NOT NULL,
+    imported_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_measurement ON runs (experiment, measurement);
+CREATE INDEX IF NOT EXISTS runs_scenario ON runs (wifi_type, distance_m, users, bitrate_kbps);
+CREATE TABLE IF NOT EXISTS attributes (
+    run INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value,
+    PRIMARY KEY (run, kind, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS attributes_name ON attributes (kind, name, value);
+CREATE TABLE IF NOT EXISTS modules (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+CREATE TABLE IF NOT EXISTS metrics (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+CREATE TABLE IF NOT EXISTS scalars (
+    run INTEGER NOT NULL,
+    metric INTEGER NOT NULL,
+    module INTEGER NOT NULL,
+    block INTEGER NOT NULL,
+    value REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scalars_run_metric ON scalars (run, metric);
+"""
+
+# Columns of the runs table that find_runs can filter on
+RUN_FILTERS = ('run_id', 'experiment', 'measurement', 'wifi_type', 'wifi_standard',
+               'distance_m', 'users', 'bitrate_kbps')
+
+# Header sections stored in the attributes table
+_HEADER_SECTIONS = (('attr', 'attributes'), ('itervar', 'itervars'), ('config', 'config'))
+
+# Maximum number of run ids bound into one IN (...) query
+_QUERY_RUNS = 500
+
+def open_results_database(database_path):
+    """
+    Open (creating if needed) the results database.
+
+    Args:
+        database_path (str): Path of the SQLite database file
+
+    Returns:
+        sqlite3.Connection: Open database connection
+    """
+    connection = sqlite3.connect(database_path)
+    connection.executescript(_SCHEMA)
+    return connection
+
+def _name_ids(connection, table, names):
+    """
+    Database ids of module or metric names, inserting the names not seen before.
+    """
+    connection.executemany(f"INSERT OR IGNORE INTO {table} (name) VALUES (?)", ((name,) for name in names))
+    ids = dict(connection.execute(f"SELECT name, id FROM {table}"))
+    return np.array([ids[name] for name in names], dtype=np.int64)
+
+def _delete_runs(connection, run_ids):
+    """
+    Delete runs and everything recorded for them.
+    """
+    for table, column in (('scalars', 'run'), ('attributes', 'run'), ('runs', 'id')):
+        connection.executemany(f"DELETE FROM {table} WHERE {column} = ?", ((run_id,) for run_id in run_ids))
+
+def _plan_import(connection, filenames):
+    """
+    Split files into those to (re)import and those already in the database unchanged.
+
+    A matching size and mtime is unchanged without reading the file. If only the mtime
+    moved the content hash is compared, so touched-but-identical files are not re-imported.
+    Files that no longer exist are reported and left out.
+
+    Returns:
+        tuple: (files to import, unchanged files, missing files, and the
+                (size, mtime_ns, content hash) signature of every file to import)
+    """
+    known = {path: (run, size, mtime_ns, content_hash) for run, path, size, mtime_ns, content_hash
+             in connection.execute("SELECT id, path, size, mtime_ns, content_hash FROM runs")}
+    changed, unchanged, missing = [], [], []
+    signatures = {}
+    for filename in filenames:
+        path = os.path.abspath(filename)
+        try:
+            stat = os.stat(filename)
+            recorded = known.get(path)
+            if recorded is not None and recorded[1] == stat.st_size and recorded[2] == stat.st_mtime_ns:
+                unchanged.append(filename)
+                continue
+            content_hash = file_content_hash(filename)
+        except FileNotFoundError:
+            print(f"Error: File '{filename}' not found!")
+            missing.append(filename)
+            continue
+        if recorded is not None and recorded[1] == stat.st_size and recorded[3] == content_hash:
+            connection.execute("UPDATE runs SET mtime_ns = ? WHERE id = ?", (stat.st_mtime_ns, recorded[0]))
+            unchanged.append(filename)
+            continue
+        changed.append(filename)
+        signatures[filename] = (stat.st_size, stat.st_mtime_ns, content_hash)
+    connection.commit()
+    return changed, unchanged, missing, signatures
+
+def _run_row(filename, signature, run_id, duration, block_count):
+    """
+    Values of a runs table row and the header entries of a file.
+    """
+    header = read_sca_header(filename)
+    measurement = header['attributes'].get('measurement', header['measurement'])
+    params = parse_scenario_name(filename)
+    for key, value in parse_measurement(str(measurement or '')).items():
+        params.setdefault(key, value)
+
+    row = (os.path.abspath(filename),) + tuple(signature) + (
+           run_id or header['run_id'], header['attributes'].get('experiment'),
+           None if measurement is None else str(measurement),
+           params.get('wifi_type'), params.get('wifi_standard'), params.get('distance_m'),
+           params.get('users'), params.get('bitrate_kbps'),
+           None if np.isnan(duration) else duration, block_count, time.time())
+    entries = [(kind, name, value) for kind, section in _HEADER_SECTIONS
+               for name, value in header[section].items()]
+    return row, entries
+
+def _insert_store(connection, store, signatures):
+    """
+    Insert every run of a columnar store, in one transaction, with the file signatures
+    from _plan_import.
+    """
+    module_ids = _name_ids(connection, 'modules', store['modules'])
+    metric_ids = _name_ids(connection, 'metrics', store['metrics'])
+    run_count = len(store['files'])
+
+    # Blocks of a run are numbered consecutively in the store - make them local to the run
+    has_block = store['block'] >= 0
+    first_block = np.full(run_count, np.iinfo(np.int32).max, dtype=np.int64)
+    last_block = np.full(run_count, -1, dtype=np.int64)
+    np.minimum.at(first_block, store['run'][has_block], store['block'][has_block])
+    np.maximum.at(last_block, store['run'][has_block], store['block'][has_block])
+    block_count = np.where(last_block >= 0, last_block - first_block + 1, 0)
+    local_block = np.where(has_block, store['block'] - first_block[store['run']], -1)
+
+    existing = connection.execute(
+        f"SELECT id FROM runs WHERE path IN ({','.join('?' * run_count)})",
+        [os.path.abspath(filename) for filename in store['files']]).fetchall()
+    _delete_runs(connection, [run for (run,) in existing])
+
+    database_runs = np.zeros(run_count, dtype=np.int64)
+    for run, filename in enumerate(store['files']):
+        row, entries = _run_row(filename, signatures[filename], store['run_ids'][run], store['durations'][run],
+                                int(block_count[run]))
+        database_runs[run] = connection.execute(
+            "INSERT INTO runs (path, size, mtime_ns, content_hash, run_id, experiment, measurement, wifi_type, "
+            "wifi_standard, distance_m, users, bitrate_kbps, duration, block_count, imported_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", row).lastrowid
+        connection.executemany("INSERT OR REPLACE INTO attributes (run, kind, name, value) VALUES (?, ?, ?, ?)",
+                               ((database_runs[run].item(),) + entry for entry in entries))
+
+    connection.executemany(
+        "INSERT INTO scalars (run, metric, module, block, value) VALUES (?, ?, ?, ?, ?)",
+        zip(database_runs[store['run']].tolist(), metric_ids[store['metric']].tolist(),
+            module_ids[store['module']].tolist(), local_block.tolist(), store['value'].tolist()))
+
+def import_runs(connection, filenames, batch_runs=DEFAULT_BATCH_RUNS, workers=1, cache=None,
+                cache_bytes=DEFAULT_CACHE_BYTES, verbose=False):
+    """
+    Import .sca files into the results database.
+
+    Files already imported unchanged are skipped and changed files replace their
+    previous run. The files are parsed batch_runs at a time and each batch is
+    inserted in a single transaction.
+
+    Args:
+        connection (sqlite3.Connection): Open database connection
+        filenames (iterable): Paths of the .sca files
+        batch_runs (int): Runs per parse batch and insert transaction
+        workers (int): Number of parse processes (1 parses serially in this process)
+        cache (str): Path of the SQLite parse cache, or None to always parse
+        cache_bytes (int): Size bound of the parse cache
+        verbose (bool): Print progress messages
+
+    Returns:
+        dict: Number of files 'imported', 'unchanged' and 'failed'
+    """
+    changed, unchanged, missing, signatures = _plan_import(connection, list(filenames))
+    imported = 0
+    for store in iter_scalar_stores(changed, batch_runs, False, workers, cache, cache_bytes):
+        if not store['files']:
+            continue
+        with connection:
+            _insert_store(connection, store, signatures)
+        imported += len(store['files'])
+        if verbose:
+            print(f"Imported {imported} of {len(changed)} new or changed files")
+
+    return {'imported': imported, 'unchanged': len(unchanged), 'failed': len(missing) + len(changed) - imported}
+
+def import_directories(connection, directories, recursive=False, **kwargs):
+    """
+    Import every .sca file of some result directories.
+
+    Args:
+        connection (sqlite3.Connection): Open database connection
+        directories (list): Directories to scan
+        recursive (bool): Also scan subdirectories
+        **kwargs: Further import_runs arguments
+
+    Returns:
+        dict: Number of files 'imported', 'unchanged' and 'failed'
+    """
+    if isinstance(directories, str):
+        directories = [directories]
+    filenames = [path for directory in directories for path in iter_sca_paths(directory, recursive)]
+    return import_runs(connection, sorted(filenames), **kwargs)
+
+def find_runs(connection, **criteria):
+    """
+    Look up runs by their experiment, measurement and scenario parameters.
+
+    Each criterion is a value or a list/tuple/set of values, e.g.
+    find_runs(connection, wifi_type='WiFi7', users=[10, 50]).
+
+    Args:
+        connection (sqlite3.Connection): Open database connection
+        **criteria: Filters on the RUN_FILTERS columns
+
+    Returns:
+        pandas.DataFrame: Matching runs, one row each, ordered by import
+    """
+    clauses, parameters = [], []
+    for column, value in criteria.items():
+        if column not in RUN_FILTERS:
+            raise ValueError(f"Unknown run filter '{column}' (expected one of {', '.join(RUN_FILTERS)})")
+        if isinstance(value, (list, tuple, set, frozenset)):
+            clauses.append(f"{column} IN ({','.join('?' * len(value))})")
+            parameters.extend(value)
+        elif value is None:
+            clauses.append(f"{column} IS NULL")
+        else:
+            clauses.append(f"{column} = ?")
+            parameters.append(value)
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ''
+    return pd.read_sql_query(
+        "SELECT id, path, run_id, experiment, measurement, wifi_type, wifi_standard, distance_m, users, "
+        f"bitrate_kbps, duration, block_count, imported_at FROM runs{where} ORDER BY id", connection,
+        params=parameters)
+
+def load_store(connection, runs):
+    """
+    Rebuild a columnar scalar store of some runs from the database.
+
+    Args:
+        connection (sqlite3.Connection): Open database connection
+        runs (pandas.DataFrame): Runs from find_runs
+
+    Returns:
+        dict: Store in the sca_store.load_scalar_store format, one run per row of runs
+    """
+    run_ids = runs['id'].tolist()
+    parts = [pd.read_sql_query(
+        f"SELECT run, metric, module, block, value FROM scalars WHERE run IN ({','.join('?' * len(window))}) "
+        "ORDER BY run, rowid", connection, params=window)
+        for window in (run_ids[i:i + _QUERY_RUNS] for i in range(0, len(run_ids), _QUERY_RUNS))]
+    scalars = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame(
+        {name: [] for name in ('run', 'metric', 'module', 'block', 'value')})
+
+    store = {
+        'files': runs['path'].tolist(),
+        'run_ids': runs['run_id'].tolist(),
+        'durations': runs['duration'].astype(float).tolist(),
+    }
+    # Database ids -> positions in the store's own run and string tables
+    run_position = pd.Series(np.arange(len(run_ids)), index=run_ids)
+    store['run'] = run_position[scalars['run']].to_numpy(dtype=np.int32)
+    for table, column in (('modules', 'module'), ('metrics', 'metric')):
+        ids = np.unique(scalars[column].to_numpy(dtype=np.int64))
+        names = dict(connection.execute(f"SELECT id, name FROM {table} WHERE id IN ({','.join('?' * len(ids))})",
+                                        ids.tolist())) if len(ids) else {}
+        store[table] = [names[i] for i in ids.tolist()]
+        store[f'{column}_index'] = {name: i for i, name in enumerate(store[table])}
+        store[column] = np.searchsorted(ids, scalars[column].to_numpy(dtype=np.int64)).astype(np.int32)
+
+    # Blocks are local to each run in the database - number them across the store
+    block_offset = np.concatenate([[0], np.cumsum(runs['block_count'].to_numpy(dtype=np.int64))])
+    local_block = scalars['block'].to_numpy(dtype=np.int64)
+    store['block'] = np.where(local_block >= 0, local_block + block_offset[store['run']], -1).astype(np.int32)
+    store['block_count'] = int(block_offset[-1])
+    store['value'] = scalars['value'].to_numpy(dtype=np.float64)
+    return store
+
+def query_run_metrics(connection, simulation_time_sec, stations=False, durations=None, **criteria):
+    """
+    Network performance metrics of the runs matching some criteria, from the database.
+
+    Args:
+        connection (sqlite3.Connection): Open database connection
+        simulation_time_sec (float): Duration of runs that record none
+        stations (bool): Also compute the per-station metrics
+        durations (dict): Per-file duration overrides, path -> seconds
+        **criteria: Run filters (see find_runs)
+
+    Returns:
+        pandas.DataFrame: The runs' find_runs columns followed by their
+                          sca_store.compute_run_metrics (and station) values
+    """
+    runs = find_runs(connection, **criteria)
+    if runs.empty:
+        return runs
+    store = load_store(connection, runs)
+    metrics = compute_run_metrics(store, simulation_time_sec, durations)
+    del metrics['file']  # Same as the runs' path
+    if stations:
+        metrics.update(compute_station_metrics(store, simulation_time_sec, durations))
+    return pd.concat([runs.reset_index(drop=True), pd.DataFrame(metrics)], axis=1)
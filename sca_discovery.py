@@ -0,0 +1,234 @@
+"""
+Network Performance EEN1058
+Author: Kyle Sheehy
+Date: October 2025
+
+Scenario discovery for directories of OMNeT++ scalar results (.sca) files.
+
+Instead of hand-maintained file dictionaries, the result directories are scanned once
+with os.scandir and the scenario parameters are read from the file name convention
+
+    DataOfUser1-[timestamp]-[distance]-[users]-[WiFiType]-[run].sca
+
+falling back to the 'attr measurement' line (e.g. "dist0_users10_WiFi6_80211ax") for
+anything the name does not carry. The result is a scenario table with one row per file.
+"""
+
+import itertools
+import os
+import re
+
+import pandas as pd
+
+from sca_parser import read_sca_header
+
+# Columns of the scenario table, in order
+SCENARIO_COLUMNS = ['path', 'timestamp', 'run_id', 'wifi_type', 'wifi_standard',
+                    'distance_m', 'users', 'bitrate_kbps']
+
+# Parameters that identify a scenario (reruns of the same scenario share these)
+SCENARIO_KEYS = ['wifi_type', 'wifi_standard', 'distance_m', 'users', 'bitrate_kbps']
+
+_FILENAME_TOKENS = [
+    ('distance_m', re.compile(r'(\d+)m\Z')),
+    ('users', re.compile(r'(\d+)users\Z')),
+    ('bitrate_kbps', re.compile(r'(\d+)kbps\Z')),
+    ('timestamp', re.compile(r'(\d{9,})\Z')),
+]
+_MEASUREMENT_TOKENS = [
+    ('distance_m', re.compile(r'dist(\d+)\Z')),
+    ('users', re.compile(r'users(\d+)\Z')),
+    ('bitrate_kbps', re.compile(r'(\d+)kbps\Z')),
+]
+_WIFI = re.compile(r'(WiFi\d+)(?:_(\w+))?\Z')
+
+def _match_tokens(tokens, patterns, params):
+    """
+    Fill params from the tokens matching the numeric token patterns.
+    """
+    for token in tokens:
+        wifi = _WIFI.match(token)
+        if wifi:
+            params['wifi_type'] = wifi.group(1)
+            params['wifi_standard'] = wifi.group(2)
+            continue
+        for key, pattern in patterns:
+            m = pattern.match(token)
+            if m:
+                params[key] = int(m.group(1))
+                break
+
+def parse_scenario_name(filename):
+    """
+    Extract the scenario parameters encoded in a .sca file name.
+
+    Args:
+        filename (str): File name or path (e.g. "DataOfUser1-run-1763041112-0m-10users-
+                        WiFi6_80211ax-run-1763041112.sca")
+
+    Returns:
+        dict: Parameters found in the name (missing parameters are left out)
+    """
+    stem = os.path.basename(filename)
+    if stem.endswith('.sca'):
+        stem = stem[:-len('.sca')]
+
+    params = {}
+    tokens = stem.split('-')
+    for previous, token in zip([None] + tokens, tokens):
+        if previous == 'run' and token.isdigit():
+            params['run_id'] = f"run-{token}"
+    _match_tokens(tokens, _FILENAME_TOKENS, params)
+    return params
+
+def parse_measurement(measurement):
+    """
+    Extract the scenario parameters encoded in an 'attr measurement' value.
+
+    Args:
+        measurement (str): Measurement label (e.g. "dist0_users10_WiFi6_80211ax")
+
+    Returns:
+        dict: Parameters found in the label (missing parameters are left out)
+    """
+    params = {}
+    wifi = re.search(r'WiFi\d+(?:_\w+)?\Z', measurement)
+    tokens = measurement[:wifi.start()].split('_') if wifi else measurement.split('_')
+    if wifi:
+        tokens.append(wifi.group(0))
+    _match_tokens(tokens, _MEASUREMENT_TOKENS, params)
+    return params
+
+def iter_sca_paths(directory, recursive=False):
+    """
+    Yield the .sca files of a directory with os.scandir.
+
+    Args:
+        directory (str): Directory to scan
+        recursive (bool): Also scan subdirectories
+
+    Yields:
+        str: Path of each .sca file
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.endswith('.sca'):
+                yield entry.path
+            elif recursive and entry.is_dir():
+                yield from iter_sca_paths(entry.path, recursive)
+
+def discover_scenarios(directories, defaults=None, recursive=False, keep='latest'):
+    """
+    Scan result directories and build the scenario table.
+
+    Parameters come from the file name first. Only when the name lacks a scenario
+    parameter is the file header read (header-only, the scalar body is skipped) for
+    the 'attr measurement' label and run id.
+    Anything still missing is taken from defaults (e.g. {'distance_m': 50} for
+    runs at the simulator's default distance).
+
+    Args:
+        directories (list): Directories to scan
+        defaults (dict): Fallback values for parameters neither source provides
+        recursive (bool): Also scan subdirectories
+        keep (str): 'latest' keeps only the newest timestamp of repeated scenarios,
+                    'all' keeps every file
+
+    Returns:
+        pandas.DataFrame: Scenario table, one row per file, sorted by scenario
+    """
+    if isinstance(directories, str):
+        directories = [directories]
+
+    rows = []
+    for directory in directories:
+        for path in iter_sca_paths(directory, recursive):
+            params = parse_scenario_name(path)
+
+            if not all(key in params for key in ('distance_m', 'users', 'wifi_type', 'run_id')):
+                header = read_sca_header(path)
+                measurement = header['attributes'].get('measurement', header['measurement'])
+                for key, value in parse_measurement(str(measurement or '')).items():
+                    params.setdefault(key, value)
+                if header['run_id']:
+                    params.setdefault('run_id', header['run_id'])
+
+            for key, value in (defaults or {}).items():
+                params.setdefault(key, value)
+
+            params['path'] = path
+            rows.append(params)
+
+    table = pd.DataFrame(rows, columns=SCENARIO_COLUMNS)
+    for column in ['timestamp', 'distance_m', 'users', 'bitrate_kbps']:
+        table[column] = table[column].astype('Int64')
+
+    table = table.sort_values(SCENARIO_KEYS + ['timestamp', 'path'], na_position='first')
+    if keep == 'latest':
+        # Reruns of a scenario supersede the earlier files
+        table = table.drop_duplicates(SCENARIO_KEYS, keep='last')
+
+    return table.reset_index(drop=True)
+
+def missing_scenarios(table, keys):
+    """
+    List the combinations of the given keys that are absent from the scenario table.
+
+    Args:
+        table (pandas.DataFrame): Scenario table from discover_scenarios
+        keys (list): Scenario columns spanning the expected grid
+
+    Returns:
+        list: Tuples of key values with no file in the table
+    """
+    present = set(table[keys].itertuples(index=False, name=None))
+    axes = [sorted(table[key].dropna().unique()) for key in keys]
+    return [combo for combo in itertools.product(*axes) if combo not in present]
+
+def select_scenarios(table, **criteria):
+    """
+    Filter the scenario table on its metadata columns.
+
+    Each keyword names a column. A plain value selects equal rows, a list/tuple/set
+    selects rows in it and a callable is applied to the column as a predicate, e.g.
+    select_scenarios(table, wifi_type='WiFi7', users=50, distance_m=lambda d: d > 90).
+    Only the table is touched, so no .sca file is read.
+
+    Args:
+        table (pandas.DataFrame): Scenario table from discover_scenarios
+        **criteria: Column filters
+
+    Returns:
+        pandas.DataFrame: Matching rows of the table
+    """
+    mask = pd.Series(True, index=table.index)
+    for column, criterion in criteria.items():
+        values = table[column]
+        if callable(criterion):
+            mask &= criterion(values).fillna(False).astype(bool)
+        elif isinstance(criterion, (list, tuple, set)):
+            mask &= values.isin(criterion)
+        else:
+            mask &= (values == criterion).fillna(False).astype(bool)
+    return table[mask]
+
+def scenario_durations(table, overrides):
+    """
+    Resolve a per-scenario duration override table to per-file durations.
+
+    Each override is a (criteria, seconds) pair, the criteria being select_scenarios
+    keyword filters, e.g. ({'wifi_type': 'WiFi7', 'users': 50}, 60.0). Later
+    overrides win where several match the same file.
+
+    Args:
+        table (pandas.DataFrame): Scenario table from discover_scenarios
+        overrides (list): (criteria dict, duration in seconds) pairs
+
+    Returns:
+        dict: Path -> duration in seconds for every file an override matches
+    """
+    durations = {}
+    for criteria, seconds in overrides or ():
+        for path in select_scenarios(table, **criteria)['path']:
+            durations[path] = seconds
+    return durations
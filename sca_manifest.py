@@ -0,0 +1,198 @@
+"""
+Network Performance EEN1058
+Author: Kyle Sheehy
+Date: October 2025
+
+Manifest for incremental re-analysis.
+
+The manifest is a JSON sidecar next to a results CSV. It records the .sca file behind
+every row of the CSV (path, size, mtime and content hash), any analysis parameters the
+row was computed with (e.g. a duration override) and the rows every generated figure
+was drawn from. On the next run only rows whose source file or parameters are new,
+changed or gone are recomputed and merged into the existing CSV, and only the figures
+that depend on one of those rows (or whose file is missing) are redrawn.
+"""
+
+import json
+import os
+
+import pandas as pd
+
+from sca_cache import file_content_hash
+
+# Bumped whenever the metrics computed for a row change, so rows from older runs are recomputed
+MANIFEST_VERSION = 3
+
+def empty_manifest():
+    """
+    Manifest of an analysis that has not produced any output yet.
+
+    Returns:
+        dict: Manifest with no inputs and no outputs
+    """
+    return {'version': MANIFEST_VERSION, 'inputs': {}, 'outputs': {}}
+
+def load_manifest(manifest_path):
+    """
+    Load a manifest, returning an empty one if it is missing or unreadable.
+
+    Args:
+        manifest_path (str): Path of the JSON manifest
+
+    Returns:
+        dict: 'inputs' (row key -> source signature) and 'outputs' (output -> row keys)
+    """
+    try:
+        with open(manifest_path, 'r') as file:
+            manifest = json.load(file)
+    except FileNotFoundError:
+        return empty_manifest()
+    except (OSError, ValueError) as e:
+        print(f"Warning: Ignoring unreadable manifest '{manifest_path}': {e}")
+        return empty_manifest()
+
+    if manifest.get('version') != MANIFEST_VERSION:
+        return empty_manifest()
+    return manifest
+
+def save_manifest(manifest_path, manifest):
+    """
+    Write a manifest atomically (a partly written manifest is never left behind).
+
+    Args:
+        manifest_path (str): Path of the JSON manifest
+        manifest (dict): Manifest to write
+    """
+    temporary_path = manifest_path + '.tmp'
+    with open(temporary_path, 'w') as file:
+        json.dump(manifest, file, indent=1, sort_keys=True)
+    os.replace(temporary_path, manifest_path)
+
+def source_signature(filename):
+    """
+    Signature of a source file used to detect changes.
+
+    Args:
+        filename (str): Path to the .sca file
+
+    Returns:
+        dict: 'path', 'size', 'mtime_ns' and 'content_hash' of the file
+    """
+    stat = os.stat(filename)
+    return {
+        'path': filename,
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'content_hash': file_content_hash(filename),
+    }
+
+def _source_changed(recorded, filename):
+    """
+    Check a source file against its recorded signature.
+
+    The size and mtime are compared first; the content is only hashed when the
+    size matches but the mtime moved, so touched-but-identical files are unchanged.
+    """
+    if recorded is None or recorded['path'] != filename:
+        return True
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return True
+    if stat.st_size != recorded['size']:
+        return True
+    if stat.st_mtime_ns == recorded['mtime_ns']:
+        return False
+    return file_content_hash(filename) != recorded['content_hash']
+
+def plan_update(manifest, sources, existing_keys=(), parameters=None):
+    """
+    Work out which result rows need to be recomputed.
+
+    Args:
+        manifest (dict): Manifest of the previous run
+        sources (dict): Row key -> path of the .sca file behind that row
+        existing_keys (iterable): Row keys present in the existing results
+        parameters (dict): Row key -> JSON-serialisable parameters the row is computed with
+
+    Returns:
+        tuple: (set of keys to recompute, set of keys whose source is gone)
+    """
+    existing_keys = set(existing_keys)
+    inputs = manifest['inputs']
+    parameters = parameters or {}
+
+    changed = {key for key, filename in sources.items()
+               if key not in existing_keys or _source_changed(inputs.get(key), filename)
+               or inputs[key].get('parameters') != parameters.get(key)}
+    removed = (set(inputs) | existing_keys) - set(sources)
+    return changed, removed
+
+def merge_rows(existing, updated, key_column, replaced):
+    """
+    Merge recomputed rows into the existing results.
+
+    Args:
+        existing (pandas.DataFrame): Previous results, or None
+        updated (pandas.DataFrame): Recomputed rows
+        key_column (str): Column holding the row key
+        replaced (set): Keys whose previous rows are dropped (recomputed or removed)
+
+    Returns:
+        pandas.DataFrame: Existing rows that are still valid followed by the updated rows
+    """
+    if existing is None or existing.empty:
+        return updated.reset_index(drop=True)
+    kept = existing[~existing[key_column].isin(replaced)]
+    if updated.empty:
+        return kept.reset_index(drop=True)
+    return pd.concat([kept, updated], ignore_index=True)
+
+def stale_outputs(manifest, outputs, changed):
+    """
+    Select the outputs that have to be regenerated.
+
+    An output is stale if its file is missing, if it depends on a recomputed row or
+    if the set of rows it depends on is not the set it was generated from.
+
+    Args:
+        manifest (dict): Manifest of the previous run
+        outputs (dict): Output path -> row keys the output depends on
+        changed (set): Recomputed or removed row keys
+
+    Returns:
+        set: Output paths to regenerate
+    """
+    stale = set()
+    for output, keys in outputs.items():
+        recorded = manifest['outputs'].get(output)
+        if (not os.path.exists(output) or recorded is None
+                or set(recorded) != set(keys) or not changed.isdisjoint(keys)):
+            stale.add(output)
+    return stale
+
+def record_update(manifest, sources, outputs, changed, parameters=None):
+    """
+    Record the sources of the current rows and the rows behind each generated output.
+
+    Args:
+        manifest (dict): Manifest to update in place
+        sources (dict): Row key -> path, for the rows present in the results
+        outputs (dict): Output path -> row keys, for the outputs that were generated
+        changed (set): Row keys that were recomputed in this run
+        parameters (dict): Row key -> parameters the row was computed with
+    """
+    parameters = parameters or {}
+    inputs = {}
+    for key, filename in sources.items():
+        recorded = manifest['inputs'].get(key)
+        if key in changed or recorded is None:
+            inputs[key] = source_signature(filename)
+        else:
+            # Unchanged content - only follow a moved mtime so it is not hashed again
+            inputs[key] = dict(recorded, mtime_ns=os.stat(filename).st_mtime_ns)
+        inputs[key].pop('parameters', None)
+        if parameters.get(key) is not None:
+            inputs[key]['parameters'] = parameters[key]
+    manifest['inputs'] = inputs
+    manifest['outputs'].update({output: sorted(keys) for output, keys in outputs.items()})
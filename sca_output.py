@@ -0,0 +1,164 @@
+"""
+Network Performance EEN1058
+Author: Kyle Sheehy
+Date: October 2025
+
+Writers and loaders for result rows and tables.
+
+Rows are written to disk as they are produced instead of after the whole sweep has
+been collected, so the output of a long sweep is usable while it is still running and
+an interrupted run keeps every row written before the interruption. CSV output is
+flushed every few rows; Parquet output (when pyarrow is installed) is written one row
+group at a time.
+
+Summary tables are saved and loaded by file extension. Parquet keeps the column types
+(no re-parsing of text on load, integers stay integers) and stores the scenario label
+columns dictionary-encoded, so a table can be plotted again straight from the file
+without re-ingesting the .sca files.
+"""
+
+import csv
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+DEFAULT_FLUSH_ROWS = 64  # Rows per CSV flush / Parquet row group
+
+# Scenario label columns - few distinct values repeated on every row, stored
+# dictionary-encoded in Parquet
+CATEGORICAL_COLUMNS = ('wifi_type', 'distance', 'user_count', 'distance_label', 'bit_rate_label')
+
+def _is_parquet(path):
+    """
+    Check whether a path names a Parquet file.
+    """
+    return path.endswith('.parquet')
+
+def _stream_csv(rows, path, columns, flush_rows):
+    """
+    Write rows to a CSV file as they pass through.
+    """
+    with open(path, 'w', newline='') as file:
+        writer = None
+        for count, row in enumerate(rows, start=1):
+            if writer is None:
+                writer = csv.DictWriter(file, fieldnames=columns or list(row), extrasaction='ignore')
+                writer.writeheader()
+            writer.writerow(row)
+            if count % flush_rows == 0:
+                file.flush()
+            yield row
+
+def _stream_parquet(rows, path, columns, flush_rows):
+    """
+    Write rows to a Parquet file, one row group per flush_rows rows, as they pass through.
+    """
+    writer = None
+    batch = []
+
+    def write_batch():
+        nonlocal writer
+        table = pa.Table.from_pylist([{name: row.get(name) for name in columns or row} for row in batch],
+                                     schema=writer.schema if writer else None)
+        if writer is None:
+            writer = pq.ParquetWriter(path, table.schema)
+        writer.write_table(table)
+        batch.clear()
+
+    try:
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= flush_rows:
+                write_batch()
+            yield row
+        if batch:
+            write_batch()
+    finally:
+        if writer is not None:
+            writer.close()
+
+def stream_rows(rows, path, columns=None, flush_rows=DEFAULT_FLUSH_ROWS):
+    """
+    Pass rows through unchanged while writing them incrementally to path.
+
+    The format follows the file extension: '.parquet' writes Parquet (requires
+    pyarrow), anything else writes CSV. The columns default to the keys of the
+    first row. If path is None the rows are passed through without being written.
+
+    Args:
+        rows (iterable): Row dictionaries, e.g. from sca_store.iter_run_metrics
+        path (str): Output file, or None to disable writing
+        columns (list): Columns to write, in order
+        flush_rows (int): Rows between flushes (CSV) or per row group (Parquet)
+
+    Returns:
+        iterator: The input rows, each yielded after it has been handed to the writer
+    """
+    if path is None:
+        return iter(rows)
+
+    if _is_parquet(path):
+        if pq is None:
+            print(f"Error: Writing '{path}' requires pyarrow (pip install pyarrow). Rows will not be saved.")
+            return iter(rows)
+        return _stream_parquet(rows, path, columns, flush_rows)
+
+    return _stream_csv(rows, path, columns, flush_rows)
+
+def write_results(df, path, categorical=CATEGORICAL_COLUMNS):
+    """
+    Save a results table, in the format given by the file extension.
+
+    '.parquet' writes Parquet (requires pyarrow) with the categorical columns
+    dictionary-encoded; anything else writes CSV.
+
+    Args:
+        df (pandas.DataFrame): Results table
+        path (str): Output file
+        categorical (iterable): Columns to dictionary-encode in Parquet (missing ones are ignored)
+
+    Returns:
+        str: The path written, or None if it could not be written
+    """
+    if not _is_parquet(path):
+        df.to_csv(path, index=False)
+        return path
+
+    if pq is None:
+        print(f"Error: Writing '{path}' requires pyarrow (pip install pyarrow). Results not saved.")
+        return None
+    encoded = df.astype({column: 'category' for column in categorical if column in df.columns})
+    pq.write_table(pa.Table.from_pandas(encoded, preserve_index=False), path)
+    return path
+
+def read_results(path, columns=None, categorical=False):
+    """
+    Load a results table saved by write_results.
+
+    Args:
+        path (str): Results file ('.parquet' or CSV)
+        columns (list): Columns to load (None loads every column) - Parquet only
+                        reads these columns from disk
+        categorical (bool): Keep dictionary-encoded Parquet columns as pandas
+                            categoricals instead of decoding them to plain values
+
+    Returns:
+        pandas.DataFrame: The results table, or None if it needs pyarrow and pyarrow is missing
+    """
+    if not _is_parquet(path):
+        return pd.read_csv(path, usecols=columns, float_precision='round_trip')
+
+    if pq is None:
+        print(f"Error: Reading '{path}' requires pyarrow (pip install pyarrow).")
+        return None
+    df = pq.read_table(path, columns=columns).to_pandas()
+    if not categorical:
+        for column in df.columns[df.dtypes == 'category']:
+            df[column] = df[column].astype(df[column].cat.categories.dtype)
+    return df
@@ -0,0 +1,276 @@
+"""
+Network Performance EEN1058
+Author: Kyle Sheehy
+Date: October 2025
+
+Shared parser for OMNeT++ scalar results (.sca) files.
+
+Every line is split once and classified by its keyword as a run, attr, scalar, statistic
+or field record; only lines with quoted strings are matched against the record grammar.
+Numeric values are converted a single time when the record is produced, so the analysis
+scripts all work from the same typed records.
+"""
+
+import re
+from collections import defaultdict, namedtuple
+
+# One parsed line of a .sca file.
+#   run       -> value is the run id
+#   attr      -> name/value of the run attribute (itervar/config/param lines likewise)
+#   scalar    -> module/name/value of the scalar
+#   statistic -> module/name of the statistic whose fields follow
+#   field     -> module of the owning statistic, name is "<statistic>:<field>"
+ScaRecord = namedtuple('ScaRecord', ['kind', 'module', 'name', 'value'])
+
+# Record grammar - a keyword and the rest of its line, for lines with quoted strings.
+# Lines that do not start with a keyword (blank lines, vectors, histogram bins, ...) never match.
+RECORD_GRAMMAR = re.compile(
+    r'^[ \t]*(scalar|field|attr|statistic|run|itervar|config|param)(?:[ \t]+([^\r\n]*))?[ \t]*\r?$',
+    re.MULTILINE
+)
+
+# Keywords of the name/value records
+NAME_VALUE_KEYWORDS = frozenset(('attr', 'itervar', 'config', 'param'))
+
+# A token is either a double quoted string (with escapes) or a run of non-whitespace.
+# Only lines containing a quote need it, the rest are split on whitespace.
+TOKEN = re.compile(r'"(?:[^"\\\n]|\\.)*+"|[^\s"]\S*+')
+
+# Run attributes/config entries that may carry the simulated duration, and the time
+# units OMNeT++ writes after a value (e.g. "sim-time-limit 20s")
+DURATION_KEYS = ('sim-time-limit', 'simTime', 'simulation-time', 'duration')
+DURATION_UNITS = {'': 1.0, 's': 1.0, 'ms': 1e-3, 'us': 1e-6, 'ns': 1e-9, 'min': 60.0, 'h': 3600.0}
+_DURATION = re.compile(r'\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*([a-z]*)\s*\Z')
+
+def _unquote(token):
+    """
+    Strip the surrounding quotes (and escapes) from a quoted token.
+    """
+    if len(token) >= 2 and token[0] == '"' and token[-1] == '"':
+        return re.sub(r'\\(.)', r'\1', token[1:-1])
+    return token
+
+def convert_value(token):
+    """
+    Convert a raw value token to int, float or str.
+
+    Args:
+        token (str): Value exactly as it appears in the file
+
+    Returns:
+        int, float or str: Converted value (quoted strings are returned unquoted)
+    """
+    if token[0] == '"':
+        return _unquote(token)
+    try:
+        return int(token)
+    except ValueError:
+        pass
+    try:
+        return float(token)
+    except ValueError:
+        return token
+
+def parse_duration(value):
+    """
+    Convert a duration value to seconds.
+
+    Args:
+        value (int, float or str): Number of seconds or a value with a time unit (e.g. "500ms")
+
+    Returns:
+        float: Duration in seconds, or None if the value is not a positive duration
+    """
+    if isinstance(value, (int, float)):
+        seconds = float(value)
+    else:
+        m = _DURATION.match(str(value))
+        if m is None or m.group(2) not in DURATION_UNITS:
+            return None
+        seconds = float(m.group(1)) * DURATION_UNITS[m.group(2)]
+    return seconds if seconds > 0 else None
+
+def header_duration(header):
+    """
+    Simulated duration recorded in a run header, if any.
+
+    Config entries take precedence over itervars, which take precedence over attributes.
+
+    Args:
+        header (dict): Header returned by read_sca_header
+
+    Returns:
+        float: Duration in seconds, or None if the run does not record one
+    """
+    for section in ('config', 'itervars', 'attributes'):
+        for key in DURATION_KEYS:
+            if key in header[section]:
+                seconds = parse_duration(header[section][key])
+                if seconds is not None:
+                    return seconds
+    return None
+
+def _tokenize(rest):
+    """
+    Split the rest of a record line into tokens, keeping quoted strings whole.
+    """
+    return TOKEN.findall(rest) if '"' in rest else rest.split()
+
+def _classify(lines):
+    """
+    Turn record lines into (kind, module, name, value) tuples, skipping the lines
+    that are not records.
+
+    Plain lines are split on whitespace and recognised by their first token. Only
+    lines containing a quote go through the record grammar, and only their names
+    are unquoted (quoted values are left to convert_value).
+    """
+    statistic_module = None
+    statistic_name = None
+
+    for line in lines:
+        if '"' in line:
+            m = RECORD_GRAMMAR.match(line)
+            if m is None:
+                continue
+            kind, rest = m.groups('')
+            tokens = [kind] + TOKEN.findall(rest)
+            names = [_unquote(token) for token in tokens]
+        else:
+            tokens = names = line.split()
+            if not tokens:
+                continue
+            kind = tokens[0]
+
+        if kind == 'scalar':
+            if len(tokens) == 4:
+                # Most scalars are integer counters - try that before the general conversion
+                try:
+                    value = int(tokens[3])
+                except ValueError:
+                    value = convert_value(tokens[3])
+                yield 'scalar', names[1], names[2], value
+        elif kind == 'field':
+            if len(tokens) == 3:
+                yield 'field', statistic_module, f"{statistic_name}:{tokens[1]}", convert_value(tokens[2])
+        elif kind == 'statistic':
+            if len(tokens) == 3:
+                statistic_module, statistic_name = names[1], names[2]
+                yield 'statistic', statistic_module, statistic_name, None
+        elif kind == 'run':
+            yield 'run', None, None, names[1] if len(tokens) > 1 else ''
+        elif kind in NAME_VALUE_KEYWORDS and len(tokens) == 3:
+            # attr, itervar, config and param lines are name/value pairs
+            yield kind, None, names[1], convert_value(tokens[2])
+
+def _iter_file_records(filename):
+    """
+    Stream the records of a .sca file as plain (kind, module, name, value) tuples.
+    """
+    with open(filename, 'r') as file:
+        yield from _classify(file)
+
+def iter_sca_records(filename):
+    """
+    Stream the records of a .sca file.
+
+    Lines are split on whitespace as they are read; only lines with quoted
+    strings are matched against the record grammar.
+
+    Args:
+        filename (str): Path to the .sca file
+
+    Yields:
+        ScaRecord: One record per recognised line, in file order
+    """
+    return map(ScaRecord._make, _iter_file_records(filename))
+
+def read_sca_header(filename):
+    """
+    Read only the run header at the top of a .sca file.
+
+    Reading stops at the first record that is not part of the header, so the
+    scalar body is never read. The header is the run line, attr/itervar/config/param
+    lines and the 'scalar . measurement' line.
+
+    Args:
+        filename (str): Path to the .sca file
+
+    Returns:
+        dict: 'run_id', 'attributes', 'itervars', 'config' and 'measurement'
+    """
+    header = {
+        'run_id': None,
+        'attributes': {},
+        'itervars': {},
+        'config': {},
+        'measurement': None,
+    }
+    sections = {'itervar': 'itervars', 'config': 'config', 'param': 'config'}
+    match = RECORD_GRAMMAR.match
+
+    with open(filename, 'r') as file:
+        for line in file:
+            m = match(line)
+            if m is None:
+                if line.strip():
+                    break
+                continue
+
+            kind, rest = m.groups('')
+            tokens = _tokenize(rest)
+            if kind == 'run':
+                header['run_id'] = _unquote(tokens[0]) if tokens else ''
+            elif kind == 'attr' and len(tokens) == 2:
+                header['attributes'][_unquote(tokens[0])] = convert_value(tokens[1])
+            elif kind in sections and len(tokens) == 2:
+                header[sections[kind]][_unquote(tokens[0])] = convert_value(tokens[1])
+            elif kind == 'scalar' and tokens[:2] == ['.', 'measurement'] and len(tokens) == 3:
+                header['measurement'] = convert_value(tokens[2])
+            else:
+                break
+
+    return header
+
+def _records_to_dict(records):
+    """
+    Fold (kind, module, name, value) records into the node -> metric dictionary used by
+    the analysis scripts: scalars as data[module][metric], statistic fields as
+    data['statistics'][field]. Repeated keys keep the last value seen.
+    """
+    data = defaultdict(dict)
+
+    for kind, module, name, value in records:
+        if kind == 'scalar':
+            data[module][name] = value
+        elif kind == 'field':
+            data['statistics'][name.rpartition(':')[2]] = value
+
+    return dict(data)
+
+def parse_sca_file(filename, verbose=True):
+    """
+    Parse OMNeT++ scalar results file (.sca) and extract network performance data.
+
+    Args:
+        filename (str): Path to the .sca file
+        verbose (bool): Print progress messages while parsing
+
+    Returns:
+        dict: Dictionary containing parsed network metrics, or None on failure
+    """
+    if verbose:
+        print(f"Parsing trace file: {filename}")
+
+    try:
+        data = _records_to_dict(_iter_file_records(filename))
+    except FileNotFoundError:
+        print(f"Error: File '{filename}' not found!")
+        return None
+    except Exception as e:
+        print(f"Error parsing file '{filename}': {e}")
+        return None
+
+    if verbose:
+        print("File parsed successfully!")
+    return data
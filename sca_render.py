@@ -0,0 +1,326 @@
+"""
+Network Performance EEN1058
+Author: Kyle Sheehy
+Date: October 2025
+
+Figure rendering for the analysis scripts.
+
+Each figure is described by a job: the output path, a builder function that draws
+onto a matplotlib Figure, the data it plots and its size/style. In the default
+headless mode the figures are built with the object-oriented Figure API (no pyplot
+state, no display needed) on the Agg renderer, and independent figures are rendered
+in parallel in a process pool. In interactive mode they are drawn through pyplot
+and shown one after the other, as the scripts originally did.
+
+Builders must be module-level functions taking (fig, data) so they can be sent to
+worker processes. Value labels are added a whole column at a time with annotate_points,
+which thins them out when the points are too dense for every label to be readable.
+
+Rendered images can be kept in a figure cache directory, keyed on a hash of exactly
+what the figure plots: the data slice, size, style, resolution, the builder and the
+source of the module defining it and of the project modules it takes helpers from. A
+figure whose key is already cached is copied from the cache instead of being drawn
+again. The cache is bounded in size and evicts the least recently used images first.
+"""
+
+import hashlib
+import os
+import pickle
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+import matplotlib.style
+import numpy as np
+import pandas as pd
+from matplotlib.figure import Figure
+from matplotlib.transforms import offset_copy
+
+DEFAULT_DPI = 300
+
+DEFAULT_FIGURE_CACHE_BYTES = 128 * 1024 * 1024  # 128 MB of cached images
+
+# Approximate width of a label character relative to the font size, used to work out
+# how many labels fit side by side on an axes
+LABEL_CHAR_WIDTH = 0.6
+
+_source_digests = {}
+
+def figure_job(path, builder, data, figsize, rc=None, dpi=DEFAULT_DPI, columns=None):
+    """
+    Describe one figure to render.
+
+    Args:
+        path (str): Output image path
+        builder (function): Module-level function drawing onto the figure, called as builder(fig, data)
+        data: Data passed to the builder (e.g. a DataFrame or metrics dict)
+        figsize (tuple): Figure size in inches
+        rc (dict): rcParams applied on top of the default style while drawing
+        dpi (int): Output resolution
+        columns (list): DataFrame columns the builder plots - only this slice is passed
+                        to the builder and hashed for the figure cache
+
+    Returns:
+        dict: Figure job for render_figures
+    """
+    if columns is not None:
+        data = data[columns]
+    return {
+        'path': path,
+        'builder': builder,
+        'data': data,
+        'figsize': figsize,
+        'rc': rc or {},
+        'dpi': dpi,
+    }
+
+def label_capacity(ax, label_chars, fontsize):
+    """
+    Number of labels of a given length that fit side by side across an axes.
+
+    Args:
+        ax (matplotlib.axes.Axes): Axes the labels are drawn on
+        label_chars (int): Characters in the longest label
+        fontsize (float): Label font size in points
+
+    Returns:
+        int: Labels that fit without overlapping (at least 1)
+    """
+    axes_width_points = ax.get_position().width * ax.figure.get_figwidth() * 72
+    return max(1, int(axes_width_points // (label_chars * fontsize * LABEL_CHAR_WIDTH)))
+
+def decimate_labels(x, capacity):
+    """
+    Pick the points to label so that at most capacity labels are drawn.
+
+    Points are taken at a regular stride in x order, and the last point is
+    always labelled.
+
+    Args:
+        x (numpy.ndarray): X positions of the points
+        capacity (int): Maximum number of labels
+
+    Returns:
+        numpy.ndarray: Indices of the points to label (all of them if they fit)
+    """
+    if len(x) <= capacity:
+        return np.arange(len(x))
+    order = np.argsort(x, kind='stable')
+    stride = -(-len(x) // capacity)
+    keep = order[::stride]
+    if keep[-1] != order[-1]:
+        keep = np.append(keep[:capacity - 1], order[-1])
+    return keep
+
+def annotate_points(ax, x, y, fmt, values=None, offset=(0, 15), max_labels=None, fontsize=10, **text_kw):
+    """
+    Label a whole column of points at once.
+
+    The positions and values are taken as arrays, the labels are thinned out to what
+    fits across the axes and every label shares a single offset transform.
+
+    Args:
+        ax (matplotlib.axes.Axes): Axes to draw on
+        x (array-like): X positions in data coordinates
+        y (array-like): Y positions in data coordinates
+        fmt (str): Format string for one value (e.g. '{:.2f} ms')
+        values (array-like): Values to print (defaults to y)
+        offset (tuple): Label offset from each point in points
+        max_labels (int): Upper bound on the labels drawn (defaults to what fits the axes)
+        fontsize (float): Label font size
+        **text_kw: Further matplotlib text properties
+
+    Returns:
+        list: Text artists that were added
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    values = y if values is None else np.asarray(values)
+    if len(x) == 0:
+        return []
+
+    label_chars = max(len(fmt.format(values.min())), len(fmt.format(values.max())))
+    capacity = label_capacity(ax, label_chars, fontsize)
+    if max_labels is not None:
+        capacity = min(capacity, max_labels)
+    keep = decimate_labels(x, capacity)
+
+    transform = offset_copy(ax.transData, fig=ax.figure, x=offset[0], y=offset[1], units='points')
+    text_kw.setdefault('ha', 'center')
+    return [ax.text(x_value, y_value, fmt.format(value), transform=transform, fontsize=fontsize, **text_kw)
+            for x_value, y_value, value in zip(x[keep].tolist(), y[keep].tolist(), values[keep].tolist())]
+
+def render_figure(job):
+    """
+    Build and save one figure headlessly with the object-oriented API.
+
+    Args:
+        job (dict): Figure job from figure_job
+
+    Returns:
+        str: Path of the saved figure
+    """
+    with matplotlib.style.context(['default', job['rc']]):
+        fig = Figure(figsize=job['figsize'])
+        job['builder'](fig, job['data'])
+        fig.savefig(job['path'], dpi=job['dpi'], bbox_inches='tight')
+    return job['path']
+
+def _render_figure_safe(job):
+    """
+    Worker entry point - return (path, None) or (None, error message).
+    """
+    try:
+        return render_figure(job), None
+    except Exception as e:
+        return None, f"Error rendering '{job['path']}': {e}"
+
+def _show_figure(job):
+    """
+    Build, save and show one figure through pyplot (blocks until the window is closed).
+    """
+    import matplotlib.pyplot as plt
+
+    with matplotlib.style.context(['default', job['rc']]):
+        fig = plt.figure(figsize=job['figsize'])
+        job['builder'](fig, job['data'])
+        fig.savefig(job['path'], dpi=job['dpi'], bbox_inches='tight')
+    plt.show()
+    return job['path']
+
+def _module_digest(module):
+    """
+    Hash of a module's source file ('' for modules without one).
+    """
+    path = getattr(module, '__file__', None)
+    if path is None:
+        return ''
+    if path not in _source_digests:
+        with open(path, 'rb') as file:
+            _source_digests[path] = hashlib.blake2b(file.read(), digest_size=16).hexdigest()
+    return _source_digests[path]
+
+def _source_digest(builder):
+    """
+    Hash of the source behind a builder, so editing a plot invalidates its cache.
+
+    This covers the module defining the builder and the project's own modules it
+    imports functions from (e.g. annotate_points here, the sca_cube accessors), which
+    are the modules next to it. Installed libraries are covered by their version.
+    """
+    module = sys.modules.get(builder.__module__)
+    path = getattr(module, '__file__', None)
+    if path is None:
+        return ''
+    directory = os.path.dirname(os.path.abspath(path))
+    helpers = {getattr(value, '__module__', None) for value in vars(module).values() if callable(value)}
+    digests = [_module_digest(module)]
+    for name in sorted(name for name in helpers if name and name != module.__name__):
+        helper_path = getattr(sys.modules.get(name), '__file__', None)
+        if helper_path is not None and os.path.dirname(os.path.abspath(helper_path)) == directory:
+            digests.append(f"{name}:{_module_digest(sys.modules[name])}")
+    return ' '.join(digests)
+
+def figure_key(job):
+    """
+    Hash everything a figure's pixels depend on.
+
+    Args:
+        job (dict): Figure job from figure_job
+
+    Returns:
+        str: Hex digest identifying the rendered image
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    data = job['data']
+    if isinstance(data, pd.DataFrame):
+        digest.update(repr((list(data.columns), [str(dtype) for dtype in data.dtypes])).encode())
+        digest.update(pd.util.hash_pandas_object(data, index=False).values.tobytes())
+    else:
+        digest.update(pickle.dumps(data))
+    builder = job['builder']
+    digest.update(repr((builder.__qualname__, _source_digest(builder),
+                        tuple(job['figsize']), sorted(job['rc'].items()), job['dpi'],
+                        os.path.splitext(job['path'])[1], matplotlib.__version__)).encode())
+    return digest.hexdigest()
+
+def _cache_path(cache, job):
+    """
+    Path of a job's image in the figure cache.
+    """
+    return os.path.join(cache, figure_key(job) + os.path.splitext(job['path'])[1])
+
+def evict_figures(cache, max_bytes=DEFAULT_FIGURE_CACHE_BYTES):
+    """
+    Delete least recently used cached images until the cache fits in max_bytes.
+
+    Args:
+        cache (str): Figure cache directory
+        max_bytes (int): Size bound for the cached images
+    """
+    with os.scandir(cache) as entries:
+        files = sorted((entry.stat().st_mtime_ns, entry.stat().st_size, entry.path)
+                       for entry in entries if entry.is_file())
+    total = sum(size for _, size, _ in files)
+    for _, size, path in files:
+        if total <= max_bytes:
+            break
+        os.remove(path)
+        total -= size
+
+def render_figures(jobs, workers=1, interactive=False, cache=None, cache_bytes=DEFAULT_FIGURE_CACHE_BYTES):
+    """
+    Render a list of figure jobs.
+
+    Args:
+        jobs (list): Figure jobs from figure_job
+        workers (int): Number of render processes in headless mode (1 renders serially)
+        interactive (bool): Draw through pyplot and show each figure instead of rendering headlessly
+        cache (str): Figure cache directory in headless mode, or None to always render
+        cache_bytes (int): Size bound of the figure cache
+
+    Returns:
+        list: Paths of the figures that were saved
+    """
+    if interactive:
+        return [_show_figure(job) for job in jobs]
+
+    paths = [job['path'] for job in jobs]
+    cached = []
+    if cache is not None:
+        os.makedirs(cache, exist_ok=True)
+        misses = []
+        for job in jobs:
+            cache_path = _cache_path(cache, job)
+            if os.path.exists(cache_path):
+                shutil.copyfile(cache_path, job['path'])
+                os.utime(cache_path)  # Mark as recently used
+                cached.append(job['path'])
+            else:
+                misses.append((job, cache_path))
+        jobs = [job for job, _ in misses]
+        if cached:
+            print(f"Reused {len(cached)} cached figure(s), rendering {len(jobs)}")
+
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+            results = list(executor.map(_render_figure_safe, jobs))
+    else:
+        results = [_render_figure_safe(job) for job in jobs]
+
+    saved = []
+    for path, error in results:
+        if error is not None:
+            print(error)
+        else:
+            saved.append(path)
+
+    if cache is not None:
+        for job, cache_path in misses:
+            if job['path'] in saved:
+                shutil.copyfile(job['path'], cache_path)
+        evict_figures(cache, cache_bytes)
+
+    done = set(cached + saved)
+    return [path for path in paths if path in done]
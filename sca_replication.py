@@ -0,0 +1,149 @@
+"""
+Network Performance EEN1058
+Author: Kyle Sheehy
+Date: October 2025
+
+Replication statistics across the runs (e.g. seeds) of each scenario.
+
+Runs sharing the same scenario parameters are grouped as replications. For every
+scenario and metric the mean over the replications, its standard error and a
+percentile bootstrap confidence interval are computed. The bootstrap is vectorized
+over scenarios, resamples and metrics at once. Every resample draws run positions
+inside its scenario and counts how often each run was drawn. The resample means of all
+scenarios and metrics then come from one batched matrix product of those counts with
+the scenarios' values. Scenarios are processed largest first, in chunks sized so that
+the draws held at once stay below MAX_BOOTSTRAP_ELEMENTS. Memory is therefore bounded
+however many scenarios there are, and no Python loop runs per scenario or resample.
+"""
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_RESAMPLES = 1000
+DEFAULT_CONFIDENCE = 0.95
+
+MAX_BOOTSTRAP_ELEMENTS = 16 * 1024 * 1024  # Bootstrap draws held at once (128 MB per array)
+
+# Suffixes of the statistic columns added for every replicated metric
+STDERR_SUFFIX = '_stderr'
+CI_LOW_SUFFIX = '_ci_low'
+CI_HIGH_SUFFIX = '_ci_high'
+
+def _bootstrap_intervals(values, counts, starts, resamples, confidence, rng):
+    """
+    Percentile bootstrap interval of the mean of every group, a chunk of groups at a time.
+    """
+    group_count, metric_count = len(counts), values.shape[1]
+    low = np.full((group_count, metric_count), np.nan)
+    high = np.full((group_count, metric_count), np.nan)
+
+    # Linear interpolation between the sorted resample means, as numpy.quantile does
+    positions = np.array([(1 - confidence) / 2, (1 + confidence) / 2]) * (resamples - 1)
+    below = np.floor(positions).astype(np.int64)
+    above = np.minimum(below + 1, resamples - 1)
+    fraction = (positions - below)[:, None]
+
+    # Groups with two or more replications, largest first, so that each chunk is padded
+    # only to the size of its own first group
+    order = np.argsort(-counts, kind='stable')
+    order = order[counts[order] >= 2]
+    first = 0
+    while first < len(order):
+        size = int(counts[order[first]])
+        chunk = order[first:first + max(1, MAX_BOOTSTRAP_ELEMENTS // (resamples * (size + 1)))]
+        first += len(chunk)
+        n = counts[chunk]
+
+        # The groups' values padded to one (groups x size x metrics) array
+        slots = np.arange(size)
+        valid = slots < n[:, None]
+        padded = np.zeros((len(n), size, metric_count))
+        padded[valid] = values[(starts[chunk, None] + slots)[valid]]
+
+        # Draw n positions per resample and count how often each value is drawn. Draws
+        # in the padding slots beyond a group's size land in a spare last column
+        draws = (rng.random((len(n), resamples, size)) * n[:, None, None]).astype(np.int32)
+        draws = np.where(valid[:, None, :], draws, np.int32(size))
+        cells = np.arange(0, len(n) * resamples * (size + 1), size + 1, dtype=np.int32).reshape(len(n), resamples, 1)
+        weights = np.bincount((cells + draws).ravel(), minlength=len(n) * resamples * (size + 1))
+        weights = weights.reshape(len(n), resamples, size + 1)[..., :size].astype(float)
+
+        # Resample means of every group and metric in one batched matrix product
+        means = np.sort(weights @ padded / n[:, None, None], axis=1)
+        bounds = means[:, below] * (1 - fraction) + means[:, above] * fraction
+        low[chunk] = bounds[:, 0]
+        high[chunk] = bounds[:, 1]
+    return low, high
+
+def replication_statistics(values, groups, group_count, resamples=DEFAULT_RESAMPLES,
+                           confidence=DEFAULT_CONFIDENCE, seed=0):
+    """
+    Mean, standard error and bootstrap confidence interval of every group of replications.
+
+    Args:
+        values (numpy.ndarray): Metric values, one row per run and one column per metric
+        groups (numpy.ndarray): Scenario index of every run
+        group_count (int): Number of scenarios
+        resamples (int): Bootstrap resamples per scenario
+        confidence (float): Confidence level of the intervals (e.g. 0.95)
+        seed (int): Random seed of the resampling
+
+    Returns:
+        dict: 'count' (replications per scenario), and 'mean', 'stderr', 'ci_low' and
+              'ci_high' arrays (scenarios x metrics). The standard error and interval
+              are NaN for scenarios with fewer than two replications
+    """
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        values = values[:, None]
+    groups = np.asarray(groups, dtype=np.int64)
+
+    counts = np.bincount(groups, minlength=group_count)
+    totals = np.stack([np.bincount(groups, weights=column, minlength=group_count) for column in values.T], axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = totals / counts[:, None]
+        deviations = values - mean[groups]
+        squares = np.stack([np.bincount(groups, weights=column, minlength=group_count)
+                            for column in (deviations ** 2).T], axis=1)
+        stderr = np.sqrt(squares / (counts - 1)[:, None] / counts[:, None])
+    stderr[counts < 2] = np.nan
+
+    order = np.argsort(groups, kind='stable')
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    ci_low, ci_high = _bootstrap_intervals(values[order], counts, starts, resamples, confidence,
+                                           np.random.default_rng(seed))
+    return {'count': counts, 'mean': mean, 'stderr': stderr, 'ci_low': ci_low, 'ci_high': ci_high}
+
+def summarise_replications(df, keys, metrics, resamples=DEFAULT_RESAMPLES, confidence=DEFAULT_CONFIDENCE, seed=0):
+    """
+    Collapse a table of runs to one row per scenario.
+
+    Every numeric column is averaged over the scenario's replications. The replicated
+    metrics also get <metric>_stderr, <metric>_ci_low and <metric>_ci_high columns,
+    and a 'replications' column counts the runs.
+
+    Args:
+        df (pandas.DataFrame): One row per run
+        keys (list): Columns identifying a scenario
+        metrics (list): Metrics to compute standard errors and intervals for
+        resamples (int): Bootstrap resamples per scenario
+        confidence (float): Confidence level of the intervals
+        seed (int): Random seed of the resampling
+
+    Returns:
+        pandas.DataFrame: One row per scenario, sorted by the keys
+    """
+    grouped = df.groupby(keys, sort=True)
+    groups = grouped.ngroup().to_numpy()
+    summary = grouped.mean(numeric_only=True)
+    summary = summary.drop(columns=[key for key in keys if key in summary.columns]).reset_index()
+    summary.insert(len(keys), 'replications', grouped.size().to_numpy())
+
+    statistics = replication_statistics(df[metrics].to_numpy(dtype=float), groups, grouped.ngroups,
+                                        resamples, confidence, seed)
+    columns = {}
+    for i, metric in enumerate(metrics):
+        columns[metric + STDERR_SUFFIX] = statistics['stderr'][:, i]
+        columns[metric + CI_LOW_SUFFIX] = statistics['ci_low'][:, i]
+        columns[metric + CI_HIGH_SUFFIX] = statistics['ci_high'][:, i]
+    return pd.concat([summary, pd.DataFrame(columns)], axis=1)
@@ -0,0 +1,718 @@
+"""
+Network Performance EEN1058
+Author: Kyle Sheehy
+Date: October 2025
+
+Columnar scalar store for whole sweep directories.
+
+All scalars of a sweep are held in contiguous NumPy arrays (run, module, metric,
+receiver block and value) with interned module/metric name tables, instead of one
+dict-of-dicts per file. The network performance metrics are then computed for every
+run at once with vectorized array expressions.
+"""
+
+import itertools
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from sca_aggregate import empty_delay_aggregate, pooled_delay, reduce_delay_aggregates
+from sca_parser import DURATION_KEYS, parse_duration
+from sca_cache import DEFAULT_CACHE_BYTES, open_parse_cache, cache_lookup, cache_store, evict_lru
+
+# Metric names the vectorized metrics are built from
+TX_PACKETS = 'sender-tx-packets'
+RX_PACKETS = 'receiver-rx-packets'
+DELAY_COUNT = 'delay-count'
+DELAY_TOTAL = 'delay-total'
+DELAY_AVERAGE = 'delay-average'
+DELAY_MAX = 'delay-max'
+DELAY_MIN = 'delay-min'
+
+DEFAULT_PACKET_SIZE_BYTES = 1000
+
+# Percentiles of the per-station distributions reported by compute_station_metrics
+STATION_PERCENTILES = (5, 50, 95)
+
+# Runs merged into one store when metrics are streamed batch by batch
+DEFAULT_BATCH_RUNS = 64
+
+# Files in flight per parse process (bounds the chunks waiting to be merged)
+POOL_WINDOW_PER_WORKER = 16
+
+TX_PACKETS_BYTES = TX_PACKETS.encode()
+RX_PACKETS_BYTES = RX_PACKETS.encode()
+
+# Record keywords, for lines containing quotes (the rest are split on whitespace). Only
+# lines starting with one of these keywords match (as keyword, rest of line).
+SCALAR_LINES = re.compile(rb'^[ \t]*(scalar|field|statistic|run|attr|config|itervar|param)(?:[ \t]+([^\r\n]*))?[ \t]*\r?$')
+
+# Header records that may carry the run duration, in order of precedence
+DURATION_KEYS_BYTES = {key.encode() for key in DURATION_KEYS}
+DURATION_SOURCES = (b'config', b'param', b'itervar', b'attr')
+
+# Tokens of a line containing quotes - a double quoted string (with escapes) or a run
+# of non-whitespace. Lines without quotes are simply split on whitespace.
+QUOTED_TOKENS = re.compile(rb'"(?:[^"\\\n]|\\.)*+"|[^\s"]\S*+')
+
+# Byte value of a double quote - testing for an int is much cheaper than for b'"'
+QUOTE = ord('"')
+
+def _unquote_bytes(token):
+    """
+    Decode a bytes token, stripping surrounding quotes (and escapes) if present.
+    """
+    text = token.decode('utf-8')
+    if len(text) >= 2 and text[0] == '"' and text[-1] == '"':
+        return re.sub(r'\\(.)', r'\1', text[1:-1])
+    return text
+
+def _intern(table, index, name):
+    """
+    Return the id of name in an interned string table, adding it if needed.
+    """
+    name_id = index.get(name)
+    if name_id is None:
+        name_id = index[name] = len(table)
+        table.append(name)
+    return name_id
+
+def _split_quoted_line(line):
+    """
+    Tokens of a record line containing quotes (none if the line is not a record).
+    """
+    m = SCALAR_LINES.match(line)
+    return [m.group(1)] + QUOTED_TOKENS.findall(m.group(2) or b'') if m else []
+
+def _read_record_lines(filename):
+    """
+    Read a .sca file in one go and return its lines split into tokens.
+
+    Lines without quotes are simply split on whitespace; only lines with quotes go
+    through SCALAR_LINES and QUOTED_TOKENS.
+    """
+    with open(filename, 'rb') as file:
+        lines = file.read().split(b'\n')
+    return [line.split() if QUOTE not in line else _split_quoted_line(line) for line in lines]
+
+def _float_values(raws):
+    """
+    Convert value tokens to a float array.
+
+    Returns:
+        tuple: (float array, boolean mask of the tokens that are numbers, or None if all are)
+    """
+    try:
+        return np.array(list(map(float, raws)), dtype=np.float64), None
+    except ValueError:
+        # Some token is not a number (e.g. a quoted string) - convert one at a time
+        values = np.zeros(len(raws))
+        valid = np.zeros(len(raws), dtype=bool)
+        for i, raw in enumerate(raws):
+            try:
+                values[i] = float(raw)
+                valid[i] = True
+            except ValueError:
+                pass
+        return values, valid
+
+def _intern_names(names):
+    """
+    Intern a sequence of names in order of first appearance.
+
+    Returns:
+        tuple: (list of distinct names, int32 array with the id of every name)
+    """
+    index = {name: i for i, name in enumerate(dict.fromkeys(names))}
+    return list(index), np.fromiter(map(index.__getitem__, names), dtype=np.int32, count=len(names))
+
+def _receiver_blocks(metric, metrics):
+    """
+    File-local receiver block of every row, and the number of blocks.
+
+    A 'sender-tx-packets' row always opens a block; a 'receiver-rx-packets' row opens
+    one unless a sender opened it just before.
+    """
+    tx_id = metrics.index(TX_PACKETS_BYTES) if TX_PACKETS_BYTES in metrics else -1
+    rx_id = metrics.index(RX_PACKETS_BYTES) if RX_PACKETS_BYTES in metrics else -1
+    is_tx = metric == tx_id
+    events = np.flatnonzero(is_tx | (metric == rx_id))
+    event_tx = is_tx[events]
+    after_tx = np.concatenate([[False], event_tx[:-1]])
+    opens = np.zeros(len(metric), dtype=np.int32)
+    opens[events[event_tx | ~after_tx]] = 1
+    return np.cumsum(opens, dtype=np.int32) - 1, int(opens.sum())
+
+def parse_file_chunk(filename):
+    """
+    Parse one .sca file into a self-contained columnar chunk.
+
+    The file is read in one go and split into lines and tokens at the bytes level. One
+    pass over the lines collects the module, name and raw value tokens of the scalar
+    and field rows; the values, name tables and receiver blocks are then built from
+    those lists in bulk. Names stay bytes until the end and are decoded once per
+    distinct module/metric.
+
+    The chunk carries its own module/metric string tables and file-local receiver
+    block numbers, so it can be built in a worker process and merged into a store
+    in any position. A block is opened by 'sender-tx-packets' (or by a
+    'receiver-rx-packets' with no sender before it) and the receiver and 'delay-*'
+    scalars that follow belong to it. Rows before the first block get block -1.
+    The simulated duration is taken from the run's config/param/itervar/attr entries
+    (see sca_parser.DURATION_KEYS) when it records one.
+
+    Args:
+        filename (str): Path to the .sca file
+
+    Returns:
+        dict: 'run_id', 'duration' (seconds or None), local 'modules'/'metrics' tables,
+              'block_count' and the 'module', 'metric', 'block' and 'value' arrays
+    """
+    rows = []  # (keyword, module, name, raw value) of every scalar and field row
+    run_id = ''
+    durations = {}
+    statistic = None
+
+    for tokens in _read_record_lines(filename):
+        if len(tokens) == 4 and tokens[0] == b'scalar':
+            rows.append(tokens)
+            continue
+        if not tokens:
+            continue
+        kind = tokens[0]
+        if kind == b'field':
+            if len(tokens) == 3 and statistic is not None:
+                rows.append((kind, statistic[0], statistic[1] + b':' + tokens[1], tokens[2]))
+        elif kind == b'statistic':
+            if len(tokens) == 3:
+                statistic = tokens[1:]
+        elif kind == b'run':
+            run_id = _unquote_bytes(tokens[1]) if len(tokens) > 1 else ''
+        elif kind in DURATION_SOURCES:
+            if len(tokens) == 3 and tokens[1].strip(b'"') in DURATION_KEYS_BYTES:
+                seconds = parse_duration(_unquote_bytes(tokens[2]))
+                if seconds is not None:
+                    durations.setdefault(kind, seconds)
+
+    # Convert and intern the rows a column at a time.
+    # String-valued (quoted) and non-numeric scalars are not stored
+    _, row_modules, row_names, raws = zip(*rows) if rows else ((), (), (), ())
+    values, valid = _float_values(raws)
+    if valid is not None:
+        row_modules = list(itertools.compress(row_modules, valid))
+        row_names = list(itertools.compress(row_names, valid))
+        values = values[valid]
+    modules, module = _intern_names(row_modules)
+    metrics, metric = _intern_names(row_names)
+    block, block_count = _receiver_blocks(metric, metrics)
+
+    return {
+        'run_id': run_id,
+        'duration': next((durations[kind] for kind in DURATION_SOURCES if kind in durations), None),
+        'modules': [_unquote_bytes(name) for name in modules],
+        'metrics': [_unquote_bytes(name) for name in metrics],
+        'block_count': block_count,
+        'module': module,
+        'metric': metric,
+        'block': block,
+        'value': values,
+    }
+
+def _parse_file_chunk_safe(filename):
+    """
+    Worker entry point - return (chunk, None) or (None, error message).
+    """
+    try:
+        return parse_file_chunk(filename), None
+    except FileNotFoundError:
+        return None, f"Error: File '{filename}' not found!"
+    except Exception as e:
+        return None, f"Error parsing file '{filename}': {e}"
+
+def _windows(items, size):
+    """
+    Yield successive lists of at most size items from any iterable.
+    """
+    items = iter(items)
+    while True:
+        window = list(itertools.islice(items, size))
+        if not window:
+            return
+        yield window
+
+def _parse_window(executor, window, workers):
+    """
+    Yield (filename, chunk, error) for a window of files in input order, parsing them
+    in the process pool, or serially in this process if executor is None.
+    """
+    if executor is None:
+        for filename in window:
+            yield (filename,) + _parse_file_chunk_safe(filename)
+        return
+    chunksize = max(1, len(window) // (workers * 4))
+    # map() returns results in submission order, keeping the store deterministic
+    for filename, (chunk, error) in zip(window, executor.map(_parse_file_chunk_safe, window, chunksize=chunksize)):
+        yield filename, chunk, error
+
+def _iter_chunks(filenames, workers):
+    """
+    Yield (filename, chunk, error) in input order, parsing in a process pool if workers > 1.
+
+    Files are submitted to the pool a window at a time, so only a bounded number of
+    parsed chunks is ever waiting to be consumed.
+    """
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for window in _windows(filenames, workers * POOL_WINDOW_PER_WORKER):
+                yield from _parse_window(executor, window, workers)
+    else:
+        yield from _parse_window(None, filenames, workers)
+
+def _iter_cached_chunks(filenames, workers, cache, cache_bytes):
+    """
+    Yield (filename, chunk, error, cached) in input order, serving unchanged files
+    from the parse cache and parsing only the misses.
+
+    Files are looked up a window at a time and the cache is committed after every
+    window, so an interrupted run keeps everything parsed up to that point. The misses
+    of every window go to the same process pool (if workers > 1).
+    """
+    connection = open_parse_cache(cache)
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        for window in _windows(filenames, max(workers, 1) * POOL_WINDOW_PER_WORKER):
+            chunks = {}
+            stats = {}
+            for filename in window:
+                try:
+                    chunk, stats[filename] = cache_lookup(connection, filename)
+                except OSError:
+                    chunk = None  # Missing or unreadable - reported by the parser
+                if chunk is not None:
+                    chunks[filename] = (chunk, None, True)
+
+            misses = [filename for filename in window if filename not in chunks]
+            for filename, chunk, error in _parse_window(executor if len(misses) > 1 else None, misses, workers):
+                chunks[filename] = (chunk, error, False)
+                if chunk is not None and filename in stats:
+                    cache_store(connection, filename, stats[filename], chunk)
+            connection.commit()
+
+            for filename in window:
+                yield (filename,) + chunks[filename]
+
+        evict_lru(connection, cache_bytes)
+        connection.commit()
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        connection.close()
+
+def _new_store():
+    """
+    Empty store and the per-column lists of arrays it is assembled from.
+    """
+    store = {
+        'files': [],
+        'run_ids': [],
+        'durations': [],
+        'modules': [],
+        'metrics': [],
+        'module_index': {},
+        'metric_index': {},
+        'block_count': 0,
+    }
+    parts = {'run': [], 'module': [], 'metric': [], 'block': [], 'value': []}
+    return store, parts
+
+def _add_chunk(store, parts, filename, chunk):
+    """
+    Append a parsed chunk to a store as its next run.
+    """
+    # Map the chunk's local string tables onto the store's interned tables
+    module_ids = np.array([_intern(store['modules'], store['module_index'], name)
+                           for name in chunk['modules']], dtype=np.int32)
+    metric_ids = np.array([_intern(store['metrics'], store['metric_index'], name)
+                           for name in chunk['metrics']], dtype=np.int32)
+
+    run = len(store['files'])
+    store['files'].append(filename)
+    store['run_ids'].append(chunk['run_id'])
+    store['durations'].append(np.nan if chunk['duration'] is None else chunk['duration'])
+
+    parts['run'].append(np.full(len(chunk['value']), run, dtype=np.int32))
+    parts['module'].append(module_ids[chunk['module']])
+    parts['metric'].append(metric_ids[chunk['metric']])
+    parts['block'].append(np.where(chunk['block'] >= 0,
+                                   chunk['block'] + store['block_count'], -1).astype(np.int32))
+    parts['value'].append(chunk['value'])
+    store['block_count'] += chunk['block_count']
+
+def _finish_store(store, parts):
+    """
+    Concatenate the collected arrays into the store columns.
+    """
+    for name, arrays in parts.items():
+        dtype = np.float64 if name == 'value' else np.int32
+        store[name] = np.concatenate(arrays).astype(dtype, copy=False) if arrays else np.zeros(0, dtype=dtype)
+    return store
+
+def iter_scalar_stores(filenames, batch_runs=DEFAULT_BATCH_RUNS, verbose=False, workers=1, cache=None,
+                       cache_bytes=DEFAULT_CACHE_BYTES):
+    """
+    Ingest .sca files into a sequence of columnar stores of at most batch_runs runs.
+
+    Files are parsed lazily, so each store is yielded as soon as its runs are parsed
+    and memory is bounded by the batch size rather than the sweep size. Files that
+    cannot be parsed are reported and skipped.
+
+    Args:
+        filenames (iterable): Paths of the .sca files to ingest (may be a generator)
+        batch_runs (int): Maximum number of runs per store (None for a single store)
+        verbose (bool): Print progress messages while parsing
+        workers (int): Number of parse processes (1 parses serially in this process)
+        cache (str): Path of the SQLite parse cache, or None to always parse
+        cache_bytes (int): Size bound of the parse cache
+
+    Yields:
+        dict: Store in the load_scalar_store format
+    """
+    if cache is not None:
+        chunks = _iter_cached_chunks(filenames, workers, cache, cache_bytes)
+    else:
+        chunks = ((filename, chunk, error, False) for filename, chunk, error in _iter_chunks(filenames, workers))
+
+    store, parts = _new_store()
+    for filename, chunk, error, cached in chunks:
+        if verbose:
+            print(f"Using cached parse: {filename}" if cached else f"Parsing trace file: {filename}")
+        if chunk is None:
+            print(error)
+            continue
+
+        _add_chunk(store, parts, filename, chunk)
+        if verbose and not cached:
+            print("File parsed successfully!")
+
+        if batch_runs is not None and len(store['files']) >= batch_runs:
+            yield _finish_store(store, parts)
+            store, parts = _new_store()
+
+    if store['files'] or batch_runs is None:
+        yield _finish_store(store, parts)
+
+def load_scalar_store(filenames, verbose=False, workers=1, cache=None, cache_bytes=DEFAULT_CACHE_BYTES):
+    """
+    Ingest a list of .sca files into a columnar scalar store.
+
+    Every numeric scalar and statistic field becomes one row of the column arrays.
+    Receiver block numbers are made global by offsetting each file's local blocks.
+    Files that cannot be parsed are reported and skipped.
+
+    Args:
+        filenames (list): Paths of the .sca files to ingest
+        verbose (bool): Print progress messages while parsing
+        workers (int): Number of parse processes (1 parses serially in this process)
+        cache (str): Path of the SQLite parse cache, or None to always parse
+        cache_bytes (int): Size bound of the parse cache
+
+    Returns:
+        dict: Column arrays ('run', 'module', 'metric', 'block', 'value'), the
+              string tables ('modules', 'metrics'), the parsed 'files' (run index is
+              the position in this list) and their 'run_ids'
+    """
+    return next(iter_scalar_stores(filenames, None, verbose, workers, cache, cache_bytes))
+
+def metric_mask(store, name):
+    """
+    Boolean row mask selecting every row of the given metric.
+
+    Args:
+        store (dict): Store returned by load_scalar_store
+        name (str): Metric name (statistic fields are named "<statistic>:<field>")
+
+    Returns:
+        numpy.ndarray: Boolean mask over the store rows
+    """
+    metric_id = store['metric_index'].get(name)
+    if metric_id is None:
+        return np.zeros(len(store['value']), dtype=bool)
+    return store['metric'] == metric_id
+
+def _sum_per_run(store, mask, run_count):
+    """
+    Sum the values of the masked rows for every run.
+    """
+    return np.bincount(store['run'][mask], weights=store['value'][mask], minlength=run_count)
+
+def _per_block(store, mask, fill=0.0):
+    """
+    Scatter the values of the masked rows into a per receiver block array (fill if absent).
+    """
+    values = np.full(store['block_count'], fill)
+    mask = mask & (store['block'] >= 0)
+    values[store['block'][mask]] = store['value'][mask]
+    return values
+
+def block_delay_aggregates(store):
+    """
+    Delay aggregate of every receiver block of the store.
+
+    The total comes from the block's delay-total scalar, or delay-average * delay-count
+    for files without one. Blocks that received nothing are empty.
+
+    Args:
+        store (dict): Store returned by load_scalar_store
+
+    Returns:
+        dict: Array aggregate (see sca_aggregate) indexed by block
+    """
+    count = _per_block(store, metric_mask(store, DELAY_COUNT))
+    total = _per_block(store, metric_mask(store, DELAY_TOTAL), fill=np.nan)
+    missing_total = np.isnan(total)
+    total[missing_total] = (_per_block(store, metric_mask(store, DELAY_AVERAGE)) * count)[missing_total]
+
+    aggregate = {
+        'count': count,
+        'total': total,
+        'min': _per_block(store, metric_mask(store, DELAY_MIN), fill=np.inf),
+        'max': _per_block(store, metric_mask(store, DELAY_MAX), fill=-np.inf),
+    }
+    empty = count <= 0
+    for name, value in empty_delay_aggregate().items():
+        aggregate[name][empty] = value
+    return aggregate
+
+def run_delay_aggregates(store):
+    """
+    Delay aggregate of every run of the store - its receiver blocks merged exactly.
+
+    Args:
+        store (dict): Store returned by load_scalar_store
+
+    Returns:
+        dict: Array aggregate (see sca_aggregate) indexed by run
+    """
+    return reduce_delay_aggregates(block_delay_aggregates(store), _block_runs(store), len(store['files']))
+
+def _block_runs(store):
+    """
+    Run of every receiver block.
+    """
+    block_run = np.full(store['block_count'], -1)
+    has_block = store['block'] >= 0
+    block_run[store['block'][has_block]] = store['run'][has_block]
+    return block_run
+
+def _packet_size_per_run(store, run_count):
+    """
+    Average packet size of every run - the last 'mean' statistic field, or the default.
+    """
+    avg_packet_size = np.full(run_count, float(DEFAULT_PACKET_SIZE_BYTES))
+    mean_ids = [i for i, name in enumerate(store['metrics']) if name.endswith(':mean')]
+    size_mask = np.isin(store['metric'], mean_ids)
+    avg_packet_size[store['run'][size_mask]] = store['value'][size_mask]
+    return avg_packet_size
+
+def run_durations(store, simulation_time_sec, durations=None):
+    """
+    Simulated duration of every run of the store.
+
+    An override for the run's file wins, then the duration recorded in the run
+    itself, then simulation_time_sec.
+
+    Args:
+        store (dict): Store returned by load_scalar_store
+        simulation_time_sec (float): Duration of runs that record none
+        durations (dict): Per-file overrides, path -> seconds
+
+    Returns:
+        numpy.ndarray: Duration in seconds, indexed by run
+    """
+    seconds = np.array(store['durations'], dtype=float)
+    if durations:
+        for run, filename in enumerate(store['files']):
+            if filename in durations:
+                seconds[run] = durations[filename]
+    seconds[np.isnan(seconds)] = simulation_time_sec
+    return seconds
+
+def compute_run_metrics(store, simulation_time_sec, durations=None):
+    """
+    Calculate network performance metrics for every run of the store at once.
+
+    Packet counts are summed over all receivers. The delay statistics are the receiver
+    blocks' delay aggregates merged per run: the mean is the pooled delay-total over
+    delay-count and the extremes are the max/min over receivers. delay_count and
+    delay_total_ns are returned as well, so runs can be pooled further later on.
+
+    Throughput is computed against each run's own duration (see run_durations),
+    so sweeps of different lengths can be mixed in one store.
+
+    Args:
+        store (dict): Store returned by load_scalar_store
+        simulation_time_sec (float): Duration of runs that record none
+        durations (dict): Per-file duration overrides, path -> seconds
+
+    Returns:
+        dict: One NumPy array per metric, indexed by run
+    """
+    run_count = len(store['files'])
+    simulation_time = run_durations(store, simulation_time_sec, durations)
+
+    # Packet counts
+    tx_packets = _sum_per_run(store, metric_mask(store, TX_PACKETS), run_count)
+    rx_mask = metric_mask(store, RX_PACKETS)
+    rx_packets = _sum_per_run(store, rx_mask, run_count)
+    receiver_count = np.bincount(store['run'][rx_mask], minlength=run_count)
+
+    # Packet size statistics - last 'mean' field of each run
+    avg_packet_size = _packet_size_per_run(store, run_count)
+
+    # Delay statistics (in nanoseconds) - receiver blocks pooled exactly from delay-total/delay-count
+    delays = run_delay_aggregates(store)
+    delay = pooled_delay(delays)
+
+    # Throughput (Kbps) = (Successfully received bits) / (Total time)
+    total_bits_received = rx_packets * avg_packet_size * 8  # Convert bytes to bits
+    total_throughput_kbps = (total_bits_received / simulation_time) / 1000
+    avg_throughput_kbps = np.divide(total_throughput_kbps, receiver_count,
+                                    out=np.zeros(run_count), where=receiver_count > 0)
+
+    # Packet Loss Ratio (PLR)
+    packet_loss_ratio = np.divide(tx_packets - rx_packets, tx_packets,
+                                  out=np.zeros(run_count), where=tx_packets > 0)
+
+    return {
+        'file': np.array(store['files'], dtype=object),
+        'avg_throughput_kbps': avg_throughput_kbps,
+        'total_throughput_kbps': total_throughput_kbps,
+        'avg_delay_ms': delay['mean'] / 1000000,
+        'max_delay_ms': delay['max'] / 1000000,
+        'min_delay_ms': delay['min'] / 1000000,
+        'delay_count': delays['count'].astype(np.int64),
+        'delay_total_ns': delays['total'],
+        'packet_loss_ratio': packet_loss_ratio,
+        'tx_packets': tx_packets.astype(np.int64),
+        'rx_packets': rx_packets.astype(np.int64),
+        'receiver_count': receiver_count,
+        'avg_packet_size_bytes': avg_packet_size,
+        'simulation_time_sec': simulation_time,
+    }
+
+def _station_percentiles(values, station_run, slot, run_count, prefix, suffix):
+    """
+    Percentiles of a per-station value for every run.
+
+    The stations are laid out in a (run, station) table padded with NaN, so the
+    percentiles of all runs come from one nanpercentile call. Runs without stations get 0.
+    """
+    columns = {f'{prefix}_p{q}{suffix}': np.zeros(run_count) for q in STATION_PERCENTILES}
+    if len(values) == 0:
+        return columns
+
+    table = np.full((run_count, slot.max() + 1), np.nan)
+    table[station_run, slot] = values
+    has_stations = np.bincount(station_run, minlength=run_count) > 0
+    percentiles = np.nanpercentile(table[has_stations], STATION_PERCENTILES, axis=1)
+    for column, values_q in zip(columns.values(), percentiles):
+        column[has_stations] = values_q
+    return columns
+
+def compute_station_metrics(store, simulation_time_sec, durations=None):
+    """
+    Calculate per-station fairness and distribution metrics for every run at once.
+
+    Every receiver block is one station: its throughput comes from its own
+    'receiver-rx-packets', its PLR from the 'sender-tx-packets' of the same block and
+    its delay from the block's pooled delay-total / delay-count. These per-station
+    values are reduced per run to Jain's fairness index of the throughputs, throughput
+    and PLR percentiles, and the worst station's delay and PLR.
+
+    Args:
+        store (dict): Store returned by load_scalar_store
+        simulation_time_sec (float): Duration of runs that record none
+        durations (dict): Per-file duration overrides, path -> seconds
+
+    Returns:
+        dict: One NumPy array per metric, indexed by run
+    """
+    run_count = len(store['files'])
+
+    # One station per block with a receiver, in file order
+    rx_mask = metric_mask(store, RX_PACKETS) & (store['block'] >= 0)
+    station_block = store['block'][rx_mask]
+    station_run = _block_runs(store)[station_block]
+    station_count = np.bincount(station_run, minlength=run_count)
+    first_station = np.concatenate(([0], np.cumsum(station_count)[:-1]))
+    slot = np.arange(len(station_block)) - first_station[station_run]
+
+    # Per-station values
+    rx_packets = store['value'][rx_mask]
+    tx_packets = _per_block(store, metric_mask(store, TX_PACKETS))[station_block]
+    avg_packet_size = _packet_size_per_run(store, run_count)[station_run]
+    simulation_time = run_durations(store, simulation_time_sec, durations)[station_run]
+    throughput_kbps = (rx_packets * avg_packet_size * 8 / simulation_time) / 1000
+    packet_loss_ratio = np.divide(tx_packets - rx_packets, tx_packets,
+                                  out=np.zeros(len(station_block)), where=tx_packets > 0)
+    station_delays = {name: values[station_block] for name, values in block_delay_aggregates(store).items()}
+    has_delay = station_delays['count'] > 0
+    delay_average = pooled_delay(station_delays)['mean']
+
+    # Jain's fairness index (sum x)^2 / (n * sum x^2) of the station throughputs
+    throughput_sum = np.bincount(station_run, weights=throughput_kbps, minlength=run_count)
+    throughput_squares = np.bincount(station_run, weights=throughput_kbps ** 2, minlength=run_count)
+    jain_denominator = station_count * throughput_squares
+    jain_index = np.divide(throughput_sum ** 2, jain_denominator,
+                           out=np.zeros(run_count), where=jain_denominator > 0)
+
+    # Worst station
+    worst_delay = np.zeros(run_count)
+    np.maximum.at(worst_delay, station_run[has_delay], delay_average[has_delay])
+    worst_plr = np.zeros(run_count)
+    np.maximum.at(worst_plr, station_run, packet_loss_ratio)
+
+    metrics = {
+        'station_count': station_count,
+        'jain_fairness_index': jain_index,
+    }
+    metrics.update(_station_percentiles(throughput_kbps, station_run, slot, run_count,
+                                        'station_throughput', '_kbps'))
+    metrics['worst_station_delay_ms'] = worst_delay / 1000000
+    metrics.update(_station_percentiles(packet_loss_ratio, station_run, slot, run_count, 'station_plr', ''))
+    metrics['worst_station_plr'] = worst_plr
+    return metrics
+
+def iter_run_metrics(filenames, simulation_time_sec, batch_runs=DEFAULT_BATCH_RUNS, verbose=False, workers=1,
+                     cache=None, cache_bytes=DEFAULT_CACHE_BYTES, stations=False, durations=None):
+    """
+    Stream the network performance metrics of a sweep, one row per run.
+
+    The files are ingested batch_runs at a time and the vectorized metrics are
+    computed per batch, so rows are yielded while the rest of the sweep is still
+    being parsed and peak memory does not grow with the number of runs.
+
+    Args:
+        filenames (iterable): Paths of the .sca files (may be a generator)
+        simulation_time_sec (float): Duration of runs that record none
+        batch_runs (int): Runs per metrics batch
+        verbose (bool): Print progress messages while parsing
+        workers (int): Number of parse processes (1 parses serially in this process)
+        cache (str): Path of the SQLite parse cache, or None to always parse
+        cache_bytes (int): Size bound of the parse cache
+        stations (bool): Also compute the per-station compute_station_metrics values
+        durations (dict): Per-file duration overrides, path -> seconds
+
+    Yields:
+        dict: 'file', 'run_id' and the compute_run_metrics values of one run
+    """
+    for store in iter_scalar_stores(filenames, batch_runs, verbose, workers, cache, cache_bytes):
+        metrics = compute_run_metrics(store, simulation_time_sec, durations)
+        if stations:
+            metrics.update(compute_station_metrics(store, simulation_time_sec, durations))
+        columns = [(name, values.tolist()) for name, values in metrics.items()]
+        for run, run_id in enumerate(store['run_ids']):
+            row = {'file': store['files'][run], 'run_id': run_id}
+            row.update((name, values[run]) for name, values in columns if name != 'file')
+            yield row
@@ -0,0 +1,61 @@
+"""
+Network Performance EEN1058
+Author: Kyle Sheehy
+Date: October 2025
+
+Synthetic .sca results in the layout of the QuestionC multi-user runs, for benchmark.py
+and the sweep_stub.py stand-in simulator.
+
+Every file has one sender/receiver/delay block per receiving station, as in the real
+multi-user runs, with randomised losses and delays.
+"""
+
+import numpy as np
+
+# Traffic per station (QuestionC: 5000 kbps of 1000 byte packets for 20 s)
+TX_PACKETS_PER_STATION = 12500
+
+# First timestamp of the synthetic runs (later runs count up from it)
+BASE_TIMESTAMP = 1763041112
+
+def write_synthetic_sca(path, run_id, measurement, users, rng, simulation_time_sec=None):
+    """
+    Write one synthetic multi-user .sca file.
+
+    Args:
+        path (str): Output path
+        run_id (str): Run id for the 'run' line
+        measurement (str): 'attr measurement' label
+        users (int): Receiving stations
+        rng (numpy.random.Generator): Random source for the traffic figures
+        simulation_time_sec (float): Written as the 'sim-time-limit' config entry (None to leave out)
+
+    Returns:
+        int: Number of scalar lines written
+    """
+    tx = TX_PACKETS_PER_STATION
+    rx = tx - rng.binomial(tx, rng.uniform(0, 0.02), size=users)
+    average = rng.uniform(5e4, 5e6, size=users)
+    minimum = (average * rng.uniform(0.05, 0.5, size=users)).astype(np.int64)
+    maximum = (average * rng.uniform(5, 50, size=users)).astype(np.int64)
+    total = (average * rx).astype(np.int64)
+
+    lines = [f"run {run_id}", 'attr experiment "wifi-example-sim"', f'attr measurement "{measurement}"']
+    if simulation_time_sec is not None:
+        lines.append(f"config sim-time-limit {simulation_time_sec:g}s")
+    lines += ['', f"scalar node[0] wifi-tx-frames {tx * users}"]
+    lines += [f"scalar node[{station}] wifi-rx-frames {rx[station - 1]}" for station in range(1, users + 1)]
+    for station in range(1, users + 1):
+        i = station - 1
+        lines += [
+            f"scalar node[0] sender-tx-packets {tx}",
+            f"scalar node[{station}] receiver-rx-packets {rx[i]}",
+            f"scalar . delay-count {rx[i]}",
+            f"scalar . delay-total {total[i]}",
+            f"scalar . delay-average {total[i] // max(rx[i], 1)}",
+            f"scalar . delay-max {maximum[i]}",
+            f"scalar . delay-min {minimum[i]}",
+        ]
+    with open(path, 'w') as file:
+        file.write('\n'.join(lines) + '\n')
+    return 1 + 8 * users
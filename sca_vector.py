@@ -0,0 +1,318 @@
+"""
+Network Performance EEN1058
+Author: Kyle Sheehy
+Date: October 2025
+
+Chunked reader for OMNeT++ vector results (.vec) files.
+
+A .vec file declares each vector once ("vector <id> <module> <name> [ETV|TV]") and then
+holds one data line per sample ("<id> [<event>] <time> <value>"). The file is read in
+blocks of a bounded size. The declarations seen so far decide which vector ids are
+wanted, the data lines of those ids are picked out of each block with one regex scan
+and parsed straight into NumPy arrays, so lines of other vectors are never converted
+and memory is bounded by the block size rather than the file size.
+
+The time-windowed aggregations consume the chunks as they are produced and only keep
+per-window accumulators (count, sum, min, max and an optional fixed-bin histogram for
+percentiles), so throughput-over-time and delay percentiles of multi-GB files are
+computed without loading the samples.
+"""
+
+import re
+
+import numpy as np
+
+from sca_parser import TOKEN
+
+DEFAULT_CHUNK_BYTES = 16 * 1024 * 1024  # 16 MB of file per block
+
+# Declaration of a vector - id, then module, name and column layout (quoted or not)
+VECTOR_DECLARATION = re.compile(rb'^vector[ \t]+(\d+)[ \t]+([^\r\n]*?)[ \t]*\r?$', re.MULTILINE)
+
+# Column layout used when a declaration does not give one
+DEFAULT_COLUMNS = 'ETV'
+
+def _unquote(token):
+    """
+    Strip the surrounding quotes (and escapes) from a declaration token.
+    """
+    if len(token) >= 2 and token[0] == '"' and token[-1] == '"':
+        return re.sub(r'\\(.)', r'\1', token[1:-1])
+    return token
+
+def _parse_declaration(vector_id, rest):
+    """
+    Turn the rest of a 'vector' line into a declaration dict.
+    """
+    tokens = [_unquote(token) for token in TOKEN.findall(rest.decode('utf-8'))]
+    if len(tokens) < 2:
+        return None
+    columns = tokens[2] if len(tokens) > 2 and set(tokens[2]) <= set('ETV') else DEFAULT_COLUMNS
+    return {'id': int(vector_id), 'module': tokens[0], 'name': tokens[1], 'columns': columns}
+
+def _matches(value, criterion):
+    """
+    Check a declaration field against a filter - None, a value, a collection or a predicate.
+    """
+    if criterion is None:
+        return True
+    if callable(criterion):
+        return bool(criterion(value))
+    if isinstance(criterion, (list, tuple, set, frozenset)):
+        return value in criterion
+    return value == criterion
+
+def block_declarations(block):
+    """
+    Parse the vector declarations contained in a block of a .vec file.
+
+    Args:
+        block (bytes): Whole lines of the file
+
+    Returns:
+        dict: Vector id -> {'id', 'module', 'name', 'columns'}
+    """
+    declarations = {}
+    for vector_id, rest in VECTOR_DECLARATION.findall(block):
+        declaration = _parse_declaration(vector_id, rest)
+        if declaration is not None:
+            declarations[declaration['id']] = declaration
+    return declarations
+
+def read_vector_declarations(filename):
+    """
+    Read only the vector declarations of a .vec file.
+
+    The file is scanned with one regex pass, data lines are never parsed.
+
+    Args:
+        filename (str): Path to the .vec file
+
+    Returns:
+        dict: Vector id -> {'id', 'module', 'name', 'columns'}
+    """
+    declarations = {}
+    with open(filename, 'rb') as file:
+        for _, block in iter_line_blocks(file, DEFAULT_CHUNK_BYTES):
+            declarations.update(block_declarations(block))
+    return declarations
+
+def select_vectors(declarations, modules=None, names=None):
+    """
+    Filter vector declarations by module and name.
+
+    Each filter may be a single value, a list/tuple/set of values or a predicate,
+    e.g. select_vectors(declarations, names='delay:vector', modules=lambda m: m != 'node[0]').
+
+    Args:
+        declarations (dict): Declarations from read_vector_declarations
+        modules: Module filter (None keeps every module)
+        names: Vector name filter (None keeps every name)
+
+    Returns:
+        dict: The matching declarations
+    """
+    return {vector_id: declaration for vector_id, declaration in declarations.items()
+            if _matches(declaration['module'], modules) and _matches(declaration['name'], names)}
+
+def iter_line_blocks(file, chunk_bytes):
+    """
+    Read a binary file in blocks that end on a line boundary.
+
+    Args:
+        file: File opened in binary mode, positioned at the start
+        chunk_bytes (int): Bytes read per block (a block holds at least one whole line)
+
+    Yields:
+        tuple: (byte offset of the block in the file, block bytes)
+    """
+    offset = 0
+    remainder = b''
+    while True:
+        data = file.read(chunk_bytes)
+        if not data:
+            break
+        data = remainder + data
+        cut = data.rfind(b'\n') + 1
+        if cut == 0:
+            remainder = data
+            continue
+        remainder = data[cut:]
+        yield offset, data[:cut]
+        offset += cut
+    if remainder:
+        yield offset, remainder
+
+def _data_lines(block, vector_ids):
+    """
+    Pick the data lines of the given vector ids out of a block with one regex scan.
+    """
+    ids = b'|'.join(str(vector_id).encode() for vector_id in sorted(vector_ids))
+    return re.findall(rb'^(?:' + ids + rb')[ \t][^\r\n]*', block, re.MULTILINE)
+
+def parse_rows(lines, column_count):
+    """
+    Parse whitespace separated numeric data lines into a (rows, columns) array.
+
+    Args:
+        lines (list): Data lines (bytes) sharing one column layout
+        column_count (int): Columns per line, including the vector id
+
+    Returns:
+        numpy.ndarray: Parsed rows (ragged lines are dropped)
+    """
+    values = np.array(b' '.join(lines).split(), dtype=np.float64)
+    if len(values) != len(lines) * column_count:
+        # Ragged lines - keep only the well-formed ones
+        rows = [line.split() for line in lines]
+        values = np.array([row for row in rows if len(row) == column_count], dtype=np.float64)
+    return values.reshape(-1, column_count)
+
+def block_samples(block, selected):
+    """
+    Parse the samples of the selected vectors out of one block.
+
+    Args:
+        block (bytes): Whole lines of the file
+        selected (dict): Declarations of the wanted vectors (id -> declaration)
+
+    Yields:
+        dict: 'vector', 'event', 'time' and 'value' arrays, one chunk per column layout
+    """
+    layouts = {}
+    for vector_id, declaration in selected.items():
+        layouts.setdefault(declaration['columns'], []).append(vector_id)
+
+    for columns, vector_ids in layouts.items():
+        lines = _data_lines(block, vector_ids)
+        if not lines:
+            continue
+        rows = parse_rows(lines, len(columns) + 1)
+        if len(rows) == 0:
+            continue
+        yield {
+            'vector': rows[:, 0].astype(np.int32),
+            'event': rows[:, 1 + columns.index('E')].astype(np.int64) if 'E' in columns
+                     else np.full(len(rows), -1, dtype=np.int64),
+            'time': rows[:, 1 + columns.index('T')],
+            'value': rows[:, 1 + columns.index('V')],
+        }
+
+def iter_vector_chunks(filename, modules=None, names=None, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """
+    Stream the samples of the selected vectors of a .vec file in bounded chunks.
+
+    Args:
+        filename (str): Path to the .vec file
+        modules: Module filter (see select_vectors)
+        names: Vector name filter (see select_vectors)
+        chunk_bytes (int): Bytes of file read per block
+
+    Yields:
+        dict: 'vector' (ids), 'event' (event numbers, -1 if not recorded), 'time'
+              (seconds) and 'value' arrays of the samples in one block
+    """
+    selected = {}
+    with open(filename, 'rb') as file:
+        for _, block in iter_line_blocks(file, chunk_bytes):
+            # Declarations come before the data of their vector, possibly mid-file
+            selected.update(select_vectors(block_declarations(block), modules, names))
+            if selected:
+                yield from block_samples(block, selected)
+
+def _grow(array, size, fill):
+    """
+    Extend a per-window accumulator to at least size entries.
+    """
+    if len(array) >= size:
+        return array
+    return np.concatenate([array, np.full((size - len(array),) + array.shape[1:], fill)])
+
+def aggregate_windows(chunks, window_sec, bin_edges=None):
+    """
+    Reduce streamed vector samples to per time window statistics.
+
+    Only the accumulators are kept, never the samples. With bin_edges a histogram of
+    the values per window is accumulated as well, for window_percentiles.
+
+    Args:
+        chunks (iterable): Chunks from iter_vector_chunks
+        window_sec (float): Window length in seconds (e.g. 0.1 for 100 ms)
+        bin_edges (numpy.ndarray): Increasing histogram bin edges for the values, or None
+
+    Returns:
+        dict: Per window 'start' (seconds), 'count', 'sum', 'min', 'max' (NaN for empty
+              windows) and, with bin_edges, 'histogram' (windows x bins) and 'bin_edges'
+    """
+    count = np.zeros(0)
+    total = np.zeros(0)
+    minimum = np.zeros(0)
+    maximum = np.zeros(0)
+    if bin_edges is not None:
+        bin_edges = np.asarray(bin_edges, dtype=float)
+        histogram = np.zeros((0, len(bin_edges) - 1))
+
+    for chunk in chunks:
+        if len(chunk['time']) == 0:
+            continue
+        window = np.floor(chunk['time'] / window_sec).astype(np.int64)
+        size = int(window.max()) + 1
+        count = _grow(count, size, 0.0)
+        total = _grow(total, size, 0.0)
+        minimum = _grow(minimum, size, np.inf)
+        maximum = _grow(maximum, size, -np.inf)
+
+        count += np.bincount(window, minlength=len(count))
+        total += np.bincount(window, weights=chunk['value'], minlength=len(total))
+        np.minimum.at(minimum, window, chunk['value'])
+        np.maximum.at(maximum, window, chunk['value'])
+
+        if bin_edges is not None:
+            histogram = _grow(histogram, size, 0.0)
+            bins = np.clip(np.searchsorted(bin_edges, chunk['value'], side='right') - 1, 0, len(bin_edges) - 2)
+            flat = np.bincount(window * (len(bin_edges) - 1) + bins, minlength=histogram.size)
+            histogram += flat.reshape(histogram.shape)
+
+    empty = count == 0
+    windows = {
+        'start': np.arange(len(count)) * window_sec,
+        'count': count.astype(np.int64),
+        'sum': total,
+        'min': np.where(empty, np.nan, minimum),
+        'max': np.where(empty, np.nan, maximum),
+    }
+    if bin_edges is not None:
+        windows['histogram'] = histogram
+        windows['bin_edges'] = bin_edges
+    return windows
+
+def window_percentiles(windows, percentiles):
+    """
+    Approximate per-window percentiles from the accumulated histograms.
+
+    The percentile is interpolated linearly inside the bin that contains it, so the
+    error is bounded by the bin width (use log-spaced edges for delays).
+
+    Args:
+        windows (dict): Result of aggregate_windows called with bin_edges
+        percentiles (list): Percentiles to compute (0-100)
+
+    Returns:
+        dict: Percentile -> array of values per window (NaN for empty windows)
+    """
+    histogram = windows['histogram']
+    edges = windows['bin_edges']
+    cumulative = np.cumsum(histogram, axis=1)
+    totals = cumulative[:, -1] if histogram.shape[1] else np.zeros(len(histogram))
+
+    result = {}
+    for q in percentiles:
+        target = totals * q / 100
+        bins = np.minimum((cumulative < target[:, None]).sum(axis=1), histogram.shape[1] - 1)
+        rows = np.arange(len(histogram))
+        below = np.where(bins > 0, cumulative[rows, np.maximum(bins - 1, 0)], 0)
+        inside = histogram[rows, bins]
+        fraction = np.divide(target - below, inside, out=np.zeros(len(histogram)), where=inside > 0)
+        values = edges[bins] + fraction * (edges[bins + 1] - edges[bins])
+        result[q] = np.where(totals > 0, values, np.nan)
+    return result
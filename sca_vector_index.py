@@ -0,0 +1,264 @@
+"""
+Network Performance EEN1058
+Author: Kyle Sheehy
+Date: October 2025
+
+Binary block index for random access into large OMNeT++ vector (.vec) files.
+
+The index is built in one pass over the file. The file is cut into line-aligned
+blocks of a fixed size, and for every vector with samples in a block the index records
+the block's byte range together with the sample count and the first/last sample time.
+It is stored as a binary sidecar next to the .vec file (run.vec -> run.vec.idx) and is
+rebuilt when the file's size or mtime no longer match.
+
+A query such as "delay of node[37] between t=5s and t=6s" then looks up the blocks
+whose time range for the selected vectors overlaps the window and parses only those,
+read straight out of a memory map of the file. Nothing else in the file is touched.
+"""
+
+import json
+import mmap
+import os
+import re
+import struct
+
+import numpy as np
+
+from sca_vector import block_declarations, block_samples, iter_line_blocks, parse_rows, select_vectors
+
+DEFAULT_INDEX_BLOCK_BYTES = 1024 * 1024  # 1 MB of file per indexed block
+
+INDEX_SUFFIX = '.idx'
+
+# Sidecar format - bumped when the layout changes, so older indexes are rebuilt
+INDEX_FORMAT = 1
+
+# Any data line (a line starting with a vector id)
+DATA_LINE = re.compile(rb'^\d+[ \t][^\r\n]*', re.MULTILINE)
+
+# Column arrays of the index in sidecar order, with their dtypes
+_BLOCK_ARRAYS = (('offset', np.int64), ('length', np.int64))
+_ENTRY_ARRAYS = (('vector', np.int32), ('block', np.int32), ('count', np.int64),
+                 ('start', np.float64), ('end', np.float64))
+
+def index_path(filename):
+    """
+    Path of the index sidecar of a .vec file.
+
+    Args:
+        filename (str): Path to the .vec file
+
+    Returns:
+        str: Path of the sidecar
+    """
+    return filename + INDEX_SUFFIX
+
+def _block_times(block, declarations):
+    """
+    Vector ids and sample times of every data line of a declared vector in a block.
+    """
+    layouts = {}
+    for vector_id, declaration in declarations.items():
+        layouts.setdefault(declaration['columns'], []).append(vector_id)
+
+    if len(layouts) == 1:
+        # One column layout (the usual case) - parse every data line in one go
+        (columns, vector_ids), = layouts.items()
+        rows = parse_rows(DATA_LINE.findall(block), len(columns) + 1)
+        rows = rows[np.isin(rows[:, 0], vector_ids)]
+        return rows[:, 0].astype(np.int32), rows[:, 1 + columns.index('T')]
+
+    samples = list(block_samples(block, declarations))
+    if not samples:
+        return np.zeros(0, dtype=np.int32), np.zeros(0)
+    return (np.concatenate([chunk['vector'] for chunk in samples]),
+            np.concatenate([chunk['time'] for chunk in samples]))
+
+def build_vector_index(filename, block_bytes=DEFAULT_INDEX_BLOCK_BYTES):
+    """
+    Index a .vec file by block.
+
+    Args:
+        filename (str): Path to the .vec file
+        block_bytes (int): Bytes of file per indexed block - smaller blocks make
+                           queries read less at the cost of a larger index
+
+    Returns:
+        dict: 'size' and 'mtime_ns' of the file, 'declarations' (id -> declaration),
+              'blocks' ('offset', 'length' arrays) and 'entries' ('vector', 'block',
+              'count', 'start', 'end' arrays, one entry per vector per block)
+    """
+    stat = os.stat(filename)
+    declarations = {}
+    offsets, lengths = [], []
+    entries = {name: [] for name, _ in _ENTRY_ARRAYS}
+
+    with open(filename, 'rb') as file:
+        for offset, block in iter_line_blocks(file, block_bytes):
+            declarations.update(block_declarations(block))
+            if not declarations:
+                continue
+            vector, time = _block_times(block, declarations)
+            if len(vector) == 0:
+                continue
+
+            ids, slot = np.unique(vector, return_inverse=True)
+            start = np.full(len(ids), np.inf)
+            end = np.full(len(ids), -np.inf)
+            np.minimum.at(start, slot, time)
+            np.maximum.at(end, slot, time)
+
+            entries['vector'].append(ids)
+            entries['block'].append(np.full(len(ids), len(offsets)))
+            entries['count'].append(np.bincount(slot, minlength=len(ids)))
+            entries['start'].append(start)
+            entries['end'].append(end)
+            offsets.append(offset)
+            lengths.append(len(block))
+
+    return {
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'declarations': declarations,
+        'blocks': {'offset': np.array(offsets, dtype=np.int64), 'length': np.array(lengths, dtype=np.int64)},
+        'entries': {name: np.concatenate(entries[name]).astype(dtype) if entries[name] else np.zeros(0, dtype=dtype)
+                    for name, dtype in _ENTRY_ARRAYS},
+    }
+
+def save_vector_index(path, index):
+    """
+    Write an index sidecar atomically.
+
+    Layout: 4 byte header length, JSON header (format, file size and mtime,
+    declarations, array lengths), then the raw bytes of the block and entry arrays.
+
+    Args:
+        path (str): Path of the sidecar
+        index (dict): Index from build_vector_index
+    """
+    header = json.dumps({
+        'format': INDEX_FORMAT,
+        'size': index['size'],
+        'mtime_ns': index['mtime_ns'],
+        'declarations': list(index['declarations'].values()),
+        'blocks': len(index['blocks']['offset']),
+        'entries': len(index['entries']['vector']),
+    }).encode('utf-8')
+
+    temporary_path = path + '.tmp'
+    with open(temporary_path, 'wb') as file:
+        file.write(struct.pack('<I', len(header)) + header)
+        for arrays, layout in ((index['blocks'], _BLOCK_ARRAYS), (index['entries'], _ENTRY_ARRAYS)):
+            for name, dtype in layout:
+                file.write(np.ascontiguousarray(arrays[name], dtype=dtype).tobytes())
+    os.replace(temporary_path, path)
+
+def load_vector_index(path):
+    """
+    Read an index sidecar.
+
+    Args:
+        path (str): Path of the sidecar
+
+    Returns:
+        dict: Index in the build_vector_index format, or None if the sidecar is
+              missing, unreadable or in an older format
+    """
+    try:
+        with open(path, 'rb') as file:
+            payload = file.read()
+        (header_size,) = struct.unpack_from('<I', payload)
+        header = json.loads(payload[4:4 + header_size].decode('utf-8'))
+        if header.get('format') != INDEX_FORMAT:
+            return None
+
+        index = {
+            'size': header['size'],
+            'mtime_ns': header['mtime_ns'],
+            'declarations': {declaration['id']: declaration for declaration in header['declarations']},
+        }
+        offset = 4 + header_size
+        for key, layout, count in (('blocks', _BLOCK_ARRAYS, header['blocks']),
+                                   ('entries', _ENTRY_ARRAYS, header['entries'])):
+            index[key] = {}
+            for name, dtype in layout:
+                index[key][name] = np.frombuffer(payload, dtype=dtype, count=count, offset=offset)
+                offset += count * np.dtype(dtype).itemsize
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, struct.error) as e:
+        # Truncated or corrupt sidecar - it is rebuilt
+        print(f"Warning: Ignoring unreadable vector index '{path}': {e}")
+        return None
+    return index
+
+def vector_index(filename, block_bytes=DEFAULT_INDEX_BLOCK_BYTES):
+    """
+    Load the index of a .vec file, building and saving it first if it is missing or stale.
+
+    The sidecar is matched on the file's size and mtime only - vector files are too
+    large to hash on every query.
+
+    Args:
+        filename (str): Path to the .vec file
+        block_bytes (int): Bytes per indexed block when the index is (re)built
+
+    Returns:
+        dict: Index in the build_vector_index format
+    """
+    path = index_path(filename)
+    stat = os.stat(filename)
+    index = load_vector_index(path)
+    if index is not None and index['size'] == stat.st_size and index['mtime_ns'] == stat.st_mtime_ns:
+        return index
+
+    index = build_vector_index(filename, block_bytes)
+    try:
+        save_vector_index(path, index)
+    except OSError as e:
+        print(f"Warning: Could not save vector index '{path}': {e}")
+    return index
+
+def iter_indexed_chunks(filename, modules=None, names=None, start=None, end=None, index=None):
+    """
+    Stream the samples of the selected vectors within a time range, reading only the
+    blocks the index says hold them.
+
+    Args:
+        filename (str): Path to the .vec file
+        modules: Module filter (see sca_vector.select_vectors)
+        names: Vector name filter (see sca_vector.select_vectors)
+        start (float): First sample time in seconds (None for the start of the run)
+        end (float): Last sample time in seconds (None for the end of the run)
+        index (dict): Index of the file (loaded or built with vector_index if None)
+
+    Yields:
+        dict: Chunks in the sca_vector.iter_vector_chunks format, limited to start <= time <= end
+    """
+    if index is None:
+        index = vector_index(filename)
+    selected = select_vectors(index['declarations'], modules, names)
+    if not selected:
+        return
+
+    entries = index['entries']
+    start = -np.inf if start is None else start
+    end = np.inf if end is None else end
+    wanted = np.isin(entries['vector'], list(selected)) & (entries['end'] >= start) & (entries['start'] <= end)
+    if not wanted.any():
+        return
+
+    # Entries are stored in block order, so the wanted ones split into runs per block
+    wanted = np.flatnonzero(wanted)
+    wanted_blocks, first = np.unique(entries['block'][wanted], return_index=True)
+    blocks = index['blocks']
+    with open(filename, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        for block, vector_ids in zip(wanted_blocks.tolist(), np.split(entries['vector'][wanted], first[1:])):
+            offset = int(blocks['offset'][block])
+            data = mapped[offset:offset + int(blocks['length'][block])]
+            for chunk in block_samples(data, {vector_id: selected[vector_id] for vector_id in vector_ids.tolist()}):
+                keep = (chunk['time'] >= start) & (chunk['time'] <= end)
+                if keep.all():
+                    yield chunk
+                elif keep.any():
+                    yield {name: values[keep] for name, values in chunk.items()}
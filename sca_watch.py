@@ -0,0 +1,95 @@
+"""
+Network Performance EEN1058
+Author: Kyle Sheehy
+Date: October 2025
+
+Watching result directories for .sca files finished by simulations that are still running.
+
+The directories are polled with os.scandir (no extra dependencies, and it works on network
+drives where inotify does not). A file counts as complete once its size and mtime are
+unchanged since the previous poll and it has not been written to for settle_sec. The
+simulator writes each .sca file in one go when its run ends, so a file being written
+is never picked up half-way. Writers that rename finished files into place (such as
+sweep.py) only need a short settle time. A completed file that is later rewritten is
+reported again once it has settled, and deleted files are reported as removed.
+"""
+
+import os
+import time
+
+from sca_discovery import iter_sca_paths
+
+DEFAULT_POLL_INTERVAL_SEC = 10.0
+DEFAULT_SETTLE_SEC = 5.0
+
+def scan_sca_files(directories, recursive=False):
+    """
+    Size and mtime of every .sca file in the directories.
+
+    Args:
+        directories (list): Directories to scan (missing ones are skipped)
+        recursive (bool): Also scan subdirectories
+
+    Returns:
+        dict: Path -> (size, mtime_ns)
+    """
+    files = {}
+    for directory in directories:
+        if not os.path.isdir(directory):
+            continue
+        for path in iter_sca_paths(directory, recursive):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue  # Removed (or renamed) since the listing
+            files[path] = (stat.st_size, stat.st_mtime_ns)
+    return files
+
+def iter_completed_files(directories, interval_sec=DEFAULT_POLL_INTERVAL_SEC, settle_sec=DEFAULT_SETTLE_SEC,
+                         recursive=False, polls=None):
+    """
+    Poll directories and yield the .sca files that have completed since the last poll.
+
+    The first poll reports every file that is already complete, so the caller starts
+    from the current state of the directories.
+
+    Args:
+        directories (list): Directories to watch
+        interval_sec (float): Seconds between polls
+        settle_sec (float): Seconds a file must go unmodified before it counts as complete
+        recursive (bool): Also watch subdirectories
+        polls (int): Stop after this many polls (None to watch until interrupted)
+
+    Yields:
+        tuple: (completed, removed) lists of paths, whenever either is non-empty.
+               Completed files include rewritten files that have settled again
+    """
+    if isinstance(directories, str):
+        directories = [directories]
+
+    previous = None  # Stat of every file at the previous poll
+    reported = {}    # Stat of every file when it was last reported complete
+    poll = 0
+    while polls is None or poll < polls:
+        if poll:
+            time.sleep(interval_sec)
+        poll += 1
+
+        files = scan_sca_files(directories, recursive)
+        now_ns = time.time_ns()
+        completed = []
+        for path, stat in files.items():
+            if reported.get(path) == stat:
+                continue
+            unchanged = previous is None or previous.get(path) == stat
+            if unchanged and now_ns - stat[1] >= settle_sec * 1e9:
+                completed.append(path)
+                reported[path] = stat
+
+        removed = sorted(path for path in reported if path not in files)
+        for path in removed:
+            del reported[path]
+        previous = files
+
+        if completed or removed:
+            yield sorted(completed), removed
@@ -0,0 +1,326 @@
+"""
+Network Performance EEN1058
+Author: Kyle Sheehy
+Date: October 2025
+
+Sweep runner - runs the simulator over a parameter grid and analyses each run as it lands.
+
+The grid (distance, users, bit rate, WiFi standard, TX power and replication) is expanded
+into one job per point. Every job runs the simulator command in its own scratch directory,
+with at most SIMULATION_WORKERS simulator processes at a time. When a job exits cleanly,
+its .sca outputs are moved into OUTPUT_DIRECTORY, with the job's bit rate, TX power and
+replication appended to the file name so that runs differing only in those stay
+distinct. Each output is then parsed and its metrics are written to RESULTS_STREAM
+straight away, while the remaining simulations keep running, so the analysis overlaps
+the sweep instead of waiting for it.
+
+SIMULATOR_COMMAND defaults to sweep_stub.py, which writes synthetic results, so the runner
+can be tried without ns-3. For real sweeps point it at the simulator, e.g.
+
+    ['/home/user/ns-3/ns3', 'run', 'wifi-example-sim --distance={distance_m} --users={users} '
+     '--bitRate={bitrate_kbps} --standard={standard} --txPower={tx_power_dbm} --run={run}']
+
+Usage:
+    python sweep.py
+    python sweep.py --workers 8 --dry-run
+"""
+
+import argparse
+import itertools
+import os
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pandas as pd
+
+from sca_output import stream_rows, write_results
+from sca_store import iter_run_metrics
+
+# Configuration - Parameter grid, one simulator job per combination and replication
+PARAMETER_GRID = {
+    'distance_m': [0, 30, 60, 90, 120, 150],
+    'users': [1, 10, 20, 50],
+    'bitrate_kbps': [5000],
+    'standard': ['WiFi6_80211ax', 'WiFi7_80211be'],
+    'tx_power_dbm': [40],
+}
+REPLICATIONS = 1
+
+# Simulator command - every element is formatted with the job's parameters, its 'run'
+# id, 'seed' and 'simulation_time_sec'. It runs in the job's scratch directory, so use
+# absolute paths for anything outside it
+SIMULATOR_COMMAND = [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sweep_stub.py'),
+                     '--distance={distance_m}', '--users={users}', '--bitRate={bitrate_kbps}',
+                     '--standard={standard}', '--txPower={tx_power_dbm}', '--run={run}',
+                     '--seed={seed}', '--simTime={simulation_time_sec}']
+
+SIMULATION_TIME_SEC = 20.0
+
+# Number of simulator processes run at once
+SIMULATION_WORKERS = 4
+
+# Jobs still running after this many seconds are killed and reported as failed (None to wait)
+JOB_TIMEOUT_SEC = None
+
+# Where finished .sca files are collected, and where the jobs run
+OUTPUT_DIRECTORY = "Sweep"
+SCRATCH_DIRECTORY = os.path.join(OUTPUT_DIRECTORY, ".jobs")
+
+# Per-run metrics are written here as each job's output is analysed (None to disable)
+RESULTS_STREAM = "Sweep-runs.csv"
+
+# Table of all runs, written when the sweep finishes - a '.parquet' name writes Parquet
+RESULTS_FILE = "Sweep-Analysis.csv"
+
+def expand_grid(grid, replications=1, first_seed=1):
+    """
+    Expand a parameter grid into simulator jobs.
+
+    Args:
+        grid (dict): Parameter name -> list of values
+        replications (int): Jobs per grid point, each with its own seed
+        first_seed (int): Seed of the first replication
+
+    Returns:
+        list: Job dicts holding the parameters, 'replication', 'seed', 'run' (an id
+              unique within the sweep) and 'name' (used for its scratch directory
+              and output file names)
+    """
+    names = list(grid)
+    jobs = []
+    for values in itertools.product(*(grid[name] for name in names)):
+        for replication in range(replications):
+            job = dict(zip(names, values))
+            job['replication'] = replication
+            job['seed'] = first_seed + replication
+            job['run'] = len(jobs) + 1
+            job['name'] = '-'.join(f"{name}{value}" for name, value in zip(names, values)) + f"-r{replication}"
+            jobs.append(job)
+    return jobs
+
+def job_command(template, job, simulation_time_sec):
+    """
+    Simulator command line of one job.
+
+    Args:
+        template (list): Command elements with {parameter} placeholders
+        job (dict): Job from expand_grid
+        simulation_time_sec (float): Simulated duration
+
+    Returns:
+        list: Command elements
+    """
+    return [part.format(simulation_time_sec=simulation_time_sec, **job) for part in template]
+
+def output_name(filename, job):
+    """
+    Name a job's output is collected under.
+
+    The simulator names its files by distance, users and standard only, so the job's
+    bit rate, TX power and replication are appended. The bit rate token is one
+    sca_discovery reads back.
+
+    Args:
+        filename (str): File name written by the simulator
+        job (dict): Job from expand_grid
+
+    Returns:
+        str: File name in the output directory
+    """
+    stem = filename[:-len('.sca')] if filename.endswith('.sca') else filename
+    extra = [f"{job['bitrate_kbps']}kbps" if 'bitrate_kbps' in job else None,
+             f"{job['tx_power_dbm']}dBm" if 'tx_power_dbm' in job else None,
+             f"r{job['replication']}"]
+    return '-'.join([stem] + [token for token in extra if token]) + '.sca'
+
+def run_job(job, command, output_directory, scratch_directory, timeout=None):
+    """
+    Run one simulator job and collect its .sca outputs.
+
+    The job runs in its own scratch directory, and its outputs are moved into the
+    output directory only once the simulator has exited, so a file there is always
+    complete. The scratch directory is removed on success and kept (with the
+    simulator's output in job.log) on failure.
+
+    Args:
+        job (dict): Job from expand_grid
+        command (list): Command line from job_command
+        output_directory (str): Directory the finished .sca files are moved to
+        scratch_directory (str): Parent of the per-job working directories
+        timeout (float): Seconds before the simulator is killed (None to wait)
+
+    Returns:
+        dict: 'job', 'outputs' (paths in the output directory), 'duration_sec' and
+              'error' (None on success)
+    """
+    directory = os.path.join(scratch_directory, job['name'])
+    shutil.rmtree(directory, ignore_errors=True)
+    os.makedirs(directory)
+
+    started = time.perf_counter()
+    error = None
+    try:
+        completed = subprocess.run(command, cwd=directory, capture_output=True, text=True, timeout=timeout)
+        log = completed.stdout + completed.stderr
+        if completed.returncode != 0:
+            error = f"exit status {completed.returncode}"
+    except subprocess.TimeoutExpired as e:
+        log = ''.join(output.decode(errors='replace') if isinstance(output, bytes) else output
+                      for output in (e.stdout, e.stderr) if output)
+        error = f"timed out after {timeout} s"
+    except OSError as e:
+        log = ''
+        error = str(e)
+    duration = time.perf_counter() - started
+
+    outputs = []
+    if error is None:
+        names = sorted(name for name in os.listdir(directory) if name.endswith('.sca'))
+        if not names:
+            error = "no .sca output"
+        for name in names:
+            path = os.path.join(output_directory, output_name(name, job))
+            os.replace(os.path.join(directory, name), path)
+            outputs.append(path)
+
+    if error is None:
+        shutil.rmtree(directory, ignore_errors=True)
+    else:
+        with open(os.path.join(directory, 'job.log'), 'w') as file:
+            file.write(' '.join(command) + '\n\n' + log)
+    return {'job': job, 'outputs': outputs, 'duration_sec': duration, 'error': error}
+
+def iter_sweep(jobs, command_template, simulation_time_sec, output_directory=OUTPUT_DIRECTORY,
+               scratch_directory=SCRATCH_DIRECTORY, workers=SIMULATION_WORKERS, timeout=JOB_TIMEOUT_SEC):
+    """
+    Run jobs through a bounded pool of simulator processes, yielding each as it finishes.
+
+    Args:
+        jobs (list): Jobs from expand_grid
+        command_template (list): Simulator command with {parameter} placeholders
+        simulation_time_sec (float): Simulated duration
+        output_directory (str): Directory the finished .sca files are moved to
+        scratch_directory (str): Parent of the per-job working directories
+        workers (int): Simulator processes run at once
+        timeout (float): Seconds before a simulator is killed (None to wait)
+
+    Yields:
+        dict: run_job result of every job, in completion order
+    """
+    os.makedirs(output_directory, exist_ok=True)
+    os.makedirs(scratch_directory, exist_ok=True)
+
+    # Threads only wait on the simulator processes, so the pool bounds those
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = [executor.submit(run_job, job, job_command(command_template, job, simulation_time_sec),
+                                   output_directory, scratch_directory, timeout)
+                   for job in jobs]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        # Stopping early (e.g. Ctrl+C) drops the jobs that have not started yet
+        executor.shutdown(wait=True, cancel_futures=True)
+
+def iter_sweep_outputs(results, jobs_by_output, total, scratch_directory=SCRATCH_DIRECTORY):
+    """
+    Report finished jobs and pass their outputs on to the analysis.
+
+    Args:
+        results (iterable): run_job results, e.g. from iter_sweep
+        jobs_by_output (dict): Filled with output path -> job as outputs are yielded
+        total (int): Number of jobs in the sweep, for the progress messages
+        scratch_directory (str): Scratch directory the jobs ran in, where failed jobs keep their log
+
+    Yields:
+        str: Path of every .sca output, as soon as its job has finished
+    """
+    for finished, result in enumerate(results, start=1):
+        job = result['job']
+        if result['error'] is not None:
+            print(f"  [{finished}/{total}] {job['name']} FAILED ({result['error']}) - "
+                  f"see {os.path.join(scratch_directory, job['name'], 'job.log')}")
+            continue
+        print(f"  [{finished}/{total}] {job['name']} simulated in {result['duration_sec']:.1f} s")
+        for path in result['outputs']:
+            jobs_by_output[path] = job
+            yield path
+
+def run_sweep(jobs, workers=SIMULATION_WORKERS):
+    """
+    Simulate every job and analyse each output as it lands.
+
+    Args:
+        jobs (list): Jobs from expand_grid
+        workers (int): Simulator processes run at once
+
+    Returns:
+        pandas.DataFrame: One row of job parameters and metrics per run
+    """
+    jobs_by_output = {}
+    outputs = iter_sweep_outputs(iter_sweep(jobs, SIMULATOR_COMMAND, SIMULATION_TIME_SEC,
+                                            scratch_directory=SCRATCH_DIRECTORY, workers=workers),
+                                 jobs_by_output, len(jobs), SCRATCH_DIRECTORY)
+
+    # Every output is new, so it is parsed without the parse cache (which looks files up
+    # a window at a time) and in batches of one run, so each row is written as soon as
+    # its job is done
+    metrics = iter_run_metrics(outputs, SIMULATION_TIME_SEC, batch_runs=1, stations=True)
+    rows = []
+    for row in stream_rows(_with_job_parameters(metrics, jobs_by_output), RESULTS_STREAM):
+        print(f"    Throughput: {row['avg_throughput_kbps']:.1f} Kbps, "
+              f"Delay: {row['avg_delay_ms']:.2f} ms, "
+              f"PLR: {row['packet_loss_ratio']:.4f}")
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+def _with_job_parameters(rows, jobs_by_output):
+    """
+    Put the parameters of the job that produced each run in front of its metrics.
+    """
+    for row in rows:
+        job = jobs_by_output[row['file']]
+        merged = {name: value for name, value in job.items() if name != 'name'}
+        merged.update(row)
+        yield merged
+
+def main():
+    """
+    Run the sweep described by the configuration.
+    """
+    parser = argparse.ArgumentParser(description="Run a simulator sweep and analyse the runs as they finish")
+    parser.add_argument('--workers', type=int, default=SIMULATION_WORKERS, help="simulator processes run at once")
+    parser.add_argument('--replications', type=int, default=REPLICATIONS, help="runs (seeds) per grid point")
+    parser.add_argument('--dry-run', action='store_true', help="print the simulator commands without running them")
+    args = parser.parse_args()
+
+    jobs = expand_grid(PARAMETER_GRID, args.replications)
+    if args.dry_run:
+        for job in jobs:
+            print(' '.join(job_command(SIMULATOR_COMMAND, job, SIMULATION_TIME_SEC)))
+        return
+
+    print(f"Running {len(jobs)} simulator jobs, {args.workers} at a time")
+    print("=" * 70)
+    started = time.perf_counter()
+    df = run_sweep(jobs, args.workers)
+    elapsed = time.perf_counter() - started
+
+    succeeded = df['run'].nunique() if not df.empty else 0
+    print(f"\nSweep finished in {elapsed:.1f} s: {len(df)} runs analysed, {len(jobs) - succeeded} jobs failed")
+    if df.empty:
+        print("No valid results obtained. Exiting...")
+        return
+
+    write_results(df, RESULTS_FILE)
+    print("\nGenerated files:")
+    print(f"- {OUTPUT_DIRECTORY}/*.sca")
+    if RESULTS_STREAM:
+        print(f"- {RESULTS_STREAM}")
+    print(f"- {RESULTS_FILE}")
+
+if __name__ == "__main__":
+    main()
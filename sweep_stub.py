@@ -0,0 +1,52 @@
+"""
+Network Performance EEN1058
+Author: Kyle Sheehy
+Date: October 2025
+
+Stand-in for the ns-3 wifi-example-sim, for trying out sweep.py without ns-3.
+
+Takes the same command line parameters the sweep passes to the simulator, waits for a
+while as a simulation would, and writes one synthetic .sca file into the working
+directory under the simulator's file naming convention, with --simTime recorded as its
+sim-time-limit. The traffic figures come from sca_synthetic.write_synthetic_sca, seeded
+from the run id and seed.
+
+Usage:
+    python sweep_stub.py --distance 30 --users 10 --standard WiFi6_80211ax --run 1 --seed 1
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from sca_synthetic import BASE_TIMESTAMP, write_synthetic_sca
+
+# Wall time of a stub run, as a base plus an amount per user
+STUB_SECONDS = 0.5
+STUB_SECONDS_PER_USER = 0.01
+
+def main():
+    """
+    Pretend to simulate one run and write its .sca file.
+    """
+    parser = argparse.ArgumentParser(description="Stub simulator writing synthetic .sca results")
+    parser.add_argument('--distance', type=int, default=0, help="distance in metres")
+    parser.add_argument('--users', type=int, default=1, help="receiving stations")
+    parser.add_argument('--bitRate', type=int, default=5000, help="target bit rate in Kbps")
+    parser.add_argument('--standard', default='WiFi6_80211ax', help="WiFi type and standard")
+    parser.add_argument('--txPower', type=float, default=40.0, help="TX power in dBm")
+    parser.add_argument('--run', type=int, default=1, help="run number")
+    parser.add_argument('--seed', type=int, default=1, help="random seed")
+    parser.add_argument('--simTime', type=float, default=20.0, help="simulated time in seconds")
+    args = parser.parse_args()
+
+    time.sleep(STUB_SECONDS + STUB_SECONDS_PER_USER * args.users)
+
+    timestamp = BASE_TIMESTAMP + args.run
+    write_synthetic_sca(f"DataOfUser1-run-{timestamp}-{args.distance}m-{args.users}users-{args.standard}.sca",
+                        f"run-{timestamp}", f"dist{args.distance}_users{args.users}_{args.standard}",
+                        args.users, np.random.default_rng([args.run, args.seed]), args.simTime)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Network Performance EEN1058
+Author: Kyle Sheehy
+Date: October 2025
+
+Tests of the QuestionB distance analysis.
+"""
+
+import QuestionB
+
+SCA_WITH_DURATION = """run run-1
+attr measurement "dist100"
+config sim-time-limit 40s
+
+scalar node[0] sender-tx-packets 1000
+scalar node[1] receiver-rx-packets 1000
+scalar . delay-count 1000
+scalar . delay-total 1000000000
+"""
+
+def test_recorded_duration_is_used_without_override(tmp_path, monkeypatch):
+    (tmp_path / "DataOfUser1--50000kbps-100m-.sca").write_text(SCA_WITH_DURATION)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(QuestionB, 'ANALYSIS_DIRECTORY', str(tmp_path))
+    monkeypatch.setattr(QuestionB, 'PARSE_CACHE', None)
+    monkeypatch.setattr(QuestionB, 'DURATION_OVERRIDES', [])
+
+    files, durations = QuestionB.discover_files()
+    assert durations == {}
+    assert QuestionB.effective_durations(files, durations) == {'100m': 40.0}
+
+    row = QuestionB.process_all_files(files, durations).iloc[0]
+    assert row['simulation_time_sec'] == 40.0
+    # 1000 packets of the default 1000 bytes over 40 s
+    assert row['avg_throughput_kbps'] == 1000 * 1000 * 8 / 40.0 / 1000
+
+def test_override_wins_over_recorded_duration(tmp_path, monkeypatch):
+    (tmp_path / "DataOfUser1--50000kbps-100m-.sca").write_text(SCA_WITH_DURATION)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(QuestionB, 'ANALYSIS_DIRECTORY', str(tmp_path))
+    monkeypatch.setattr(QuestionB, 'PARSE_CACHE', None)
+    monkeypatch.setattr(QuestionB, 'DURATION_OVERRIDES', [({'distance_m': 100}, 10.0)])
+
+    files, durations = QuestionB.discover_files()
+    assert QuestionB.effective_durations(files, durations) == {'100m': 10.0}
+    assert QuestionB.process_all_files(files, durations).iloc[0]['simulation_time_sec'] == 10.0
@@ -0,0 +1,22 @@
+"""
+Network Performance EEN1058
+Author: Kyle Sheehy
+Date: October 2025
+
+Tests of the sweep runner with the stub simulator.
+"""
+
+import sweep
+from sca_parser import header_duration, read_sca_header
+
+def test_stub_records_requested_sim_time(tmp_path):
+    jobs = sweep.expand_grid({'distance_m': [30], 'users': [2], 'bitrate_kbps': [5000],
+                              'standard': ['WiFi6_80211ax'], 'tx_power_dbm': [40]})
+    results = list(sweep.iter_sweep(jobs, sweep.SIMULATOR_COMMAND, 12.5, str(tmp_path / "out"),
+                                    str(tmp_path / "scratch"), workers=1))
+
+    assert [result['error'] for result in results] == [None]
+    [output] = results[0]['outputs']
+    header = read_sca_header(output)
+    assert header['config']['sim-time-limit'] == '12.5s'
+    assert header_duration(header) == 12.5